@@ -0,0 +1,432 @@
+"""
+AML News Analysis Command Line Interface
+
+Command line entry point for running the AML News Analysis pipeline without
+the Streamlit UI (e.g. from a scheduler or a terminal session).
+
+Commands:
+    scrape          Run a full scrape session (optionally with profiling)
+    stats           Print statistics about the stored articles
+    recategorize    Re-run categorization over all stored articles
+    reindex         Rebuild indexes, cases and risk scores from the stored articles
+    cases           List case clusters, or the timeline of one case
+    risk            Show the entities with the highest risk score
+    entity          List stored articles mentioning a bank, agency or person
+    search          Full-text search over titles and article texts
+    screen          Screen all stored articles against the watchlist
+    bulk-recategorize
+                    Recategorize the store in parallel, streaming in chunks
+    train-classifier
+                    Train the linear classifier backend from the stored categories
+    migrate-sqlite  Move the article store from articles.csv to SQLite (articles.db)
+    migrate-parquet Move the article store to month-partitioned Parquet (needs pyarrow)
+    export          Write all stored articles to CSV
+    compact         Archive session CSVs and logs by month, expire old logs
+
+Usage:
+    python cli.py scrape [--profile] [--log-format text|json]
+    python cli.py stats [--output-dir output]
+    python cli.py recategorize [--output-dir output] [--backend keywords|linear|transformer]
+    python cli.py recategorize --backend transformer --model-dir MODEL [--threads 4] [--quantize|--onnx]
+    python cli.py reindex [--output-dir output]
+    python cli.py entity "Bank BRI" [--output-dir output]
+    python cli.py search '"kredit fiktif" BRI' [--limit 20] [--source detik.com]
+    python cli.py cases [--case CASE_ID]
+    python cli.py risk [--limit 20] [--type person]
+    python cli.py screen [--watchlist output/watchlist.csv]
+    python cli.py bulk-recategorize [--workers N] [--chunk-size 2000] [--backend ...]
+    python cli.py train-classifier [--method logreg|nb] [--output-dir output]
+    python cli.py migrate-sqlite [--output-dir output]
+    python cli.py migrate-parquet [--output-dir output]
+    python cli.py export [--output FILE]
+    python cli.py compact [--log-retention-days 30] [--min-age-hours 1]
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import argparse
+import os
+import sys
+
+
+def cmd_scrape(args):
+    """Run a scrape session and print a short summary"""
+    from modules.scraper import NewsScraper
+
+    scraper = NewsScraper(profile=args.profile, log_format=args.log_format)
+    articles = scraper.scrape_articles()
+    print(f"🏁 Scrape finished: {len(articles)} relevant articles found")
+    return 0
+
+
+def cmd_stats(args):
+    """Print article statistics"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, session_log=False)
+    stats = data_manager.get_statistics()
+    print(f"📊 Total articles: {stats['total_articles']}")
+    print(f"📰 Sources: {stats['sources']}")
+    print(f"🏷️  Categories: {stats['categories']}")
+    print(f"📅 Date range: {stats['date_range']}")
+    return 0
+
+
+def _model_dir(args):
+    """Directory of the linear classifier model"""
+    return args.model_dir or os.path.join(args.output_dir, "classifier")
+
+
+def _categorizer(args):
+    """NewsCategorizor for the backend selected on the command line"""
+    from modules.categorizer import NewsCategorizor
+
+    backend_options = {}
+    if args.backend == "transformer":
+        backend_options = {"num_threads": args.threads, "quantize": args.quantize, "onnx": args.onnx}
+    return NewsCategorizor(
+        backend=args.backend,
+        model_path=_model_dir(args),
+        backend_options=backend_options,
+        matching=args.matching
+    )
+
+
+def cmd_recategorize(args):
+    """Recategorize the stored corpus with the selected categorizer backend"""
+    import time
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, categorizer=_categorizer(args))
+    start = time.perf_counter()
+    changed = data_manager.recategorize_articles()
+    print(f"🏷️  {changed} categories changed in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+def _print_progress(progress):
+    """Single-line progress report for long running jobs"""
+    eta = f"{progress['eta']:.0f}s" if progress['eta'] is not None else "?"
+    print(
+        f"\r⏳ {progress['done']}/{progress['total']} articles | "
+        f"{progress['rate']:.0f} articles/s | {progress['changed']} changed | ETA {eta}   ",
+        end="",
+        flush=True
+    )
+
+
+def cmd_bulk_recategorize(args):
+    """Recategorize the whole store in parallel, streaming it in chunks"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, categorizer=_categorizer(args))
+    result = data_manager.bulk_recategorize(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        progress=_print_progress
+    )
+    print()
+    if result is None:
+        return 1
+    print(f"🏷️  {result['changed']} of {result['rows']} categories changed in {result['elapsed']:.1f}s")
+    return 0
+
+
+def cmd_reindex(args):
+    """Rebuild the keyword, search and entity indexes, cases and risk scores"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir)
+    df = data_manager.load_articles()
+    indexed = data_manager.rebuild_keyword_index(df)
+    data_manager.rebuild_search_index(df)
+    data_manager.rebuild_entity_index(df)
+    data_manager.rebuild_cases(df)
+    data_manager.rebuild_risk_scores(df)
+    print(f"🗂️  {indexed} articles indexed")
+    return 0
+
+
+def cmd_entity(args):
+    """Print the stored articles mentioning an entity"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, session_log=False)
+    df = data_manager.articles_mentioning(args.name)
+    print(f"🏛️  {len(df)} articles mention {args.name}")
+    for row in df.head(args.limit).itertuples(index=False):
+        print(f"   [{row.mentions}x] {row.publication_date} | {row.title} | {row.url}")
+    return 0
+
+
+def cmd_search(args):
+    """Print the best full-text matches of a query with snippets"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, session_log=False)
+    results = data_manager.search_articles(args.query, limit=args.limit, source=args.source)
+    print(f"🔎 {len(results)} articles match {args.query}")
+    for row in results.itertuples(index=False):
+        print(f"   {row.publication_date} | {row.title} | {row.url}")
+        print(f"      {row.snippet}")
+    return 0
+
+
+def cmd_train_classifier(args):
+    """Train the linear classifier from the labelled stored articles"""
+    import time
+    from modules.linear_classifier import train_from_csv
+
+    from modules.data_manager import DataManager
+
+    # Training reads the CSV; refresh it first when the store is SQLite
+    data_manager = DataManager(args.output_dir)
+    if data_manager.storage != "csv":
+        data_manager.export_csv()
+
+    start = time.perf_counter()
+    report = train_from_csv(
+        data_manager.csv_file,
+        _model_dir(args),
+        method=args.method,
+        n_features=2 ** args.hash_bits
+    )
+    if report is None:
+        print("❌ No labelled articles to train on")
+        return 1
+    print(f"🧠 Trained {args.method} model on {report['articles']} articles "
+          f"in {time.perf_counter() - start:.1f}s -> {report['model_dir']}")
+    if report['validation_accuracy'] is not None:
+        print(f"🎯 Validation accuracy: {report['validation_accuracy']:.1%}")
+    return 0
+
+
+def cmd_migrate(args):
+    """Copy the article store into the SQLite or Parquet store"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir)
+    if data_manager.storage == args.storage:
+        print(f"🗄️  Already using {args.storage.upper()}: {data_manager.store.path}")
+        return 0
+    copied = data_manager.migrate_storage(args.storage)
+    if data_manager.storage != args.storage:
+        print(f"❌ Migration to {args.storage.upper()} failed (see the session log)")
+        return 1
+    print(f"🗄️  {copied} articles copied to {data_manager.store.path}")
+    return 0
+
+
+def cmd_export(args):
+    """Export all stored articles to CSV"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, session_log=False)
+    rows = data_manager.export_csv(args.output)
+    print(f"📤 {rows} articles in {args.output or data_manager.csv_file}")
+    return 0
+
+
+def cmd_compact(args):
+    """Compact inactive session files into the month-partitioned archive and expire old logs"""
+    from modules.session_archive import SessionArchive
+
+    archive = SessionArchive(args.output_dir)
+    result = archive.compact(min_age_hours=args.min_age_hours)
+    print(f"🗜️  Compacted {result['sessions']} session files into {len(result['months'])} month segments: "
+          f"{result['rows']} articles added, {result['duplicates']} duplicates dropped")
+    print(f"🗜️  Archived {result['logs']} session logs")
+    deleted = archive.expire_logs(retention_days=args.log_retention_days)
+    print(f"🧹 Deleted {deleted} logs older than {args.log_retention_days:g} days")
+    print(f"📒 Manifest: {archive.manifest_file}")
+    return 0
+
+
+def _add_backend_arguments(parser):
+    """Output directory and categorizer backend options shared by recategorization commands"""
+    parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    parser.add_argument(
+        "--backend",
+        choices=["keywords", "linear", "transformer"],
+        default="keywords",
+        help="Categorizer backend (default: keywords)"
+    )
+    parser.add_argument(
+        "--matching",
+        choices=["substring", "stems"],
+        default="substring",
+        help="Keywords backend: match raw substrings or whole-word Indonesian stems (default: substring)"
+    )
+    parser.add_argument(
+        "--model-dir",
+        help="Model directory or Hugging Face model name (default: <output-dir>/classifier)"
+    )
+    parser.add_argument("--threads", type=int, help="Transformer: torch intra-op threads")
+    runtime = parser.add_mutually_exclusive_group()
+    runtime.add_argument("--quantize", action="store_true", help="Transformer: dynamic int8 quantization")
+    runtime.add_argument("--onnx", action="store_true", help="Transformer: model directory is an ONNX export")
+
+
+def cmd_cases(args):
+    """Print case clusters or one case timeline"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, session_log=False)
+    if args.case is not None:
+        for row in data_manager.get_case_timeline(args.case).itertuples(index=False):
+            print(f"   {row.publication_date} | {row.stage:<8} | {row.source_name} | {row.title}")
+        return 0
+    cases = data_manager.get_cases(min_articles=args.min_articles, limit=args.limit)
+    print(f"🗂️  {len(cases)} cases")
+    for row in cases.itertuples(index=False):
+        print(f"   #{row.case_id} {row.label}: {row.article_count} articles, {row.first_date} -> {row.last_date}")
+    return 0
+
+
+def cmd_risk(args):
+    """Print the risk leaderboard"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, session_log=False)
+    leaderboard = data_manager.get_risk_leaderboard(limit=args.limit, entity_type=args.type)
+    for rank, row in enumerate(leaderboard.itertuples(index=False), 1):
+        print(f"{rank:>3}. {row.entity} ({row.entity_type}) | score {row.score:.2f} | "
+              f"{row.article_count} articles, {row.source_count} sources | last {row.last_date}")
+    return 0
+
+
+def cmd_screen(args):
+    """Re-screen the stored articles and list the alerts"""
+    from modules.data_manager import DataManager
+
+    data_manager = DataManager(args.output_dir, watchlist_file=args.watchlist)
+    alert_count = data_manager.rescreen_articles()
+    print(f"🚨 {alert_count} watchlist alerts")
+    for row in data_manager.get_screening_alerts(limit=args.limit).itertuples(index=False):
+        print(f"   {row.watchlist_name} ~ \"{row.matched_text}\" ({row.score:.2f}) | {row.title} | {row.url}")
+    return 0
+
+
+def build_parser():
+    """Build the argument parser with all sub-commands"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="AML News Analysis command line interface"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scrape_parser = subparsers.add_parser("scrape", help="Run a scrape session")
+    scrape_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a CPU profile (folded stacks) and memory report next to the session log"
+    )
+    scrape_parser.add_argument(
+        "--log-format",
+        choices=["text", "json"],
+        default="text",
+        help="Session log format: text lines or JSON lines (default: text)"
+    )
+    scrape_parser.set_defaults(func=cmd_scrape)
+
+    stats_parser = subparsers.add_parser("stats", help="Show article statistics")
+    stats_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    stats_parser.set_defaults(func=cmd_stats)
+
+    recategorize_parser = subparsers.add_parser("recategorize", help="Recategorize all stored articles")
+    bulk_parser = subparsers.add_parser("bulk-recategorize", help="Recategorize all stored articles in parallel")
+    bulk_parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    bulk_parser.add_argument("--chunk-size", type=int, default=2000, help="Articles per chunk (default: 2000)")
+    for backend_parser in (recategorize_parser, bulk_parser):
+        _add_backend_arguments(backend_parser)
+    recategorize_parser.set_defaults(func=cmd_recategorize)
+    bulk_parser.set_defaults(func=cmd_bulk_recategorize)
+
+    reindex_parser = subparsers.add_parser("reindex", help="Rebuild the keyword/entity indexes, cases and risk scores")
+    reindex_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    reindex_parser.set_defaults(func=cmd_reindex)
+
+    entity_parser = subparsers.add_parser("entity", help="List articles mentioning an entity")
+    entity_parser.add_argument("name", help="Entity name or alias, e.g. \"BRI\" or \"Budi Santoso\"")
+    entity_parser.add_argument("--limit", type=int, default=20, help="Maximum articles to list (default: 20)")
+    entity_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    entity_parser.set_defaults(func=cmd_entity)
+
+    search_parser = subparsers.add_parser("search", help="Full-text search over the stored articles")
+    search_parser.add_argument("query", help="Words (all required), \"quoted phrases\" and prefix* words")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum articles to list (default: 20)")
+    search_parser.add_argument("--source", help="Only articles of this source")
+    search_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    search_parser.set_defaults(func=cmd_search)
+
+    cases_parser = subparsers.add_parser("cases", help="List case clusters or show a case timeline")
+    cases_parser.add_argument("--case", type=int, help="Show the timeline of this case ID")
+    cases_parser.add_argument("--min-articles", type=int, default=2, help="Minimum articles per case (default: 2)")
+    cases_parser.add_argument("--limit", type=int, default=50, help="Maximum cases to list (default: 50)")
+    cases_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    cases_parser.set_defaults(func=cmd_cases)
+
+    risk_parser = subparsers.add_parser("risk", help="Show the entity risk leaderboard")
+    risk_parser.add_argument("--limit", type=int, default=20, help="Number of entities (default: 20)")
+    risk_parser.add_argument("--type", choices=["person", "company", "bank"], help="Only this entity type")
+    risk_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    risk_parser.set_defaults(func=cmd_risk)
+
+    screen_parser = subparsers.add_parser("screen", help="Screen stored articles against the watchlist")
+    screen_parser.add_argument("--watchlist", help="Watchlist CSV/text file (default: <output-dir>/watchlist.csv)")
+    screen_parser.add_argument("--limit", type=int, default=50, help="Maximum alerts to list (default: 50)")
+    screen_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    screen_parser.set_defaults(func=cmd_screen)
+
+    train_parser = subparsers.add_parser("train-classifier", help="Train the linear classifier backend")
+    train_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    train_parser.add_argument("--model-dir", help="Model directory (default: <output-dir>/classifier)")
+    train_parser.add_argument(
+        "--method",
+        choices=["logreg", "nb"],
+        default="logreg",
+        help="Logistic regression or naive Bayes (default: logreg)"
+    )
+    train_parser.add_argument("--hash-bits", type=int, default=18, help="Number of hash buckets as a power of two (default: 18)")
+    train_parser.set_defaults(func=cmd_train_classifier)
+
+    for storage, label in (("sqlite", "SQLite"), ("parquet", "Parquet")):
+        migrate_parser = subparsers.add_parser(f"migrate-{storage}", help=f"Move the article store to {label}")
+        migrate_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+        migrate_parser.set_defaults(func=cmd_migrate, storage=storage)
+
+    export_parser = subparsers.add_parser("export", help="Export all stored articles to CSV")
+    export_parser.add_argument("--output", help="CSV file to write (default: <output-dir>/articles.csv)")
+    export_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    export_parser.set_defaults(func=cmd_export)
+
+    compact_parser = subparsers.add_parser("compact", help="Archive session files by month and expire old logs")
+    compact_parser.add_argument(
+        "--log-retention-days",
+        type=float,
+        default=30,
+        help="Delete session logs older than this many days (default: 30)"
+    )
+    compact_parser.add_argument(
+        "--min-age-hours",
+        type=float,
+        default=1,
+        help="Leave files modified more recently than this alone (default: 1)"
+    )
+    compact_parser.add_argument("--output-dir", default="output", help="Output directory (default: output)")
+    compact_parser.set_defaults(func=cmd_compact)
+
+    return parser
+
+
+def main(argv=None):
+    """Parse arguments and dispatch to the selected command"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
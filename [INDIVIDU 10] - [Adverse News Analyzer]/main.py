@@ -26,7 +26,6 @@ import sys
 # Add modules to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
 
-from modules.scraper import NewsScraper
 from modules.data_manager import DataManager
 
 def main():
@@ -58,6 +57,16 @@ def main():
     if 'last_scrape_time' not in st.session_state:
         st.session_state.last_scrape_time = None
     
+    # Sidebar: diagnostics options
+    with st.sidebar:
+        st.markdown("### ⚙️ Diagnostics")
+        profile_session = st.checkbox(
+            "⏱️ Profile scraping session",
+            value=False,
+            help="Record a CPU profile (folded stacks for flamegraph tools) and a memory "
+                 "allocation report next to the session process log."
+        )
+    
     # Create column layout for the main controls
     col1, col2, col3 = st.columns([1, 2, 1])
     
@@ -67,15 +76,24 @@ def main():
         # GO Button - triggers the scraping process
         if st.button("🚀 GO", type="primary", use_container_width=True):
             # Start the scraping process with rotating messages
-            run_scraping_with_messages()
+            run_scraping_with_messages(profile=profile_session)
     
     # Display current database statistics
     display_statistics()
     
+    # Full-text search over the stored articles
+    display_search()
+    
+    # Display the entity risk leaderboard
+    display_risk_leaderboard()
+    
+    # Display case clusters and their timelines
+    display_case_timelines()
+    
     # Display table of recent articles
     display_recent_articles() 
 
-def run_scraping_with_messages():
+def run_scraping_with_messages(profile=False):
     """
     Execute the news scraping process with rotating loading messages and progress tracking.
     
@@ -83,8 +101,13 @@ def run_scraping_with_messages():
     - Initialization: 0-15%
     - Scraping process: 15-85% (with rotating status messages)
     - Final processing: 85-100%
+    
+    Args:
+        profile (bool): Record a CPU and memory profile of the session
     """
     import time
+    # Imported here so read-only reruns never load the scraping stack
+    from modules.scraper import NewsScraper
     
     # Define rotating messages
     loading_messages = [
@@ -101,6 +124,7 @@ def run_scraping_with_messages():
     
     # Initialize message rotation variables
     message_index = 0
+    scraper = None
     
     try:
         # Phase 1: Initialization (5% → 15%)
@@ -108,7 +132,7 @@ def run_scraping_with_messages():
         progress_bar.progress(5)
         time.sleep(1)
         
-        scraper = NewsScraper()
+        scraper = NewsScraper(profile=profile)
         progress_bar.progress(15)
         
         # Phase 2: Scraping process (15% → 85% with granular steps and message rotation)
@@ -174,6 +198,9 @@ def run_scraping_with_messages():
         data_manager._log(f"   - New articles saved: {total_new}")
         data_manager._log(f"   - Total in database: {data_manager.get_articles_count()}")
         
+        # Write profiling results next to the session log
+        profile_paths = data_manager.stop_profiling()
+        
         # Complete progress
         progress_bar.progress(100)
         
@@ -187,6 +214,9 @@ def run_scraping_with_messages():
         else:
             message_placeholder.info("ℹ️ Scraping completed. No new articles found.")
         
+        if profile_paths:
+            st.caption(f"⏱️ Profile saved: {profile_paths['cpu_profile']}, {profile_paths['memory_profile']}")
+        
         # Clear progress bar after 2 seconds
         time.sleep(2)
         progress_bar.empty()
@@ -196,10 +226,18 @@ def run_scraping_with_messages():
         progress_bar.empty()
         message_placeholder.error(f"❌ Error during scraping: {str(e)}")
         
+        # Keep whatever was profiled before the failure
+        if scraper is not None:
+            scraper.data_manager.stop_profiling()
+        
         # Log the error for debugging
         print(f"Scraping error: {str(e)}")
         import traceback
         traceback.print_exc()
+    
+    finally:
+        if scraper is not None:
+            scraper.data_manager.close_session_log()
 
 def display_statistics():
     """
@@ -261,7 +299,7 @@ def display_statistics():
     
     try:
         # Get statistics from data manager
-        data_manager = DataManager()
+        data_manager = DataManager(session_log=False)
         stats = data_manager.get_statistics()
         
         # Create metrics columns for key statistics with enhanced styling
@@ -340,6 +378,102 @@ def display_statistics():
         # Handle any errors in loading statistics
         st.error(f"Error loading statistics: {str(e)}")
 
+def display_search():
+    """
+    Search box over the titles and texts of all stored articles.
+    
+    Results come from the full-text index maintained at ingest, best match
+    first, each with a snippet of the matching text (matches in bold).
+    Supports "quoted phrases" and prefix* words; all words are required.
+    """
+    st.markdown("### 🔎 Search Articles")
+    
+    query = st.text_input("Search", placeholder='e.g. "kredit fiktif" BRI', label_visibility="collapsed")
+    if not query:
+        return
+    
+    try:
+        data_manager = DataManager(session_log=False)
+        results = data_manager.search_articles(query, limit=20)
+        
+        if len(results) > 0:
+            st.caption(f"{len(results)} best matches")
+            for row in results.itertuples(index=False):
+                st.markdown(f"**[{row.title}]({row.url})** · {row.source_name} · {(row.publication_date or '')[:10]}")
+                st.markdown(f"> {row.snippet}")
+        elif data_manager.search_index.count() < data_manager.get_articles_count():
+            st.warning("🔎 The search index is incomplete. Run `python cli.py reindex` to rebuild it.")
+        else:
+            st.info("🔎 No articles match this search.")
+            
+    except Exception as e:
+        st.error(f"Error searching articles: {str(e)}")
+
+def display_risk_leaderboard():
+    """
+    Display the entities with the highest risk score.
+    
+    Scores are maintained incrementally as articles are saved (category
+    severity, recency decay and number of sources), so the leaderboard is
+    read directly from the score store whatever the size of the dataset.
+    """
+    st.markdown("### ⚠️ Risk Leaderboard")
+    
+    try:
+        leaderboard = DataManager(session_log=False).get_risk_leaderboard(limit=10)
+        
+        if len(leaderboard) > 0:
+            display_df = leaderboard[['entity', 'entity_type', 'score', 'article_count', 'source_count', 'last_date']].copy()
+            display_df.columns = ['Entity', 'Type', 'Risk Score', 'Articles', 'Sources', 'Last Seen']
+            display_df['Risk Score'] = display_df['Risk Score'].round(2)
+            display_df['Last Seen'] = display_df['Last Seen'].str[:10]
+            display_df.index = range(1, len(display_df) + 1)
+            st.dataframe(display_df, use_container_width=True)
+        else:
+            st.info("⚠️ No risk scores yet.")
+            
+    except Exception as e:
+        st.error(f"Error loading risk leaderboard: {str(e)}")
+
+def display_case_timelines():
+    """
+    Display case clusters (articles about the same event) and the timeline of a selected case.
+    
+    Features:
+    - Lists cases with at least two articles, most recently active first
+    - Selecting a case shows its articles in publication order
+    - Each row shows the reported stage (Report, Arrest, Charge, Trial, Verdict)
+    - Clickable titles that open article URLs in new tabs
+    """
+    st.markdown("### 🗂️ Case Timelines")
+    
+    try:
+        data_manager = DataManager(session_log=False)
+        cases = data_manager.get_cases()
+        
+        if len(cases) > 0:
+            # One option per case: label, size and date span
+            options = {
+                f"{row.label} ({row.article_count} articles, {(row.first_date or '')[:10]} – {(row.last_date or '')[:10]})": row.case_id
+                for row in cases.itertuples(index=False)
+            }
+            selected = st.selectbox("Case", list(options.keys()))
+            timeline = data_manager.get_case_timeline(options[selected])
+            
+            display_df = timeline[['publication_date', 'stage', 'title', 'url', 'source_name']].copy()
+            display_df.columns = ['Date', 'Stage', 'Title', 'URL', 'Source']
+            display_df['Date'] = display_df['Date'].str[:16]
+            display_df['Title'] = display_df.apply(
+                lambda row: f"[{row['Title']}]({row['URL']})", axis=1
+            )
+            display_df = display_df[['Date', 'Stage', 'Title', 'Source']]
+            st.markdown(display_df.to_markdown(index=False), unsafe_allow_html=True)
+        else:
+            st.info("🗂️ No multi-article cases yet.")
+            
+    except Exception as e:
+        st.error(f"Error loading case timelines: {str(e)}")
+
 def display_recent_articles():
     """
     Display a table of recent articles and provide CSV download functionality.
@@ -352,24 +486,20 @@ def display_recent_articles():
     - Handles empty dataset gracefully
     - Uses proper date formatting for display
     
-    The CSV download includes all articles with timestamp in filename.
+    The table only loads the 20 rows and five columns it shows (never the
+    article texts). The CSV download includes all articles with timestamp in
+    filename; the full dataset is only read once the user asks for it.
     """
     st.markdown("### 📄 Recent Articles")
     
     try:
         # Load articles from data manager
-        data_manager = DataManager()
-        df = data_manager.load_articles()
+        data_manager = DataManager(session_log=False)
+        recent_df = data_manager.recent(20, columns=['publication_date', 'title', 'url', 'source_name', 'category'],
+                                        typed=True)
         
-        if len(df) > 0:
-            # Sort by publication date (most recent first)
-            df['publication_date'] = pd.to_datetime(df['publication_date'])
-            df = df.sort_values('publication_date', ascending=False)
-            
-            # Get the top 20 articles
-            recent_df = df.head(20).copy()
-            
-            # Format publication date for display
+        if len(recent_df) > 0:
+            # Format publication date for display (parsed at load; the page is already newest first)
             recent_df['publication_date'] = recent_df['publication_date'].dt.strftime('%Y-%m-%d %H:%M')
             
             # Prepare display dataframe with selected columns
@@ -391,16 +521,17 @@ def display_recent_articles():
             # CSV Export Section
             st.markdown("### 💾 Export Data")
             
-            # Prepare CSV data for download (includes all articles, not just displayed ones)
-            csv_data = df.to_csv(index=False)
-            
-            # Create download button with timestamped filename
-            st.download_button(
-                label="📥 Download Full Dataset (CSV)",
-                data=csv_data,
-                file_name=f"aml_news_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
+            # Prepare CSV data for download (includes all articles and columns) on request only
+            if st.checkbox("Prepare full dataset download (includes article texts)"):
+                csv_data = data_manager.load_articles().to_csv(index=False)
+                
+                # Create download button with timestamped filename
+                st.download_button(
+                    label="📥 Download Full Dataset (CSV)",
+                    data=csv_data,
+                    file_name=f"aml_news_articles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv"
+                )
         else:
             # Show helpful message when no data is available
             st.info("📝 No articles found. Click the GO button to start scraping!")
@@ -4,9 +4,20 @@
 __version__ = "1.0.0"
 __author__ = "AML News Analysis Team"
 
-# Module imports
-from . import scraper
-from . import categorizer
-from . import data_manager
+# Submodules are imported lazily on first attribute access (PEP 562) so that
+# `import modules` does not pull in pandas, requests or BeautifulSoup.
+import importlib
 
 __all__ = ['scraper', 'categorizer', 'data_manager']
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,69 @@
+"""
+Lazy Import Helpers
+
+Defers loading of heavy third-party dependencies (pandas, requests,
+BeautifulSoup, numpy, ...) until one of their attributes is first used.
+
+Importing the application modules therefore stays cheap: a Streamlit rerun
+that only reads statistics, or a short CLI command like `cli.py --help`,
+does not pay for libraries it never touches.
+
+Usage:
+    from ._lazy import lazy_import
+    pd = lazy_import("pandas")   # nothing is loaded yet
+    pd.DataFrame(...)            # pandas is imported here, on first use
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Return a module object for `name` that is only executed on first attribute access.
+
+    If the module is already imported (or already registered lazily) the
+    existing module object is returned unchanged.
+
+    Args:
+        name (str): Absolute module name, e.g. "pandas"
+
+    Returns:
+        module: The (possibly not yet loaded) module
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(name):
+    """
+    Check whether a module has actually been executed.
+
+    Modules registered through lazy_import() are present in sys.modules
+    before they are loaded, so a plain `name in sys.modules` check is not
+    enough to tell whether the import cost has been paid.
+
+    Args:
+        name (str): Absolute module name
+
+    Returns:
+        bool: True if the module is imported and fully loaded
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        return False
+    return not isinstance(module, importlib.util._LazyModule)
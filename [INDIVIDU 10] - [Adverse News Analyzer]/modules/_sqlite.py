@@ -0,0 +1,36 @@
+"""
+SQLite Connection Helper
+
+Opens the SQLite files of an output directory (article store, indexes,
+caches), which several processes may write at once: scraper workers, a
+scheduled `cli.py scrape` and the Streamlit app.
+
+Connections run in WAL mode, so readers never block the writer, and wait
+up to SQLITE_TIMEOUT seconds for another process's write transaction
+instead of failing with "database is locked".
+
+Usage:
+    from ._sqlite import connect_sqlite
+    connection = connect_sqlite("output/keyword_index.db")
+"""
+
+import sqlite3
+
+# Seconds a SQLite connection waits for another process's write transaction
+SQLITE_TIMEOUT = 30
+
+
+def connect_sqlite(path):
+    """
+    Open a SQLite file shared with other processes.
+
+    Args:
+        path (str): Database file
+
+    Returns:
+        sqlite3.Connection: WAL-mode connection usable from any thread
+    """
+    connection = sqlite3.connect(path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
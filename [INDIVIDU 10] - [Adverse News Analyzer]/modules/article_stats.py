@@ -0,0 +1,189 @@
+"""
+Article Statistics Module
+
+Materialized statistics of the article store, maintained incrementally.
+
+get_statistics() used to read and parse the whole store on every call, and
+Streamlit calls it on every rerun. ArticleStatistics keeps the aggregates
+(total, counts per source and per category, min/max publication date and
+daily counts) in a small JSON file, `output/article_stats.json`, and
+updates them with every saved batch.
+
+The file records the store fingerprint (ArticleStore.stamp()) it was
+computed for. A batch is only applied when the statistics were up to date
+just before it was written; a read first compares the fingerprint with the
+store (a file stat, or a row lookup for SQLite) and rebuilds the
+aggregates from the store when they differ, e.g. after another process
+wrote to it or after recategorization.
+Writers apply their batches under the store's write lock, so batches of
+concurrent processes are folded in one after the other.
+
+Usage:
+    stats = ArticleStatistics("output/article_stats.json")
+    with store.locked():
+        before = store.stamp()
+        store.append(articles)
+        stats.add(articles, before, store.stamp())
+    stats.snapshot(store)
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import json
+import os
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+from ._lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+STATS_VERSION = 1
+
+STATS_COLUMNS = ['source_name', 'category', 'publication_date']
+
+
+def _empty_state(stamp=None) -> Dict:
+    return {
+        'version': STATS_VERSION,
+        'store_stamp': stamp,
+        'total': 0,
+        'sources': {},
+        'categories': {},
+        'min_date': None,
+        'max_date': None,
+        'daily': {},
+    }
+
+
+def _present(value) -> bool:
+    """Whether a column value counts (None, NaN and '' do not, as in value_counts)"""
+    return value is not None and value == value and f"{value}" != ''
+
+
+class ArticleStatistics:
+    """
+    Persisted aggregates of an article store.
+
+    Attributes:
+        path (str): JSON file holding the aggregates
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._state = None
+        self._lock = threading.Lock()
+
+    def _read(self) -> Optional[Dict]:
+        """Aggregates saved on disk, or None if missing, unreadable or outdated"""
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        return state if state.get('version') == STATS_VERSION else None
+
+    def _write(self):
+        """Save the aggregates atomically (temp file, then rename)"""
+        temp_file = self.path + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(self._state, file, ensure_ascii=False)
+        os.replace(temp_file, self.path)
+
+    def _apply(self, articles: List[Dict]):
+        """Fold a batch of articles into the in-memory aggregates"""
+        state = self._state
+        state['total'] += len(articles)
+        for key, column in (('sources', 'source_name'), ('categories', 'category')):
+            counts = Counter(f"{article.get(column)}" for article in articles if _present(article.get(column)))
+            for value, count in counts.items():
+                state[key][value] = state[key].get(value, 0) + count
+
+        dates = pd.to_datetime(
+            pd.Series([article.get('publication_date') for article in articles], dtype=object),
+            format='mixed', errors='coerce'
+        ).dropna()
+        if len(dates) == 0:
+            return
+        for day, count in dates.dt.strftime('%Y-%m-%d').value_counts().items():
+            state['daily'][day] = state['daily'].get(day, 0) + int(count)
+        low, high = dates.min(), dates.max()
+        if state['min_date'] is None or low < pd.Timestamp(state['min_date']):
+            state['min_date'] = low.isoformat(sep=' ')
+        if state['max_date'] is None or high > pd.Timestamp(state['max_date']):
+            state['max_date'] = high.isoformat(sep=' ')
+
+    def add(self, articles: List[Dict], before_stamp, after_stamp):
+        """
+        Add a batch just appended to the store.
+
+        Args:
+            articles: The articles that were stored
+            before_stamp: Store fingerprint before the append
+            after_stamp: Store fingerprint after the append
+        """
+        with self._lock:
+            if self._state is None or self._state['store_stamp'] != before_stamp:
+                # Another process may have saved a batch (and its aggregates) before this one
+                self._state = self._read()
+            if self._state is None or self._state['store_stamp'] != before_stamp:
+                # Stale already; the next read rebuilds from the store
+                return
+            self._apply(articles)
+            self._state['store_stamp'] = after_stamp
+            self._write()
+
+    def invalidate(self):
+        """Mark the aggregates stale (the store was rewritten); the next read rebuilds them"""
+        with self._lock:
+            self._state = _empty_state()
+            self._write()
+
+    def rebuild(self, store):
+        """Recompute the aggregates from the statistics columns of the store"""
+        with self._lock:
+            self._rebuild(store)
+
+    def _rebuild(self, store):
+        stamp = store.stamp()
+        self._state = _empty_state(stamp)
+        if store.exists():
+            df = store.load_typed([column for column in STATS_COLUMNS if column in store.schema])
+            self._apply(df.to_dict('records'))
+        self._write()
+
+    def _current(self, store) -> Dict:
+        """Aggregates matching the store, reloaded or rebuilt if needed (lock held)"""
+        stamp = store.stamp()
+        if self._state is None or self._state['store_stamp'] != stamp:
+            # Another process may have updated the file for the same store state
+            self._state = self._read()
+            if self._state is None or self._state['store_stamp'] != stamp:
+                self._rebuild(store)
+        return self._state
+
+    def snapshot(self, store) -> Dict:
+        """Statistics in the DataManager.get_statistics() format"""
+        with self._lock:
+            state = self._current(store)
+            date_range = None
+            if state['min_date'] is not None:
+                date_range = f"{state['min_date'][:10]} to {state['max_date'][:10]}"
+            return {
+                'total_articles': state['total'],
+                'sources': dict(sorted(state['sources'].items(), key=lambda item: -item[1])),
+                'categories': dict(sorted(state['categories'].items(), key=lambda item: -item[1])),
+                'date_range': date_range
+            }
+
+    def total(self, store) -> int:
+        """Number of stored articles"""
+        with self._lock:
+            return self._current(store)['total']
+
+    def daily_counts(self, store) -> Dict[str, int]:
+        """Articles per publication day ('YYYY-MM-DD'), in date order"""
+        with self._lock:
+            return dict(sorted(self._current(store)['daily'].items()))
@@ -0,0 +1,179 @@
+"""
+Bulk Categorization Module
+
+Parallel, streaming recategorization of the whole article store.
+
+The articles CSV is read in chunks; the title and text columns of each chunk
+are sent to a pool of worker processes, each holding its own
+NewsCategorizor configured like the caller's (same backend and keyword
+table). Results are written in input order to a temporary file that
+atomically replaces the store when the job finishes, so readers never see a
+partially updated file and at most a few chunks are in memory at a time.
+
+Usage:
+    from modules.bulk_categorizer import bulk_recategorize
+    result = bulk_recategorize("output/articles.csv", categorizer, workers=8,
+                               progress=lambda p: print(p['rate'], p['eta']))
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+import logging
+from ._lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Categorizer of the current worker process, created by _init_worker
+_worker_categorizer = None
+
+
+def _categorizer_config(categorizer) -> Dict:
+    """Picklable settings needed to rebuild `categorizer` in a worker"""
+    return {
+        'backend': categorizer.backend,
+        'model_path': categorizer.model_path,
+        'backend_options': categorizer.backend_options,
+        'matching': categorizer.matching,
+        'category_keywords': {category: list(keywords) for category, keywords in categorizer.category_keywords.items()},
+    }
+
+
+def _build_categorizer(config: Dict):
+    from .categorizer import NewsCategorizor
+    categorizer = NewsCategorizor(
+        backend=config['backend'],
+        model_path=config['model_path'],
+        backend_options=config['backend_options'],
+        matching=config['matching']
+    )
+    categorizer.category_keywords = config['category_keywords']
+    return categorizer
+
+
+def _init_worker(config: Dict):
+    """Process pool initializer: one categorizer per worker, quiet logging"""
+    global _worker_categorizer
+    logging.getLogger("modules.categorizer").setLevel(logging.WARNING)
+    _worker_categorizer = _build_categorizer(config)
+
+
+def _as_articles(texts: List[str], titles: List[str]) -> List[Dict]:
+    return [{'full_text': text, 'title': title} for text, title in zip(texts, titles)]
+
+
+def _categorize_chunk(texts: List[str], titles: List[str]) -> List[str]:
+    """Worker task: categorize one chunk"""
+    return _worker_categorizer.categorize_batch(_as_articles(texts, titles))
+
+
+def count_rows(csv_file: str, chunk_size: int = 50000) -> int:
+    """Number of articles in the CSV (streams one column, never the whole file)"""
+    total = 0
+    for chunk in pd.read_csv(csv_file, usecols=['url'], chunksize=chunk_size, encoding='utf-8'):
+        total += len(chunk)
+    return total
+
+
+def bulk_recategorize(csv_file: str, categorizer, workers: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Recategorize every article of `csv_file` in parallel, streaming in chunks.
+
+    Args:
+        csv_file (str): Path to the articles CSV (rewritten in place)
+        categorizer (NewsCategorizor): Categorizer whose backend and keyword
+            table the workers copy
+        workers (int): Worker processes (default: all cores; 1 runs in-process)
+        chunk_size (int): Articles per chunk
+        progress (callable): Called after every chunk with a dict of
+            done, total, changed, elapsed, rate (articles/s) and eta (s)
+
+    Returns:
+        Dict: rows, changed, elapsed and rate of the whole job
+    """
+    workers = workers or os.cpu_count() or 1
+    total = count_rows(csv_file)
+    temp_file = csv_file + '.tmp'
+    start = time.perf_counter()
+    done = changed = 0
+    executor = None
+
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(_categorizer_config(categorizer),)
+        )
+
+    def run(texts, titles):
+        if executor is None:
+            return categorizer.categorize_batch(_as_articles(texts, titles))
+        return executor.submit(_categorize_chunk, texts, titles)
+
+    def finish(chunk, result, header):
+        nonlocal done, changed
+        categories = result if executor is None else result.result()
+        changed += int((chunk['category'].astype(str) != pd.Series(categories, index=chunk.index)).sum())
+        chunk['category'] = categories
+        chunk.to_csv(temp_file, mode='w' if header else 'a', header=header, index=False, encoding='utf-8')
+        done += len(chunk)
+        if progress is not None:
+            elapsed = time.perf_counter() - start
+            rate = done / elapsed if elapsed > 0 else 0.0
+            progress({
+                'done': done,
+                'total': total,
+                'changed': changed,
+                'elapsed': elapsed,
+                'rate': rate,
+                'eta': (total - done) / rate if rate else None,
+            })
+
+    try:
+        # Keep a bounded window of chunks in flight; write them back in order
+        pending = deque()
+        first = True
+        for chunk in pd.read_csv(csv_file, chunksize=chunk_size, encoding='utf-8'):
+            texts = chunk['full_text'].tolist() if 'full_text' in chunk.columns else [''] * len(chunk)
+            titles = chunk['title'].tolist() if 'title' in chunk.columns else [''] * len(chunk)
+            if 'category' not in chunk.columns:
+                chunk['category'] = ''
+            pending.append((chunk, run(texts, titles)))
+            if len(pending) >= workers * 2:
+                finish(*pending.popleft(), header=first)
+                first = False
+        while pending:
+            finish(*pending.popleft(), header=first)
+            first = False
+
+        if done:
+            os.replace(temp_file, csv_file)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    result = {
+        'rows': done,
+        'changed': changed,
+        'elapsed': elapsed,
+        'rate': done / elapsed if elapsed > 0 else 0.0,
+    }
+    logger.info(f"Bulk recategorized {done} articles in {elapsed:.1f}s ({result['rate']:.0f}/s), {changed} changed")
+    return result
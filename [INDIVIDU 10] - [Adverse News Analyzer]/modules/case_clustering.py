@@ -0,0 +1,315 @@
+"""
+Case Clustering Module
+
+Groups articles reporting on the same case (arrest -> charge -> trial ->
+verdict, often weeks apart and from different sources) into case clusters
+with a timeline.
+
+Clustering is incremental and uses blocking: every case is indexed by its
+entity keys (persons and banks; title terms when an article has none). A new
+article is only compared with the cases sharing one of its keys and active
+within the last `max_gap_days`, never with the whole corpus. The comparison
+combines the overlap of entity keys with the cosine similarity between the
+article terms and the case term centroid; the article joins the best case
+above `threshold`, otherwise it starts a new case.
+
+Storage is a single SQLite file (output/cases.db by default).
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from ._sqlite import connect_sqlite
+
+TERM_PATTERN = re.compile(r'[a-z]{4,}')
+
+STOPWORDS = {
+    "yang", "dengan", "untuk", "dalam", "pada", "dari", "oleh", "akan", "telah", "sudah", "juga",
+    "tersebut", "karena", "kepada", "bahwa", "adalah", "atau", "saat", "tidak", "masih", "dapat",
+    "para", "sebagai", "setelah", "sebelum", "menurut", "mengatakan", "kata", "ujar", "jelas",
+    "tahun", "hari", "kami", "mereka", "lebih", "namun", "serta", "antara", "hingga", "terkait",
+    "kasus", "ini", "itu", "baca", "juga", "berita", "jakarta",
+}
+
+# Case stage keywords, checked from the latest stage to the earliest
+STAGES = [
+    ("Verdict", ["vonis", "divonis", "memvonis", "dihukum", "putusan", "dijatuhi", "verdict"]),
+    ("Trial", ["sidang", "didakwa", "dakwaan", "persidangan", "tuntutan", "dituntut", "menuntut", "jaksa penuntut"]),
+    ("Charge", ["tersangka", "ditetapkan", "menetapkan", "penetapan", "dijerat"]),
+    ("Arrest", ["ditangkap", "menangkap", "penangkapan", "diamankan", "ditahan", "dibekuk", "operasi tangkap tangan", "ott"]),
+]
+
+CENTROID_TERMS = 100
+BLOCKING_ENTITY_TYPES = ("person", "company", "bank")
+
+
+def article_stage(text: str, title: str = "") -> str:
+    """Case stage reported by an article (latest stage mentioned), or "Report\""""
+    combined = f"{title} {text}".lower()
+    for stage, keywords in STAGES:
+        if any(re.search(r'\b' + re.escape(keyword) + r'\b', combined) for keyword in keywords):
+            return stage
+    return "Report"
+
+
+def article_terms(text: str, title: str = "") -> Counter:
+    """Content terms of an article (title counted twice)"""
+    terms = TERM_PATTERN.findall(f"{title} {title} {text}".lower())
+    return Counter(term for term in terms if term not in STOPWORDS)
+
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if not a or not b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(value * b.get(term, 0.0) for term, value in a.items())
+    norm = math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values()))
+    return dot / norm if norm else 0.0
+
+
+def _parse_date(value) -> Optional[datetime]:
+    try:
+        return datetime.strptime(f"{value}"[:19], "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        try:
+            return datetime.strptime(f"{value}"[:10], "%Y-%m-%d")
+        except ValueError:
+            return None
+
+
+class CaseClusterer:
+    """
+    Incremental, entity-blocked article clustering backed by SQLite.
+
+    Tables:
+    - cases(case_id, label, first_date, last_date, article_count, centroid)
+    - case_keys(key, case_id, name, weight): blocking keys of each case
+    - case_articles(article_id, case_id, publication_date, stage, title, url, source_name)
+
+    Attributes:
+        db_path (str): Path of the SQLite file
+        threshold (float): Minimum similarity for an article to join a case
+        max_gap_days (int): Cases inactive for longer are not extended
+        max_candidates (int): Maximum candidate cases compared per article
+
+    Usage:
+        clusterer = CaseClusterer("output/cases.db")
+        case_id = clusterer.add_article(article_id, article_data, entities)
+        clusterer.timeline(case_id)
+    """
+
+    def __init__(self, db_path, threshold: float = 0.35, max_gap_days: int = 90, max_candidates: int = 20):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.max_gap_days = max_gap_days
+        self.max_candidates = max_candidates
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        """SQLite connection, opened (and the schema created) on first use"""
+        if self._connection is None:
+            self._connection = connect_sqlite(self.db_path)
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS cases (
+                    case_id INTEGER PRIMARY KEY,
+                    label TEXT NOT NULL,
+                    first_date TEXT,
+                    last_date TEXT,
+                    article_count INTEGER NOT NULL,
+                    centroid TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS cases_last_date ON cases (last_date);
+                CREATE TABLE IF NOT EXISTS case_keys (
+                    key TEXT NOT NULL,
+                    case_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    weight INTEGER NOT NULL,
+                    PRIMARY KEY (key, case_id)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS case_articles (
+                    article_id TEXT PRIMARY KEY,
+                    case_id INTEGER NOT NULL,
+                    publication_date TEXT,
+                    stage TEXT NOT NULL,
+                    title TEXT,
+                    url TEXT,
+                    source_name TEXT
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS case_articles_case ON case_articles (case_id, publication_date);
+            """)
+        return self._connection
+
+    @staticmethod
+    def blocking_keys(entities, terms: Counter) -> Dict[str, str]:
+        """
+        Blocking keys of an article -> display name.
+
+        Persons and banks identify a case; articles without them fall back to
+        their three most frequent long title/body terms.
+        """
+        keys = {
+            f"{entity_type}:{entity.lower()}": entity
+            for entity, entity_type in entities
+            if entity_type in BLOCKING_ENTITY_TYPES
+        }
+        if not keys:
+            keys = {f"term:{term}": term for term, _ in terms.most_common(3)}
+        return keys
+
+    def add_article(self, article_id, article_data: Dict, entities) -> Optional[int]:
+        """
+        Assign an article to a case (existing or new). Articles that are
+        already clustered keep their case.
+
+        Args:
+            article_id (str): Canonical article ID
+            article_data (dict): Article with title, full_text, url, source_name, publication_date
+            entities: (entity, entity_type) pairs of the article (e.g. EntityExtractor output)
+
+        Returns:
+            int: Case ID, or None if the article has nothing to cluster on
+        """
+        title = f"{article_data.get('title', '') or ''}"
+        text = f"{article_data.get('full_text', '') or ''}"
+        terms = article_terms(text, title)
+        keys = self.blocking_keys(entities, terms)
+        if not keys:
+            return None
+
+        published = _parse_date(article_data.get('publication_date'))
+        date_text = published.strftime("%Y-%m-%d %H:%M:%S") if published else None
+        stage = article_stage(text, title)
+
+        with self._lock, self.connection as connection:
+            existing = connection.execute(
+                "SELECT case_id FROM case_articles WHERE article_id = ?", (article_id,)
+            ).fetchone()
+            if existing:
+                return existing[0]
+            case_id = self._best_case(connection, keys, terms, published)
+            if case_id is None:
+                case_id = connection.execute(
+                    "INSERT INTO cases (label, first_date, last_date, article_count, centroid) VALUES (?, ?, ?, 0, '{}')",
+                    (next(iter(keys.values())), date_text, date_text)
+                ).lastrowid
+            self._update_case(connection, case_id, keys, terms, date_text)
+            connection.execute(
+                "INSERT INTO case_articles (article_id, case_id, publication_date, stage, title, url, source_name) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (article_id, case_id, date_text, stage, title,
+                 article_data.get('url', ''), article_data.get('source_name', ''))
+            )
+        return case_id
+
+    def _best_case(self, connection, keys, terms, published) -> Optional[int]:
+        """Most similar candidate case sharing a blocking key, if above the threshold"""
+        placeholders = ",".join("?" * len(keys))
+        query = (
+            f"SELECT k.case_id, COUNT(*) AS shared FROM case_keys k JOIN cases c ON c.case_id = k.case_id "
+            f"WHERE k.key IN ({placeholders})"
+        )
+        parameters = list(keys)
+        if published is not None:
+            query += " AND (c.last_date IS NULL OR c.last_date >= ?)"
+            parameters.append((published - timedelta(days=self.max_gap_days)).strftime("%Y-%m-%d %H:%M:%S"))
+        query += " GROUP BY k.case_id ORDER BY shared DESC, c.last_date DESC LIMIT ?"
+        parameters.append(self.max_candidates)
+        candidates = connection.execute(query, parameters).fetchall()
+
+        best_case, best_score = None, self.threshold
+        for case_id, shared in candidates:
+            case_key_count, centroid = connection.execute(
+                "SELECT (SELECT COUNT(*) FROM case_keys WHERE case_id = ?), centroid FROM cases WHERE case_id = ?",
+                (case_id, case_id)
+            ).fetchone()
+            key_overlap = shared / min(len(keys), case_key_count)
+            score = 0.5 * key_overlap + 0.5 * _cosine(terms, json.loads(centroid))
+            if score >= best_score:
+                best_case, best_score = case_id, score
+        return best_case
+
+    def _update_case(self, connection, case_id, keys, terms, date_text):
+        """Fold an article into a case: keys, term centroid, dates, label"""
+        connection.executemany(
+            "INSERT INTO case_keys (key, case_id, name, weight) VALUES (?, ?, ?, 1) "
+            "ON CONFLICT(key, case_id) DO UPDATE SET weight = weight + 1",
+            [(key, case_id, name) for key, name in keys.items()]
+        )
+        centroid, first_date, last_date = connection.execute(
+            "SELECT centroid, first_date, last_date FROM cases WHERE case_id = ?", (case_id,)
+        ).fetchone()
+        merged = Counter(json.loads(centroid))
+        merged.update(terms)
+        dates = [d for d in (first_date, last_date, date_text) if d]
+        # Label: the most frequent entity of the case (terms only if there is none)
+        label = connection.execute(
+            "SELECT name FROM case_keys WHERE case_id = ? ORDER BY key LIKE 'term:%', weight DESC, key LIMIT 1",
+            (case_id,)
+        ).fetchone()[0]
+        connection.execute(
+            "UPDATE cases SET label = ?, centroid = ?, first_date = ?, last_date = ?, "
+            "article_count = article_count + 1 WHERE case_id = ?",
+            (label, json.dumps(dict(merged.most_common(CENTROID_TERMS))),
+             min(dates) if dates else None, max(dates) if dates else None, case_id)
+        )
+
+    def case_for(self, article_id) -> Optional[int]:
+        """Case ID of an article"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT case_id FROM case_articles WHERE article_id = ?", (article_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def cases(self, min_articles: int = 2, limit: int = 50) -> List[Dict]:
+        """Cases with at least `min_articles` articles, most recently active first"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT case_id, label, first_date, last_date, article_count FROM cases "
+                "WHERE article_count >= ? ORDER BY last_date DESC, case_id DESC LIMIT ?",
+                (min_articles, limit)
+            ).fetchall()
+        return [
+            {'case_id': case_id, 'label': label, 'first_date': first_date,
+             'last_date': last_date, 'article_count': article_count}
+            for case_id, label, first_date, last_date, article_count in rows
+        ]
+
+    def timeline(self, case_id) -> List[Dict]:
+        """Articles of a case in publication order"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT publication_date, stage, title, url, source_name, article_id FROM case_articles "
+                "WHERE case_id = ? ORDER BY publication_date, article_id",
+                (case_id,)
+            ).fetchall()
+        return [
+            {'publication_date': date, 'stage': stage, 'title': title, 'url': url,
+             'source_name': source_name, 'article_id': article_id}
+            for date, stage, title, url, source_name, article_id in rows
+        ]
+
+    def clear(self):
+        """Remove all cases"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM case_articles")
+            connection.execute("DELETE FROM case_keys")
+            connection.execute("DELETE FROM cases")
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
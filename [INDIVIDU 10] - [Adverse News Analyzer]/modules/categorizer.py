@@ -16,21 +16,386 @@ Categories supported:
 - Other/Uncategorized
 
 The system uses comprehensive Indonesian keyword patterns and can be easily extended
-to support transformer-based models for more advanced classification.
+to support transformer-based models for more advanced classification. A trained
+hashed-feature linear model (see linear_classifier.py) or a fine-tuned
+transformer (see transformer_classifier.py) can be selected instead of the
+keyword rules with backend="linear" or backend="transformer". With
+matching="stems", keywords match whole words after Indonesian stemming (see
+text_normalizer.py) instead of raw substrings.
 
 Author: AI Assistant
 Date: July 31, 2025
 Version: 1.0
 """
 
+import os
 import re
-from typing import Dict, List, Tuple
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
 import logging
+from ._lazy import lazy_import
+from ._sqlite import connect_sqlite
+
+# NumPy is only needed for batch categorization
+np = lazy_import("numpy")
 
 # Configure logging for categorization operations
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _build_trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex that matches the longest of `words` starting at a position.
+    
+    The words are folded into a character trie so the regex engine checks at
+    most one branch per character instead of trying every word in turn.
+    Optional groups are greedy, so the deepest (longest) word wins.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return build(trie)
+
+
+class _KeywordMatcher:
+    """
+    Keyword table compiled into a single matcher.
+    
+    Keywords are folded into one trie-shaped regex. Searching it stops at every
+    position where a keyword starts and reports the longest keyword found there;
+    all shorter keywords starting at the same position are its prefixes and are
+    looked up from a precomputed table. Per keyword, hits are counted greedily
+    left-to-right without overlap, which reproduces
+    `len(re.findall(re.escape(keyword), text))` for every keyword at once.
+    
+    Long texts are scored through their vocabulary: a keyword without
+    whitespace can only occur inside a single whitespace-separated token, so
+    the trie is run once over the distinct tokens and each hit is weighted by
+    the token frequency. Keywords containing whitespace are counted with
+    `str.count` on the full text, but only when all of their words occur in
+    the vocabulary.
+    """
+    
+    # Below this length a direct scan is cheaper than building the vocabulary
+    VOCABULARY_MIN_LENGTH = 2000
+    
+    def __init__(self, category_keywords: Dict[str, List[str]]):
+        self.categories = list(category_keywords)
+        self.keywords = []
+        self.keyword_categories = []
+        self.empty_keyword_categories = []
+        index_of = {}
+        
+        for category_index, keywords in enumerate(category_keywords.values()):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if not keyword:
+                    # re.findall('') matches at every position; kept for identical scores
+                    self.empty_keyword_categories.append(category_index)
+                    continue
+                if keyword not in index_of:
+                    index_of[keyword] = len(self.keywords)
+                    self.keywords.append(keyword)
+                    self.keyword_categories.append([])
+                self.keyword_categories[index_of[keyword]].append(category_index)
+        
+        self.lengths = [len(keyword) for keyword in self.keywords]
+        
+        # For each keyword, every keyword that is a prefix of it (itself included)
+        self.prefixes = {
+            keyword: [index_of[keyword[:end]] for end in range(1, len(keyword) + 1)
+                      if keyword[:end] in index_of]
+            for keyword in self.keywords
+        }
+        self.pattern = re.compile(_build_trie_pattern(self.keywords)) if self.keywords else None
+        self._weight_matrix = None
+        
+        # Vocabulary path: single-token keywords go through the token trie,
+        # multi-token keywords are pre-filtered by their words
+        token_keywords = [keyword for keyword in self.keywords if keyword.split() == [keyword]]
+        self.token_prefixes = {
+            keyword: [index for index in self.prefixes[keyword] if self.keywords[index] in token_keywords]
+            for keyword in token_keywords
+        }
+        self.token_pattern = re.compile(_build_trie_pattern(token_keywords)) if token_keywords else None
+        self.phrase_keywords = [
+            (index, keyword, keyword.split())
+            for index, keyword in enumerate(self.keywords) if keyword.split() != [keyword]
+        ]
+    
+    def keyword_scores(self, combined_text: str, title_length: int) -> Dict[int, int]:
+        """
+        Score every keyword found in an article.
+        
+        Args:
+            combined_text (str): Lower-cased "title title body" text
+            title_length (int): Length of the lower-cased title prefix (0 if no title)
+            
+        Returns:
+            Dict[int, int]: Sparse map of keyword index -> occurrences plus title bonus
+        """
+        keyword_count = len(self.keywords)
+        counts = [0] * keyword_count
+        in_title = [False] * keyword_count
+        
+        if self.pattern is not None:
+            if len(combined_text) < self.VOCABULARY_MIN_LENGTH:
+                self._scan(combined_text, self.pattern, self.prefixes, counts, in_title, title_length)
+            else:
+                self._scan_vocabulary(combined_text, counts)
+                # Title bonus: one direct pass over the title prefix only
+                title_counts = [0] * keyword_count
+                self._scan(combined_text[:title_length], self.pattern, self.prefixes,
+                           title_counts, in_title, title_length)
+        
+        return {
+            index: counts[index] + (2 if in_title[index] else 0)
+            for index in range(keyword_count)
+            if counts[index] or in_title[index]
+        }
+    
+    def empty_keyword_score(self, combined_text: str, title_length: int) -> int:
+        """Score contributed by each empty keyword (it matches at every position)"""
+        return len(combined_text) + 1 + (2 if title_length else 0)
+    
+    def score(self, combined_text: str, title_length: int) -> List[int]:
+        """
+        Score every category for an article.
+        
+        Args:
+            combined_text (str): Lower-cased "title title body" text
+            title_length (int): Length of the lower-cased title prefix (0 if no title)
+            
+        Returns:
+            List[int]: Score per category, in category order
+        """
+        scores = [0] * len(self.categories)
+        for index, keyword_score in self.keyword_scores(combined_text, title_length).items():
+            for category_index in self.keyword_categories[index]:
+                scores[category_index] += keyword_score
+        
+        for category_index in self.empty_keyword_categories:
+            scores[category_index] += self.empty_keyword_score(combined_text, title_length)
+        
+        return scores
+    
+    def weight_matrix(self):
+        """
+        Keyword-by-category weight matrix (NumPy), built on first use.
+        
+        Entry [k, c] is how many times keyword k is listed under category c.
+        """
+        if self._weight_matrix is None:
+            weights = np.zeros((len(self.keywords), len(self.categories)), dtype=np.int64)
+            for index, category_indexes in enumerate(self.keyword_categories):
+                for category_index in category_indexes:
+                    weights[index, category_index] += 1
+            self._weight_matrix = weights
+        return self._weight_matrix
+    
+    def _scan(self, text, pattern, prefixes, counts, in_title, title_length, weight_of=None):
+        """Count non-overlapping keyword hits in `text` with one trie search pass"""
+        lengths = self.lengths
+        next_free = {}
+        search = pattern.search
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            weight = weight_of(text, start) if weight_of else 1
+            for index in prefixes[match.group()]:
+                end = start + lengths[index]
+                if start >= next_free.get(index, 0):
+                    counts[index] += weight
+                    next_free[index] = end
+                if end <= title_length:
+                    in_title[index] = True
+            match = search(text, start + 1)
+    
+    def _scan_vocabulary(self, combined_text, counts):
+        """Count keyword hits through the distinct tokens of a long text"""
+        token_frequency = Counter(combined_text.split())
+        vocabulary = "\n".join(token_frequency)
+        
+        if self.token_pattern is not None:
+            def token_weight(text, position):
+                token_start = text.rfind("\n", 0, position) + 1
+                token_end = text.find("\n", position)
+                return token_frequency[text[token_start:token_end if token_end != -1 else None]]
+            
+            self._scan(vocabulary, self.token_pattern, self.token_prefixes, counts, [], -1, token_weight)
+        
+        for index, keyword, words in self.phrase_keywords:
+            if all(word in vocabulary for word in words):
+                counts[index] = combined_text.count(keyword)
+
+class _StemKeywordMatcher(_KeywordMatcher):
+    """
+    Keyword table matched on whole-word stems (matching="stems").
+    
+    Keywords and articles are reduced to sequences of word stems, and a
+    keyword scores once per non-overlapping occurrence of its stem sequence.
+    Keywords with the same stems ("menipu", "penipuan") are a single entry
+    counted once per category, so inflected variants need not be listed and
+    keywords never match inside unrelated words. Keywords without word
+    characters never match.
+    """
+    
+    def __init__(self, category_keywords: Dict[str, List[str]]):
+        from .text_normalizer import stem_phrase
+        self.categories = list(category_keywords)
+        self.keywords = []
+        self.keyword_categories = []
+        self.empty_keyword_categories = []
+        index_of = {}
+        
+        for category_index, keywords in enumerate(category_keywords.values()):
+            for keyword in keywords:
+                phrase = stem_phrase(keyword)
+                if not phrase:
+                    continue
+                if phrase not in index_of:
+                    index_of[phrase] = len(self.keywords)
+                    self.keywords.append(phrase)
+                    self.keyword_categories.append([])
+                if category_index not in self.keyword_categories[index_of[phrase]]:
+                    self.keyword_categories[index_of[phrase]].append(category_index)
+        
+        # Keyword indexes by first stem
+        self.by_first_stem = {}
+        for index, phrase in enumerate(self.keywords):
+            self.by_first_stem.setdefault(phrase[0], []).append(index)
+        self._weight_matrix = None
+    
+    def keyword_scores(self, combined_text: str, title_length: int) -> Dict[int, int]:
+        """
+        Score every keyword found in an article.
+        
+        Args:
+            combined_text (str): Lower-cased "title title body" text
+            title_length (int): Length of the lower-cased title prefix (0 if no title)
+            
+        Returns:
+            Dict[int, int]: Sparse map of keyword index -> occurrences plus title bonus
+        """
+        from .text_normalizer import stem_spans
+        spans = stem_spans(combined_text)
+        stems = [stem for stem, _ in spans]
+        counts, next_free, in_title = {}, {}, set()
+        for position, current in enumerate(stems):
+            for index in self.by_first_stem.get(current, ()):
+                phrase = self.keywords[index]
+                end = position + len(phrase)
+                if len(phrase) > 1 and tuple(stems[position:end]) != phrase:
+                    continue
+                if position >= next_free.get(index, 0):
+                    counts[index] = counts.get(index, 0) + 1
+                    next_free[index] = end
+                if spans[end - 1][1] <= title_length:
+                    in_title.add(index)
+        return {index: count + (2 if index in in_title else 0) for index, count in counts.items()}
+
+
+class _CategoryCache:
+    """
+    Bounded LRU cache of categorization results, optionally persisted.
+    
+    Keys are content hashes computed by NewsCategorizor (normalized title and
+    text plus the keyword table version), so entries never need explicit
+    invalidation: a keyword change simply produces new keys. When a
+    `cache_path` is given, results are also written to a small SQLite file
+    and survive restarts; in-memory misses fall back to that file.
+    """
+    
+    def __init__(self, max_size: int = 4096, cache_path: Optional[str] = None):
+        self.max_size = max_size
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        
+        if cache_path:
+            self._connection = connect_sqlite(cache_path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS categorization_cache ("
+                "key TEXT PRIMARY KEY, category TEXT NOT NULL)"
+            )
+            self._connection.commit()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached category for `key`, or None on a miss"""
+        with self._lock:
+            category = self._entries.get(key)
+            if category is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return category
+            
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT category FROM categorization_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    return row[0]
+            
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, category: str):
+        """Store a categorization result"""
+        self.put_many([(key, category)])
+    
+    def put_many(self, items: List[Tuple[str, str]]):
+        """Store several (key, category) results in one transaction"""
+        with self._lock:
+            for key, category in items:
+                self._remember(key, category)
+            if self._connection is not None and items:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO categorization_cache (key, category) VALUES (?, ?)",
+                    items
+                )
+                self._connection.commit()
+    
+    def clear(self):
+        """Drop all in-memory and persisted entries"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM categorization_cache")
+                self._connection.commit()
+    
+    def _remember(self, key: str, category: str):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = category
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def __len__(self):
+        return len(self._entries)
+
+
 class NewsCategorizor:
     """
     AI-powered news article categorizer for financial crime content.
@@ -46,6 +411,8 @@ class NewsCategorizor:
     - Case-insensitive matching
     - Extensible keyword system
     - Detailed logging of classification decisions
+    - Content-hash memoization of results (bounded LRU, optionally persisted)
+    - Optional trained linear or transformer backend in place of the keyword rules
     
     The classifier uses comprehensive keyword patterns for each category
     and assigns articles to the category with the highest keyword match score.
@@ -61,9 +428,35 @@ class NewsCategorizor:
     Usage:
         categorizer = NewsCategorizor()
         category = categorizer.categorize_article(article_dict)
+    
+    Args:
+        cache_size (int): Maximum number of results kept in the in-memory LRU
+            cache (0 disables memoization)
+        cache_path (str): Optional SQLite file to persist cached results
+        backend (str): "keywords" (rule-based scoring), "linear" (trained
+            hashed-feature classifier loaded from `model_path`) or
+            "transformer" (fine-tuned sequence classifier at `model_path`)
+        model_path (str): Directory of the trained model (transformer: also a
+            Hugging Face model name)
+        backend_options (dict): Extra keyword arguments for the model backend,
+            e.g. {"num_threads": 4, "quantize": True} for the transformer
+        matching (str): How keywords match the text: "substring" (raw
+            case-insensitive substrings) or "stems" (whole words after
+            Indonesian affix stripping, e.g. "tipu" matches "penipuan")
     """
     
-    def __init__(self):
+    BACKENDS = ("keywords", "linear", "transformer")
+    MATCHING_MODES = ("substring", "stems")
+    DEFAULT_MODEL_PATH = os.path.join("output", "classifier")
+    
+    def __init__(self, cache_size: int = 4096, cache_path: Optional[str] = None,
+                 backend: str = "keywords", model_path: Optional[str] = None,
+                 backend_options: Optional[Dict] = None, matching: str = "substring"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown categorizer backend '{backend}', expected one of {self.BACKENDS}")
+        if matching not in self.MATCHING_MODES:
+            raise ValueError(f"Unknown keyword matching '{matching}', expected one of {self.MATCHING_MODES}")
+        
         self.categories = [
             "Money Laundering",
             "Fraud", 
@@ -104,7 +497,111 @@ class NewsCategorizor:
             ]
         }
         
-        logger.info("NewsCategorizor initialized with keyword-based classification")
+        # Compiled keyword matcher, rebuilt whenever the keyword table changes
+        self.matching = matching
+        self._matcher = None
+        self._matcher_signature = None
+        self._keyword_version = None
+        
+        # Memoized categorization results keyed by content hash
+        self.cache = _CategoryCache(cache_size, cache_path) if cache_size > 0 or cache_path else None
+        
+        # Trained model backend, loaded on first use
+        self.backend = backend
+        self.model_path = model_path or self.DEFAULT_MODEL_PATH
+        self.backend_options = backend_options or {}
+        self._classifier = None
+        
+        logger.info(f"NewsCategorizor initialized with {'keyword-based' if backend == 'keywords' else backend + ' model'} classification")
+    
+    def _keyword_signature(self) -> Tuple:
+        """Snapshot of the keyword table (and matching mode) used to detect changes"""
+        keywords = tuple((category, tuple(keywords)) for category, keywords in self.category_keywords.items())
+        return keywords if self.matching == "substring" else (self.matching,) + keywords
+    
+    def _get_matcher(self) -> _KeywordMatcher:
+        """Return the compiled keyword matcher, recompiling it if keywords changed"""
+        signature = self._keyword_signature()
+        if signature != self._matcher_signature:
+            matcher_class = _StemKeywordMatcher if self.matching == "stems" else _KeywordMatcher
+            self._matcher = matcher_class(self.category_keywords)
+            self._matcher_signature = signature
+            self._keyword_version = hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:16]
+        return self._matcher
+    
+    @property
+    def keyword_version(self) -> str:
+        """Short hash identifying the current keyword table"""
+        self._get_matcher()
+        return self._keyword_version
+    
+    @property
+    def classifier(self):
+        """Model of the "linear" or "transformer" backend (None for keywords)"""
+        if self._classifier is None and self.backend == "linear":
+            from .linear_classifier import LinearTextClassifier
+            self._classifier = LinearTextClassifier.load(self.model_path, **self.backend_options)
+            logger.info(f"Loaded linear classifier {self._classifier.version} from {self.model_path}")
+        elif self._classifier is None and self.backend == "transformer":
+            # The model itself is loaded on the first prediction
+            from .transformer_classifier import TransformerTextClassifier
+            self._classifier = TransformerTextClassifier(self.model_path, **self.backend_options)
+        return self._classifier
+    
+    @property
+    def model_version(self) -> str:
+        """Identifier of whatever currently decides categories"""
+        if self.backend != "keywords":
+            return f"{self.backend}:{self.classifier.version}"
+        return self.keyword_version
+    
+    def _cache_key(self, article_text, title) -> str:
+        """
+        Content hash of an article for memoization.
+        
+        The text is normalized by lower-casing only, since scoring works on the
+        lower-cased text; anything else (e.g. whitespace) can change scores.
+        """
+        digest = hashlib.sha1()
+        digest.update(self.model_version.encode('utf-8'))
+        digest.update(b'\x00T' if title else b'\x00-')
+        digest.update(f"{title}".lower().encode('utf-8', 'surrogatepass'))
+        digest.update(b'\x00')
+        digest.update(f"{article_text}".lower().encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Return memoization statistics (hits, misses, current size)"""
+        if self.cache is None:
+            return {'hits': 0, 'misses': 0, 'size': 0}
+        return {'hits': self.cache.hits, 'misses': self.cache.misses, 'size': len(self.cache)}
+    
+    def clear_cache(self):
+        """Forget all memoized categorization results"""
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def get_category_scores(self, article_text: str, title: str = "") -> Dict[str, int]:
+        """
+        Compute the keyword score of every category for an article.
+        
+        Each keyword occurrence in the combined text (title counted twice plus
+        the body) scores one point, and a keyword present in the title scores
+        two bonus points.
+        
+        Args:
+            article_text (str): The full text content of the article
+            title (str): The title of the article (optional)
+            
+        Returns:
+            Dict[str, int]: Score per category (excluding "Other/Uncategorized")
+        """
+        matcher = self._get_matcher()
+        # Combine title and content for analysis (title has higher weight)
+        combined_text = f"{title} {title} {article_text}".lower()
+        title_length = len(f"{title}".lower()) if title else 0
+        scores = matcher.score(combined_text, title_length)
+        return dict(zip(matcher.categories, scores))
     
     def categorize_article(self, article_text: str, title: str = "") -> str:
         """
@@ -122,24 +619,21 @@ class NewsCategorizor:
                 logger.warning("Empty article text provided")
                 return "Other/Uncategorized"
             
-            # Combine title and content for analysis (title has higher weight)
-            combined_text = f"{title} {title} {article_text}".lower()
+            cache_key = self._cache_key(article_text, title) if self.cache is not None else None
+            if cache_key is not None:
+                cached_category = self.cache.get(cache_key)
+                if cached_category is not None:
+                    logger.debug(f"Article categorized as: {cached_category} (cached)")
+                    return cached_category
+            
+            if self.backend != "keywords":
+                best_category = self._classify([article_text], [title])[0]
+                logger.info(f"Article categorized as: {best_category} ({self.backend} model)")
+                if cache_key is not None:
+                    self.cache.put(cache_key, best_category)
+                return best_category
             
-            # Score each category based on keyword matches
-            category_scores = {}
-            
-            for category, keywords in self.category_keywords.items():
-                score = 0
-                for keyword in keywords:
-                    # Count occurrences of each keyword
-                    matches = len(re.findall(re.escape(keyword.lower()), combined_text))
-                    score += matches
-                    
-                    # Bonus points for title matches
-                    if title and keyword.lower() in title.lower():
-                        score += 2
-                
-                category_scores[category] = score
+            category_scores = self.get_category_scores(article_text, title)
             
             # Find the category with the highest score
             best_category = max(category_scores, key=category_scores.get)
@@ -152,12 +646,148 @@ class NewsCategorizor:
             logger.debug(f"Category scores: {category_scores}")
             logger.info(f"Article categorized as: {best_category} (score: {max_score})")
             
+            if cache_key is not None:
+                self.cache.put(cache_key, best_category)
+            
             return best_category
             
         except Exception as e:
             logger.error(f"Error in categorization: {str(e)}")
             return "Other/Uncategorized"
     
+    def categorize_batch(self, articles, text_column: str = "full_text", title_column: str = "title") -> List[str]:
+        """
+        Categorize many articles at once.
+        
+        Keyword hits of all articles are collected into one sparse
+        document-by-keyword matrix (COO triplets), and category scores for the
+        whole batch are computed with a single NumPy product against the
+        keyword-by-category weight matrix. With a model backend ("linear" or
+        "transformer") the whole batch is scored by the model instead. Results match
+        categorize_article() for every article with a text; missing titles or
+        texts (None/NaN) are treated as empty. Memoized results are reused and
+        new ones cached.
+        
+        Args:
+            articles: pandas DataFrame or list of article dictionaries
+            text_column (str): Column/key holding the article text
+            title_column (str): Column/key holding the article title
+            
+        Returns:
+            List[str]: Assigned category per article, in input order
+        """
+        texts, titles = self._batch_columns(articles, text_column, title_column)
+        document_count = len(texts)
+        if document_count == 0:
+            return []
+        
+        if self.backend != "keywords":
+            return self._classify_batch(texts, titles)
+        
+        matcher = self._get_matcher()
+        rows, columns, values = [], [], []
+        empty_keyword_scores = np.zeros(document_count, dtype=np.int64)
+        has_text = np.zeros(document_count, dtype=bool)
+        cached_results = {}
+        cache_keys = {}
+        
+        for row, (article_text, title) in enumerate(zip(texts, titles)):
+            if not article_text:
+                continue
+            has_text[row] = True
+            if self.cache is not None:
+                cache_key = self._cache_key(article_text, title)
+                cached_category = self.cache.get(cache_key)
+                if cached_category is not None:
+                    cached_results[row] = cached_category
+                    continue
+                cache_keys[row] = cache_key
+            combined_text = f"{title} {title} {article_text}".lower()
+            title_length = len(title.lower()) if title else 0
+            for index, keyword_score in matcher.keyword_scores(combined_text, title_length).items():
+                rows.append(row)
+                columns.append(index)
+                values.append(keyword_score)
+            if matcher.empty_keyword_categories:
+                empty_keyword_scores[row] = matcher.empty_keyword_score(combined_text, title_length)
+        
+        # scores = counts (sparse, documents x keywords) @ weights (keywords x categories)
+        scores = np.zeros((document_count, len(matcher.categories)), dtype=np.int64)
+        if rows:
+            rows = np.asarray(rows, dtype=np.intp)
+            weighted = np.asarray(values, dtype=np.int64)[:, None] * matcher.weight_matrix()[columns]
+            np.add.at(scores, rows, weighted)
+        for category_index in matcher.empty_keyword_categories:
+            scores[:, category_index] += empty_keyword_scores
+        
+        categories = list(matcher.categories) + ["Other/Uncategorized"]
+        if scores.shape[1]:
+            best = scores.argmax(axis=1)
+            best[scores.max(axis=1) == 0] = len(categories) - 1
+        else:
+            best = np.full(document_count, len(categories) - 1)
+        best[~has_text] = len(categories) - 1
+        
+        results = [categories[index] for index in best]
+        for row, cached_category in cached_results.items():
+            results[row] = cached_category
+        if cache_keys:
+            self.cache.put_many([(cache_key, results[row]) for row, cache_key in cache_keys.items()])
+        
+        logger.info(f"Batch categorized {document_count} articles ({len(cached_results)} from cache)")
+        return results
+    
+    def _classify(self, texts: List[str], titles: List[str]) -> List[str]:
+        """Predict categories with the model backend"""
+        from .linear_classifier import article_text
+        return self.classifier.predict([article_text(title, text) for text, title in zip(texts, titles)])
+    
+    def _classify_batch(self, texts: List[str], titles: List[str]) -> List[str]:
+        """Batch categorization with a model backend (memoized like the keyword path)"""
+        results = ["Other/Uncategorized"] * len(texts)
+        pending, cache_keys = [], {}
+        for row, (article_text, title) in enumerate(zip(texts, titles)):
+            if not article_text:
+                continue
+            if self.cache is not None:
+                cache_key = self._cache_key(article_text, title)
+                cached_category = self.cache.get(cache_key)
+                if cached_category is not None:
+                    results[row] = cached_category
+                    continue
+                cache_keys[row] = cache_key
+            pending.append(row)
+        
+        if pending:
+            predictions = self._classify([texts[row] for row in pending], [titles[row] for row in pending])
+            for row, category in zip(pending, predictions):
+                results[row] = category
+        if cache_keys:
+            self.cache.put_many([(cache_key, results[row]) for row, cache_key in cache_keys.items()])
+        
+        logger.info(f"Batch categorized {len(texts)} articles with the {self.backend} model "
+                    f"({len(texts) - len(pending)} from cache or empty)")
+        return results
+    
+    @staticmethod
+    def _batch_columns(articles, text_column: str, title_column: str) -> Tuple[List[str], List[str]]:
+        """Extract (texts, titles) from a DataFrame or a list of article dicts"""
+        if hasattr(articles, "columns"):
+            length = len(articles)
+            texts = articles[text_column].tolist() if text_column in articles.columns else [""] * length
+            titles = articles[title_column].tolist() if title_column in articles.columns else [""] * length
+        else:
+            texts = [article.get(text_column, "") for article in articles]
+            titles = [article.get(title_column, "") for article in articles]
+        
+        def clean(value):
+            # None and NaN (NaN != NaN) become empty strings
+            if value is None or (isinstance(value, float) and value != value):
+                return ""
+            return str(value)
+        
+        return [clean(text) for text in texts], [clean(title) for title in titles]
+    
     def get_categories(self) -> List[str]:
         """Return list of available categories"""
         return self.categories.copy()
@@ -186,6 +816,33 @@ class NewsCategorizor:
             logger.error(f"Error adding keywords: {str(e)}")
             return False
     
+    def remove_keywords(self, category: str, keywords: List[str]) -> bool:
+        """
+        Remove keywords from a specific category
+        
+        Args:
+            category (str): The category name
+            keywords (List[str]): Keywords to remove (case-insensitive)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            if category not in self.category_keywords:
+                logger.error(f"Category '{category}' not found")
+                return False
+            
+            to_remove = {keyword.lower() for keyword in keywords}
+            current = self.category_keywords[category]
+            self.category_keywords[category] = [kw for kw in current if kw.lower() not in to_remove]
+            removed = len(current) - len(self.category_keywords[category])
+            logger.info(f"Removed {removed} keywords from category '{category}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error removing keywords: {str(e)}")
+            return False
+    
     def get_category_statistics(self, articles_data: List[Dict]) -> Dict[str, int]:
         """
         Get statistics of categorized articles
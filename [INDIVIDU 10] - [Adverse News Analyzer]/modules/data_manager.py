@@ -4,24 +4,53 @@ Data Manager Module
 Handles all data persistence operations for the AML News Analysis system.
 
 This module provides:
-- CSV-based data storage with duplicate prevention
+- CSV, SQLite or Parquet article storage with duplicate prevention (see article_store.py)
 - Session-specific logging and file management
-- Article statistics and analytics
+- Article statistics and analytics, materialized and updated at ingest
+- Paged queries (recent, by source/category/date range) with keyset cursors
 - AI-powered categorization integration
 - Dual file output (main CSV + session-specific files)
+- Optional CPU/memory profiling of a session
+- Inverted keyword index for incremental re-categorization
+- Full-text search (SQLite FTS5) over titles and article texts
+- Entity extraction (banks, agencies, persons) into an entity -> article index
+- Watchlist screening of new articles with fuzzy name matching
+- Incremental clustering of articles into cases with timelines
+- Incrementally maintained per-entity risk scores
 
-The system maintains a main CSV file for all articles and creates
-session-specific files for each scraping run with detailed logging.
+The system maintains a main article store (articles.csv, or articles.db /
+articles_parquet/ once migrated to SQLite / Parquet) and creates session-specific files for each scraping run
+with detailed logging.
 
 Author: AI Assistant
 Date: July 31, 2025
 Version: 1.0
 """
 
-import pandas as pd
+import contextlib
 import os
+import uuid
+from collections import deque
 from datetime import datetime
+from ._lazy import lazy_import
+from .article_stats import ArticleStatistics
+from .article_store import (append_csv, canonical_url, category_key, create_store, detect_backend, page_cursor,
+                            record_backend, typed_frame)
+from .case_clustering import CaseClusterer
 from .categorizer import NewsCategorizor
+from .entity_extractor import EntityExtractor, EntityIndex
+from .keyword_index import KeywordIndex
+from .search_index import SearchIndex
+from .session_log import SessionLog
+from .risk_scoring import RiskScoreStore
+from .watchlist import ScreeningAlerts, Watchlist, capitalized_words
+from .profiler import SessionProfiler
+
+# pandas is only loaded when articles are actually read or written
+pd = lazy_import("pandas")
+
+# Most recent log lines kept in memory (the full log streams to the session log file)
+LOG_TAIL = 200
 
 class DataManager:
     """
@@ -43,23 +72,38 @@ class DataManager:
     
     Attributes:
         output_dir (str): Directory for output files
-        csv_file (str): Path to main CSV file
+        storage (str): Article store backend, "csv", "sqlite" or "parquet"
+        store (ArticleStore): Main article store
+        csv_file (str): Path to main CSV file (the CSV export with SQLite/Parquet storage)
         session_datetime (str): Timestamp for current session
         session_csv_file (str): Path to session-specific CSV
-        session_log_file (str): Path to session log file
+        session_log_file (str): Path to session log file (.jsonl with log_format="json")
+        session_log (SessionLog): Streaming writer of the session log, or None when disabled
         csv_schema (list): Column names for CSV structure
         categorizer (NewsCategorizor): AI categorization instance
-        log_messages (list): Session log message buffer
+        log_messages (deque): Most recent session log lines (at most LOG_TAIL)
+        profiler (SessionProfiler): Session profiler, or None when profiling is off
+        article_stats (ArticleStatistics): Materialized statistics updated at ingest
+        keyword_index (KeywordIndex): Term -> article index maintained at ingest
+        search_index (SearchIndex): Full-text index maintained at ingest
+        entity_extractor (EntityExtractor): Gazetteer/person entity extractor
+        entity_index (EntityIndex): Entity -> article index maintained at ingest
+        watchlist_file (str): Watchlist of names screened at ingest (optional)
+        screening_alerts (ScreeningAlerts): Stored watchlist hits per article
+        case_clusterer (CaseClusterer): Article -> case clusters maintained at ingest
+        risk_scores (RiskScoreStore): Per-entity risk scores maintained at ingest
     """
     
-    def __init__(self, output_dir="output"):
+    def __init__(self, output_dir="output", profile=False, categorizer=None, watchlist_file=None,
+                 storage=None, session_log=True, log_format="text"):
         self.output_dir = output_dir
         self.csv_file = os.path.join(output_dir, "articles.csv")
         
         # Generate datetime stamp for this session
         self.session_datetime = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_csv_file = os.path.join(output_dir, f"articles_{self.session_datetime}.csv")
-        self.session_log_file = os.path.join(output_dir, f"process_log_{self.session_datetime}.txt")
+        log_extension = "jsonl" if log_format == "json" else "txt"
+        self.session_log_file = os.path.join(output_dir, f"process_log_{self.session_datetime}.{log_extension}")
         
         self.csv_schema = [
             "title",
@@ -70,101 +114,140 @@ class DataManager:
             "full_text"
         ]
         
-        # Initialize log for this session
-        self.log_messages = []
+        # Initialize log for this session; lines are appended to the file as they are logged
+        self.log_messages = deque(maxlen=LOG_TAIL)
+        self.session_log = None
+        if session_log:
+            self.session_log = SessionLog(self.session_log_file, session=self.session_datetime,
+                                          json_lines=log_format == "json")
         self._log(f"=== AML News Analysis Session Started ===")
         self._log(f"Session DateTime: {self.session_datetime}")
         self._log(f"Output CSV: articles_{self.session_datetime}.csv")
-        self._log(f"Process Log: process_log_{self.session_datetime}.txt")
+        self._log(f"Process Log: {os.path.basename(self.session_log_file)}")
         
         # Initialize categorizer for automatic categorization
-        self.categorizer = NewsCategorizor()
-        self._log("AI Categorizer initialized")
+        self.categorizer = categorizer or NewsCategorizor()
+        self._log(f"AI Categorizer initialized ({self.categorizer.backend} backend)")
         
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         self._log(f"Output directory ensured: {self.output_dir}")
         
-        # Initialize CSV file if it doesn't exist
-        if not os.path.exists(self.csv_file):
+        # Main article store: SQLite/Parquet once output/articles.db or articles_parquet/ exists, else CSV
+        self.storage = storage or detect_backend(output_dir)
+        self.store = create_store(self.storage, output_dir, self.csv_schema)
+        
+        # Aggregates behind get_statistics(), updated with every saved batch
+        self.article_stats = ArticleStatistics(os.path.join(output_dir, "article_stats.json"))
+        
+        # Inverted keyword index (opened lazily on first use)
+        self.keyword_index = KeywordIndex(os.path.join(output_dir, "keyword_index.db"))
+        
+        # Full-text search index (opened lazily on first use)
+        self.search_index = SearchIndex(os.path.join(output_dir, "search.db"))
+        
+        # Entity extraction and entity -> article index (opened lazily on first use)
+        self.entity_extractor = EntityExtractor()
+        self.entity_index = EntityIndex(os.path.join(output_dir, "entities.db"))
+        
+        # Watchlist screening (active when the watchlist file exists)
+        self.watchlist_file = watchlist_file or os.path.join(output_dir, "watchlist.csv")
+        self._watchlist = None
+        self._watchlist_mtime = None
+        self.screening_alerts = ScreeningAlerts(os.path.join(output_dir, "screening.db"))
+        
+        # Case clusters with timelines (opened lazily on first use)
+        self.case_clusterer = CaseClusterer(os.path.join(output_dir, "cases.db"))
+        
+        # Per-entity risk scores (opened lazily on first use)
+        self.risk_scores = RiskScoreStore(os.path.join(output_dir, "risk_scores.db"))
+        
+        # Initialize the store if it doesn't exist
+        if not self.store.exists():
             self.initialize_csv()
+        
+        # Start profiling the session if requested
+        self.profiler = None
+        if profile:
+            self.start_profiling()
     
     def _log(self, message):
-        """Add message to session log"""
+        """Add message to session log (queued for the log file, never waits on disk I/O)"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         self.log_messages.append(log_entry)
+        if self.session_log is not None:
+            self.session_log.write(message)
         print(log_entry)  # Also print to console
     
     def save_session_log(self):
-        """Save all logged messages to the session log file"""
+        """Wait until every logged message has been written to the session log file"""
+        if self.session_log is None:
+            return False
         try:
-            with open(self.session_log_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.log_messages))
+            self.session_log.flush()
             self._log(f"Session log saved to: {self.session_log_file}")
             return True
         except Exception as e:
             print(f"❌ Error saving session log: {str(e)}")
             return False
     
+    def close_session_log(self):
+        """Write the remaining log lines and close the session log file"""
+        if self.session_log is not None:
+            self.session_log.close()
+    
+    def start_profiling(self):
+        """Start CPU sampling and allocation tracing for this session"""
+        if self.profiler is None:
+            self.profiler = SessionProfiler(self.output_dir, self.session_datetime)
+        if not self.profiler.is_running:
+            self.profiler.start()
+            self._log("⏱️ Profiling enabled for this session")
+    
+    def stop_profiling(self):
+        """
+        Stop profiling and write the results next to the session log.
+        
+        Returns:
+            dict: Paths of the written profile files (empty if profiling was off)
+        """
+        if self.profiler is None or not self.profiler.is_running:
+            return {}
+        
+        paths = self.profiler.stop()
+        self._log(f"⏱️ CPU profile (folded stacks) saved to: {paths['cpu_profile']}")
+        self._log(f"⏱️ Memory profile saved to: {paths['memory_profile']}")
+        self.save_session_log()
+        return paths
+    
     def save_article(self, article_data):
         """Save a single article to CSV with automatic categorization"""
         try:
-            # Check if article already exists
-            if self.check_duplicate(article_data.get('url', '')):
-                self._log(f"🔄 Duplicate found, skipping: {article_data.get('title', 'Unknown')[:50]}...")
-                return False
-            
-            # Auto-categorize the article if category is not provided or empty
-            if not article_data.get('category') or article_data.get('category') == '':
-                article_title = article_data.get('title', '')
-                article_text = article_data.get('full_text', '')
-                article_data['category'] = self.categorizer.categorize_article(article_text, article_title)
-                self._log(f"🏷️  Auto-categorized as: {article_data['category']}")
-            
-            # Create DataFrame with single article
-            df_new = pd.DataFrame([article_data])
-            
-            # Ensure all required columns are present
-            for col in self.csv_schema:
-                if col not in df_new.columns:
-                    df_new[col] = ''
-            
-            # Reorder columns to match schema
-            df_new = df_new[self.csv_schema]
-            
-            # Save to both main CSV and session CSV
-            # Main CSV (append to existing)
-            if os.path.exists(self.csv_file):
-                df_new.to_csv(self.csv_file, mode='a', header=False, index=False, encoding='utf-8')
-            else:
-                df_new.to_csv(self.csv_file, mode='w', header=True, index=False, encoding='utf-8')
-            
-            # Session CSV (append to session-specific file)
-            if os.path.exists(self.session_csv_file):
-                df_new.to_csv(self.session_csv_file, mode='a', header=False, index=False, encoding='utf-8')
-            else:
-                df_new.to_csv(self.session_csv_file, mode='w', header=True, index=False, encoding='utf-8')
-            
-            self._log(f"✅ Saved: {article_data.get('title', 'Unknown')[:50]}...")
-            return True
+            return self._save_articles([article_data]) == 1
             
         except Exception as e:
             self._log(f"❌ Error saving article: {str(e)}")
             return False
     
     def save_articles_batch(self, articles_list):
-        """Save multiple articles to CSV, checking for duplicates"""
-        saved_count = 0
-        duplicate_count = 0
+        """
+        Save multiple articles, checking for duplicates.
         
+        The batch is deduplicated against the store and within itself, the
+        new articles without a category are categorized in one call, and all
+        rows are appended to the main store and to the session CSV with one
+        write each. If the batch fails, its articles are saved one by one, so
+        one bad article does not lose the others.
+        """
         self._log(f"📦 Starting batch save of {len(articles_list)} articles")
         
-        for article in articles_list:
-            if self.save_article(article):
-                saved_count += 1
-            else:
-                duplicate_count += 1
+        try:
+            saved_count = self._save_articles(articles_list)
+        except Exception as e:
+            self._log(f"❌ Error saving batch, saving articles one by one: {str(e)}")
+            saved_count = sum(self.save_article(article_data) for article_data in articles_list)
+        duplicate_count = len(articles_list) - saved_count
         
         self._log(f"📊 Batch save complete: {saved_count} new, {duplicate_count} duplicates")
         
@@ -173,46 +256,716 @@ class DataManager:
         
         return saved_count
     
-    def load_articles(self):
-        """Load all articles from CSV"""
+    def _save_articles(self, articles_list):
+        """Dedup, categorize, write and index a list of articles; returns the number saved"""
+        # Check which articles already exist (or repeat earlier ones in the batch)
+        try:
+            existing = self.store.existing_urls(
+                article.get('url', '') for article in articles_list
+            ) if self.store.exists() else set()
+        except Exception as e:
+            print(f"⚠️ Warning - error checking duplicates: {str(e)}")
+            existing = set()  # If error checking, allow saving to avoid data loss
+        
+        new_articles = []
+        for article_data in articles_list:
+            article_id = self._article_id(article_data.get('url', ''))
+            if article_id in existing:
+                self._log(f"🔄 Duplicate found, skipping: {article_data.get('title', 'Unknown')[:50]}...")
+                continue
+            existing.add(article_id)
+            new_articles.append(article_data)
+        if not new_articles:
+            return 0
+        
+        # Auto-categorize the articles whose category is not provided or empty
+        uncategorized = [article for article in new_articles if not article.get('category')]
+        if uncategorized:
+            categories = self.categorizer.categorize_batch(uncategorized)
+            for article_data, category in zip(uncategorized, categories):
+                article_data['category'] = category
+                self._log(f"🏷️  Auto-categorized as: {category}")
+        
+        # Save to the main store in one write under its write lock, which other processes
+        # share: the URL check is repeated inside it, so no article is stored twice. The
+        # derived indexes are updated under the same lock, so the clustering and risk
+        # updates of concurrent writers are applied one after the other
+        with self.store.locked():
+            if self.store.exists():
+                stored_ids = self.store.existing_urls(article.get('url', '') for article in new_articles)
+                if stored_ids:
+                    self._log(f"🔄 {len(stored_ids)} articles were saved concurrently by another writer")
+                    new_articles = [article for article in new_articles
+                                    if self._article_id(article.get('url', '')) not in stored_ids]
+            if not new_articles:
+                return 0
+            before = self.store.stamp()
+            stored = self.store.append(new_articles)
+            if stored < len(new_articles):
+                self.article_stats.invalidate()
+            elif stored:
+                self.article_stats.add(new_articles, before, self.store.stamp())
+            if not stored:
+                return 0
+            for article_data in new_articles:
+                self._index_article(article_data)
+        
+        # Session CSV (append to session-specific file), columns in schema order
+        df_new = pd.DataFrame(new_articles).reindex(columns=self.csv_schema, fill_value='')
+        append_csv(self.session_csv_file, df_new)
+        
+        for article_data in new_articles:
+            self._log(f"✅ Saved: {article_data.get('title', 'Unknown')[:50]}...")
+        return stored
+    
+    @staticmethod
+    def _article_id(url):
+        """
+        Canonical article ID (the URL as used for duplicate checks).
+        
+        Articles without a URL are never duplicates, so each gets a unique ID.
+        """
+        article_id = canonical_url(url) if isinstance(url, str) else ''
+        return article_id or f"#{uuid.uuid4().hex}"
+    
+    def _index_article(self, article_data):
+        """Add a saved article to the keyword, search and entity indexes (never fails the save)"""
+        article_id = self._article_id(article_data.get('url', ''))
+        title = article_data.get('title', '')
+        full_text = article_data.get('full_text', '')
+        try:
+            self.keyword_index.add_article(article_id, f"{title} {full_text}")
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not index article: {str(e)}")
+        try:
+            self.search_index.add_article(article_id, article_data)
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not add article to the search index: {str(e)}")
+        try:
+            entities = self.entity_extractor.extract(full_text, title)
+            self.entity_index.add_article(article_id, entities)
+            if entities:
+                self._log(f"🏛️  Entities: {', '.join(entity for entity, _ in list(entities)[:5])}")
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not extract entities: {str(e)}")
+            return
+        try:
+            self._screen_article(article_id, entities, f"{title} {full_text}")
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not screen article: {str(e)}")
+        try:
+            self.case_clusterer.add_article(article_id, article_data, entities)
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not cluster article: {str(e)}")
+        try:
+            self.risk_scores.add_article(article_id, article_data, entities)
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not update risk scores: {str(e)}")
+    
+    @property
+    def watchlist(self):
+        """Watchlist loaded from `watchlist_file` (reloaded when the file changes), or None"""
+        if not os.path.exists(self.watchlist_file):
+            self._watchlist = None
+            return None
+        mtime = os.path.getmtime(self.watchlist_file)
+        if self._watchlist is None or mtime != self._watchlist_mtime:
+            self._watchlist = Watchlist.from_file(self.watchlist_file)
+            self._watchlist_mtime = mtime
+            self._log(f"🚨 Watchlist loaded: {len(self._watchlist)} names")
+        return self._watchlist
+    
+    def _screen_article(self, article_id, entities, text=''):
+        """Screen the entities (and capitalized words of `text`) of an article against the watchlist and store alerts"""
+        watchlist = self.watchlist
+        if watchlist is None:
+            return []
+        hits = watchlist.screen((entity for entity, _ in entities), capitalized_words(text))
+        self.screening_alerts.add_alerts(article_id, hits)
+        for hit in hits:
+            self._log(f"🚨 Watchlist hit: {hit['watchlist_name']} "
+                      f"(matched \"{hit['matched_text']}\", score {hit['score']:.2f})")
+        return hits
+    
+    def rescreen_articles(self):
+        """
+        Screen every stored article again, e.g. after the watchlist changed.
+        
+        Returns:
+            int: Number of stored alerts
+        """
+        try:
+            if self.watchlist is None:
+                self._log("⚠️ No watchlist found, nothing to screen")
+                return 0
+            df = self.load_articles()
+            self.screening_alerts.clear()
+            alert_count = 0
+            for row in df[['url', 'title', 'full_text']].fillna('').itertuples(index=False):
+                entities = self.entity_extractor.extract(row.full_text, row.title)
+                alert_count += len(self._screen_article(self._article_id(row.url), entities,
+                                                        f"{row.title} {row.full_text}"))
+            self._log(f"🚨 Screening complete: {len(df)} articles, {alert_count} alerts")
+            return alert_count
+        except Exception as e:
+            self._log(f"❌ Error screening articles: {str(e)}")
+            return 0
+    
+    def get_screening_alerts(self, limit=None):
+        """
+        Stored watchlist alerts joined with their articles, newest first.
+        
+        Only the alerted articles are read from the store (by URL).
+        
+        Returns:
+            DataFrame: Alert columns plus the article title, source and date
+        """
+        columns = ['article_id', 'watchlist_name', 'matched_text', 'score', 'created_at']
+        try:
+            alerts = pd.DataFrame(self.screening_alerts.alerts(limit=limit), columns=columns)
+            if alerts.empty:
+                return alerts
+            df = self.store.load_by_urls(alerts['article_id'].unique(),
+                                         columns=['title', 'url', 'source_name', 'publication_date'])
+            df['article_id'] = df['url'].map(self._article_id)
+            return alerts.merge(
+                df[['article_id', 'title', 'url', 'source_name', 'publication_date']],
+                on='article_id', how='left'
+            )
+        except Exception as e:
+            self._log(f"❌ Error loading screening alerts: {str(e)}")
+            return pd.DataFrame(columns=columns)
+    
+    def _write_categories(self, df):
+        """
+        Write the categories of `df` back to the store by URL (articles
+        without a URL by their title and text, see category_key()).
+        
+        The store applies them under its write lock (reading the current
+        articles there), so articles appended meanwhile by another process
+        are kept.
+        """
+        self.store.update_categories({
+            category_key(url, title, full_text): category
+            for url, title, full_text, category in zip(df['url'], df['title'], df['full_text'], df['category'])
+        })
+        self.article_stats.invalidate()
+    
+    def recategorize_articles(self):
+        """
+        Re-run categorization over every stored article in one batch.
+        
+        Used after the categorizer keywords change. The store is replaced
+        atomically so readers never see a half-written corpus, under its
+        write lock so articles saved meanwhile by other processes are kept.
+        
+        Returns:
+            int: Number of articles whose category changed
+        """
+        try:
+            df = self.load_articles()
+            if len(df) == 0:
+                return 0
+            
+            self._log(f"🏷️  Recategorizing {len(df)} articles...")
+            new_categories = pd.Series(self.categorizer.categorize_batch(df), index=df.index)
+            changed = int((df['category'].astype(str) != new_categories).sum())
+            df['category'] = new_categories
+            self._write_categories(df)
+            self._update_risk_scores(df)
+            
+            self._log(f"✅ Recategorization complete: {changed} categories changed")
+            return changed
+            
+        except Exception as e:
+            self._log(f"❌ Error recategorizing articles: {str(e)}")
+            return 0
+    
+    def bulk_recategorize(self, workers=None, chunk_size=None, progress=None):
+        """
+        Recategorize the whole store in parallel without loading it into memory.
+        
+        The CSV is streamed in chunks to a process pool (see bulk_categorizer.py)
+        and replaced atomically when all chunks are done. With SQLite or Parquet
+        storage the job runs on a CSV export and the new categories are written
+        back with one update_categories() call, keyed by URL (articles without
+        a URL by their title and text, see category_key()).
+        
+        Args:
+            workers (int): Worker processes (default: all cores)
+            chunk_size (int): Articles per chunk
+            progress (callable): Progress callback, called after every chunk
+            
+        Returns:
+            dict: rows, changed, elapsed and rate, or None on error
+        """
+        from .bulk_categorizer import DEFAULT_CHUNK_SIZE, bulk_recategorize
+        try:
+            if not self.store.exists():
+                return None
+            self._log(f"🏷️  Bulk recategorization started ({workers or os.cpu_count()} workers)")
+            csv_file = self.csv_file
+            # The CSV store is rewritten in place, so other writers wait for the job
+            write_lock = self.store.locked() if self.storage == "csv" else contextlib.nullcontext()
+            if self.storage != "csv":
+                csv_file = os.path.join(self.output_dir, "articles_bulk.csv")
+                self.store.export_csv(csv_file)
+            try:
+                with write_lock:
+                    result = bulk_recategorize(
+                        csv_file,
+                        self.categorizer,
+                        workers=workers,
+                        chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                        progress=progress
+                    )
+                if self.storage != "csv":
+                    categories = {}
+                    for chunk in pd.read_csv(csv_file, usecols=['url', 'title', 'full_text', 'category'],
+                                             chunksize=50000, encoding='utf-8', keep_default_na=False):
+                        categories.update(
+                            (category_key(url, title, full_text), category)
+                            for url, title, full_text, category in zip(chunk['url'], chunk['title'],
+                                                                       chunk['full_text'], chunk['category'])
+                        )
+                    self.store.update_categories(categories)
+                self.article_stats.invalidate()
+                if result['changed']:
+                    for chunk in pd.read_csv(csv_file, usecols=['url', 'source_name', 'publication_date', 'category'],
+                                             chunksize=50000, encoding='utf-8', keep_default_na=False):
+                        self._update_risk_scores(chunk)
+            finally:
+                if csv_file != self.csv_file and os.path.exists(csv_file):
+                    os.remove(csv_file)
+            self._log(f"✅ Bulk recategorization complete: {result['rows']} articles, "
+                      f"{result['changed']} changed, {result['rate']:.0f} articles/s")
+            return result
+        except Exception as e:
+            self._log(f"❌ Error in bulk recategorization: {str(e)}")
+            return None
+    
+    def rebuild_keyword_index(self, df=None):
+        """
+        Rebuild the keyword index from the stored articles.
+        
+        Args:
+            df (DataFrame): Already loaded articles (loaded from CSV if omitted)
+            
+        Returns:
+            int: Number of indexed articles
+        """
+        try:
+            if df is None:
+                df = self.load_articles()
+            self.keyword_index.clear()
+            self.keyword_index.add_articles(
+                (self._article_id(row.url), f"{row.title} {row.full_text}")
+                for row in df[['url', 'title', 'full_text']].fillna('').itertuples(index=False)
+            )
+            self._log(f"🗂️  Keyword index rebuilt: {len(df)} articles")
+            return len(df)
+        except Exception as e:
+            self._log(f"❌ Error rebuilding keyword index: {str(e)}")
+            return 0
+    
+    def rebuild_search_index(self, df=None):
+        """
+        Rebuild the full-text search index from the stored articles.
+        
+        Args:
+            df (DataFrame): Already loaded articles (loaded from the store if omitted)
+            
+        Returns:
+            int: Number of indexed articles
+        """
+        try:
+            if df is None:
+                df = self.load_articles()
+            self.search_index.clear()
+            indexed = self.search_index.add_articles(
+                (self._article_id(article.get('url', '')), article) for article in df.to_dict('records')
+            )
+            self._log(f"🔎 Search index rebuilt: {indexed} articles")
+            return indexed
+        except Exception as e:
+            self._log(f"❌ Error rebuilding search index: {str(e)}")
+            return 0
+    
+    def search_articles(self, query, limit=20, source=None):
+        """
+        Full-text search over titles and article texts.
+        
+        Args:
+            query (str): Words (all required), "quoted phrases" and prefix* words,
+                e.g. '"kredit fiktif" BRI'
+            limit (int): Maximum number of results
+            source (str): Only articles of this source
+            
+        Returns:
+            DataFrame: url, title, source_name, publication_date, score and
+            snippet (matches in **bold**), best match first
+        """
+        columns = ['url', 'title', 'source_name', 'publication_date', 'score', 'snippet']
+        try:
+            # Self-heal an index that is missing articles (e.g. pre-existing corpus)
+            if self.search_index.count() < self.get_articles_count():
+                self.rebuild_search_index()
+            
+            results = self.search_index.search(query, limit=limit, source=source)
+            return pd.DataFrame(results, columns=['article_id'] + columns)[columns]
+        except Exception as e:
+            self._log(f"❌ Error searching articles: {str(e)}")
+            return pd.DataFrame(columns=columns)
+    
+    def rebuild_entity_index(self, df=None):
+        """
+        Re-extract the entities of all stored articles.
+        
+        Args:
+            df (DataFrame): Already loaded articles (loaded from CSV if omitted)
+            
+        Returns:
+            int: Number of processed articles
+        """
         try:
-            if not os.path.exists(self.csv_file):
+            if df is None:
+                df = self.load_articles()
+            self.entity_index.clear()
+            self.entity_index.add_articles(
+                (self._article_id(row.url), self.entity_extractor.extract(row.full_text, row.title))
+                for row in df[['url', 'title', 'full_text']].fillna('').itertuples(index=False)
+            )
+            self._log(f"🏛️  Entity index rebuilt: {len(df)} articles")
+            return len(df)
+        except Exception as e:
+            self._log(f"❌ Error rebuilding entity index: {str(e)}")
+            return 0
+    
+    def rebuild_cases(self, df=None):
+        """
+        Re-cluster all stored articles into cases, in publication order.
+        
+        Args:
+            df (DataFrame): Already loaded articles (loaded from CSV if omitted)
+            
+        Returns:
+            int: Number of cases with more than one article
+        """
+        try:
+            if df is None:
+                df = self.load_articles()
+            df = df.fillna('').sort_values('publication_date', kind='stable')
+            self.case_clusterer.clear()
+            for article in df.to_dict('records'):
+                entities = self.entity_extractor.extract(article['full_text'], article['title'])
+                self.case_clusterer.add_article(self._article_id(article['url']), article, entities)
+            case_count = len(self.case_clusterer.cases(min_articles=2, limit=len(df) or 1))
+            self._log(f"🗂️  Cases rebuilt: {len(df)} articles, {case_count} multi-article cases")
+            return case_count
+        except Exception as e:
+            self._log(f"❌ Error rebuilding cases: {str(e)}")
+            return 0
+    
+    def get_cases(self, min_articles=2, limit=50):
+        """
+        Case clusters, most recently active first.
+        
+        Returns:
+            DataFrame: case_id, label, first_date, last_date, article_count
+        """
+        columns = ['case_id', 'label', 'first_date', 'last_date', 'article_count']
+        try:
+            return pd.DataFrame(self.case_clusterer.cases(min_articles, limit), columns=columns)
+        except Exception as e:
+            self._log(f"❌ Error loading cases: {str(e)}")
+            return pd.DataFrame(columns=columns)
+    
+    def get_case_timeline(self, case_id):
+        """
+        Articles of a case in publication order, with the reported stage.
+        
+        Returns:
+            DataFrame: publication_date, stage, title, url, source_name, article_id
+        """
+        columns = ['publication_date', 'stage', 'title', 'url', 'source_name', 'article_id']
+        try:
+            return pd.DataFrame(self.case_clusterer.timeline(int(case_id)), columns=columns)
+        except Exception as e:
+            self._log(f"❌ Error loading case timeline: {str(e)}")
+            return pd.DataFrame(columns=columns)
+    
+    def _update_risk_scores(self, df):
+        """
+        Re-apply the risk score contributions of recategorized articles, with
+        the entities stored in the entity index at ingest. Articles without a
+        URL cannot be looked up again and keep their contribution.
+        """
+        try:
+            article_ids = df['url'].fillna('').astype(str).map(canonical_url)
+            records = df[['category', 'source_name', 'publication_date']].fillna('').to_dict('records')
+            articles = [(article_id, article) for article_id, article in zip(article_ids, records) if article_id]
+            rescored = self.risk_scores.update_articles(
+                articles,
+                lambda article_id: [(entity, entity_type)
+                                    for entity, entity_type, _ in self.entity_index.entities_for(article_id)]
+            )
+            if rescored:
+                self._log(f"⚠️  Risk scores updated for {rescored} articles")
+        except Exception as e:
+            self._log(f"⚠️ Warning - could not update risk scores: {str(e)}")
+    
+    def rebuild_risk_scores(self, df=None):
+        """
+        Recompute the entity risk scores from all stored articles
+        (e.g. after a severity change; recategorization updates them in place).
+        
+        Args:
+            df (DataFrame): Already loaded articles (loaded from CSV if omitted)
+            
+        Returns:
+            int: Number of articles that contributed to a score
+        """
+        try:
+            if df is None:
+                df = self.load_articles()
+            self.risk_scores.clear()
+            scored = 0
+            for article in df.fillna('').to_dict('records'):
+                entities = self.entity_extractor.extract(article['full_text'], article['title'])
+                if self.risk_scores.add_article(self._article_id(article['url']), article, entities):
+                    scored += 1
+            self._log(f"⚠️  Risk scores rebuilt from {scored} articles")
+            return scored
+        except Exception as e:
+            self._log(f"❌ Error rebuilding risk scores: {str(e)}")
+            return 0
+    
+    def get_risk_leaderboard(self, limit=20, entity_type=None):
+        """
+        Entities with the highest current risk score.
+        
+        Returns:
+            DataFrame: entity, entity_type, score, article_count, source_count, last_date
+        """
+        columns = ['entity', 'entity_type', 'score', 'article_count', 'source_count', 'last_date']
+        try:
+            return pd.DataFrame(self.risk_scores.leaderboard(limit, entity_type), columns=columns)
+        except Exception as e:
+            self._log(f"❌ Error loading risk leaderboard: {str(e)}")
+            return pd.DataFrame(columns=columns)
+    
+    def articles_mentioning(self, entity):
+        """
+        Stored articles mentioning an entity, looked up in the entity index.
+        
+        Args:
+            entity (str): Entity name or gazetteer alias (e.g. "BRI", "Komisi
+                Pemberantasan Korupsi"), case-insensitive
+                
+        Returns:
+            DataFrame: Matching articles with a `mentions` column, most mentions first
+        """
+        try:
+            resolved = self.entity_extractor.canonical_name(entity)
+            mentions = self.entity_index.articles_mentioning(resolved[0] if resolved else entity)
+            if not mentions:
+                return pd.DataFrame(columns=self.csv_schema + ['mentions'])
+            
+            df = self.store.load_by_urls(mentions)
+            df['mentions'] = df['url'].map(self._article_id).map(mentions)
+            return df.sort_values('mentions', ascending=False, kind='stable')
+        except Exception as e:
+            self._log(f"❌ Error looking up entity: {str(e)}")
+            return pd.DataFrame(columns=self.csv_schema + ['mentions'])
+    
+    def recategorize_for_keywords(self, keywords):
+        """
+        Re-score only the stored articles that can contain `keywords`.
+        
+        Candidate articles are looked up in the keyword index, only they are
+        read from the store (by URL), re-scored in one batch, and the changed
+        categories are written back.
+        Falls back to a full recategorization if the keywords cannot be looked
+        up in the index.
+        
+        Args:
+            keywords (list): Keywords that were added or removed
+            
+        Returns:
+            int: Number of articles whose category changed
+        """
+        try:
+            total = self.get_articles_count()
+            if total == 0:
+                return 0
+            
+            # Self-heal an index that is missing articles (e.g. pre-existing corpus)
+            if self.keyword_index.article_count() < total:
+                self.rebuild_keyword_index()
+            
+            candidates = self.keyword_index.candidate_articles(
+                keywords, stemmed=getattr(self.categorizer, 'matching', 'substring') == 'stems'
+            )
+            if candidates is None:
+                return self.recategorize_articles()
+            
+            subset = self.store.load_by_urls(candidates)
+            if len(subset) == 0:
+                self._log(f"🏷️  No stored article contains {keywords}")
+                return 0
+            
+            new_categories = pd.Series(self.categorizer.categorize_batch(subset), index=subset.index)
+            changed_mask = subset['category'].astype(str) != new_categories
+            changed = int(changed_mask.sum())
+            self._log(f"🏷️  Re-scored {len(subset)} of {total} articles: {changed} categories changed")
+            
+            if changed:
+                subset['category'] = new_categories
+                self._write_categories(subset[changed_mask])
+                self._update_risk_scores(subset[changed_mask])
+            return changed
+            
+        except Exception as e:
+            self._log(f"❌ Error recategorizing for keywords: {str(e)}")
+            return 0
+    
+    def add_keywords(self, category, keywords):
+        """
+        Add categorizer keywords and update only the affected stored articles.
+        
+        Returns:
+            int: Number of articles whose category changed (-1 if the category is unknown)
+        """
+        if not self.categorizer.add_keywords(category, keywords):
+            return -1
+        return self.recategorize_for_keywords(keywords)
+    
+    def remove_keywords(self, category, keywords):
+        """
+        Remove categorizer keywords and update only the affected stored articles.
+        
+        Returns:
+            int: Number of articles whose category changed (-1 if the category is unknown)
+        """
+        if not self.categorizer.remove_keywords(category, keywords):
+            return -1
+        return self.recategorize_for_keywords(keywords)
+    
+    def load_articles(self, columns=None):
+        """
+        Load all articles from the store, as stored (text columns).
+        
+        Use load_frame() for analysis and display.
+        
+        Args:
+            columns (list): Only load these columns (e.g. leave out full_text);
+                the Parquet store then reads nothing else from disk
+        """
+        try:
+            if not self.store.exists():
                 print("📄 No existing articles file found.")
-                return pd.DataFrame(columns=self.csv_schema)
+                return pd.DataFrame(columns=columns or self.csv_schema)
+            
+            df = self.store.load(columns)
+            print(f"📊 Loaded {len(df)} existing articles from {self.storage.upper()}")
+            return df
+            
+        except Exception as e:
+            print(f"❌ Error loading articles: {str(e)}")
+            return pd.DataFrame(columns=columns or self.csv_schema)
+    
+    def load_frame(self, columns=None, full_text=False):
+        """
+        Load all articles as a typed, memory-lean DataFrame.
+        
+        source_name and category are categoricals and publication_date is
+        parsed once, here, into datetime64 (see ARTICLE_DTYPES), so callers
+        never reparse it. full_text, by far the largest column, is only read
+        when asked for.
+        
+        Args:
+            columns (list): Columns to load (default: all but full_text)
+            full_text (bool): Also load full_text when `columns` is not given
+        """
+        columns = columns or [column for column in self.csv_schema if full_text or column != 'full_text']
+        try:
+            if not self.store.exists():
+                return typed_frame(pd.DataFrame(columns=columns))
             
-            df = pd.read_csv(self.csv_file, encoding='utf-8')
-            print(f"📊 Loaded {len(df)} existing articles from CSV")
+            df = self.store.load_typed(columns)
+            print(f"📊 Loaded {len(df)} existing articles from {self.storage.upper()} (typed)")
             return df
             
         except Exception as e:
             print(f"❌ Error loading articles: {str(e)}")
-            return pd.DataFrame(columns=self.csv_schema)
+            return typed_frame(pd.DataFrame(columns=columns))
+    
+    def query_articles(self, columns=None, source=None, category=None, start=None, end=None,
+                       after=None, limit=20, typed=False):
+        """
+        One page of articles, newest first, without loading the whole store.
+        
+        Args:
+            columns (list): Columns to return (publication_date and url are always included)
+            source (str): Only articles of this source
+            category (str): Only articles of this category
+            start: Earliest publication date (inclusive)
+            end: Latest publication date (inclusive; a date covers the whole day)
+            after (tuple): Cursor of the previous page, from next_cursor()
+            limit (int): Page size
+            typed (bool): Return the page with the load_frame() dtypes
+            
+        Returns:
+            pandas.DataFrame: At most `limit` articles
+        """
+        try:
+            if not self.store.exists():
+                return pd.DataFrame(columns=columns or self.csv_schema)
+            page = self.store.query(columns, source=source, category=category, start=start, end=end,
+                                    after=after, limit=limit)
+            return typed_frame(page) if typed else page
+            
+        except Exception as e:
+            print(f"❌ Error querying articles: {str(e)}")
+            return pd.DataFrame(columns=columns or self.csv_schema)
+    
+    def recent(self, n=20, columns=None, typed=False):
+        """The `n` most recently published articles"""
+        return self.query_articles(columns, limit=n, typed=typed)
+    
+    def by_source(self, source, limit=20, after=None, columns=None):
+        """A page of the articles of one source, newest first"""
+        return self.query_articles(columns, source=source, after=after, limit=limit)
+    
+    def by_category(self, category, limit=20, after=None, columns=None):
+        """A page of the articles of one category, newest first"""
+        return self.query_articles(columns, category=category, after=after, limit=limit)
+    
+    def in_date_range(self, start, end, limit=20, after=None, columns=None):
+        """A page of the articles published between `start` and `end` (inclusive), newest first"""
+        return self.query_articles(columns, start=start, end=end, after=after, limit=limit)
+    
+    @staticmethod
+    def next_cursor(page):
+        """Cursor to pass as `after` for the page following `page` (None if it is empty)"""
+        return page_cursor(page)
     
     def get_articles_count(self):
         """Get count of articles in the database"""
         try:
-            if not os.path.exists(self.csv_file):
+            if not self.store.exists():
                 return 0
-            df = pd.read_csv(self.csv_file, encoding='utf-8')
-            return len(df)
+            return self.article_stats.total(self.store)
         except Exception as e:
             print(f"❌ Error counting articles: {str(e)}")
             return 0
     
     def check_duplicate(self, url):
-        """Check if article URL already exists in the database"""
+        """Check if article URL already exists in the database (case-insensitive)"""
         try:
-            if not url or not os.path.exists(self.csv_file):
+            if not url or not self.store.exists():
                 return False
-            
-            # Read only the URL column for efficiency
-            df = pd.read_csv(self.csv_file, usecols=['url'], encoding='utf-8')
-            
-            # Check if URL exists (case-insensitive comparison)
-            url_lower = url.lower().strip()
-            existing_urls = df['url'].str.lower().str.strip()
-            
-            return url_lower in existing_urls.values
+            return self.store.contains(url)
             
         except Exception as e:
             print(f"⚠️ Warning - error checking duplicates: {str(e)}")
@@ -221,71 +974,106 @@ class DataManager:
     def get_duplicate_urls(self, urls_list):
         """Get list of URLs that already exist in database"""
         try:
-            if not os.path.exists(self.csv_file):
+            if not self.store.exists():
                 return []
             
-            df = pd.read_csv(self.csv_file, usecols=['url'], encoding='utf-8')
-            existing_urls = set(df['url'].str.lower().str.strip())
-            
-            duplicates = []
-            for url in urls_list:
-                if url and url.lower().strip() in existing_urls:
-                    duplicates.append(url)
-            
-            return duplicates
+            existing_urls = self.store.existing_urls(urls_list)
+            return [url for url in urls_list if url and canonical_url(url) in existing_urls]
             
         except Exception as e:
             print(f"⚠️ Warning - error checking duplicate URLs: {str(e)}")
             return []
     
     def initialize_csv(self):
-        """Initialize CSV file with proper schema"""
+        """Initialize the article store (CSV file with proper schema, or SQLite tables)"""
         try:
-            # Create empty DataFrame with schema
-            df = pd.DataFrame(columns=self.csv_schema)
-            df.to_csv(self.csv_file, index=False, encoding='utf-8')
-            print(f"📄 Initialized new CSV file: {self.csv_file}")
+            self.store.initialize()
+            print(f"📄 Initialized new {self.storage.upper()} store: {self.store.path}")
+            
+        except Exception as e:
+            print(f"❌ Error initializing store: {str(e)}")
+    
+    def export_csv(self, csv_file=None):
+        """
+        Write all stored articles to CSV (the main CSV path by default).
+        
+        Returns:
+            int: Number of articles exported
+        """
+        try:
+            csv_file = csv_file or self.csv_file
+            if self.storage == "csv" and os.path.abspath(csv_file) == os.path.abspath(self.csv_file):
+                return self.store.count()
+            rows = self.store.export_csv(csv_file)
+            self._log(f"📤 Exported {rows} articles to {csv_file}")
+            return rows
+        except Exception as e:
+            self._log(f"❌ Error exporting articles: {str(e)}")
+            return 0
+    
+    def migrate_to_sqlite(self, chunk_size=5000):
+        """Copy the corpus into output/articles.db and switch this manager to it"""
+        return self.migrate_storage("sqlite", chunk_size)
+    
+    def migrate_storage(self, backend, chunk_size=5000):
+        """
+        Copy the corpus into another store backend and switch this manager to it.
+        
+        The new backend is recorded in storage.json, so later DataManager
+        instances pick it automatically; the old store is left in place
+        (refresh articles.csv with export_csv()).
+        
+        Args:
+            backend (str): "sqlite" or "parquet"
+            chunk_size (int): Articles per insert when reading from CSV
             
+        Returns:
+            int: Number of articles copied
+        """
+        try:
+            if self.storage == backend:
+                return 0
+            store = create_store(backend, self.output_dir, self.csv_schema)
+            store.initialize()
+            copied = 0
+            if self.storage == "csv" and os.path.exists(self.csv_file):
+                for chunk in pd.read_csv(self.csv_file, chunksize=chunk_size, encoding='utf-8'):
+                    copied += store.append(chunk.to_dict('records'))
+            elif self.store.exists():
+                copied = store.append(self.store.load().to_dict('records'))
+            self.store.close()
+            self.store, self.storage = store, backend
+            record_backend(self.output_dir, backend)
+            self.article_stats.invalidate()
+            self._log(f"🗄️  Migrated {copied} articles to {backend.upper()}: {store.path}")
+            return copied
         except Exception as e:
-            print(f"❌ Error initializing CSV: {str(e)}")
+            self._log(f"❌ Error migrating to {backend.upper()}: {str(e)}")
+            return 0
     
     def get_statistics(self):
-        """Get statistics about the stored articles"""
+        """Get statistics about the stored articles (from the materialized aggregates)"""
         try:
-            if not os.path.exists(self.csv_file):
+            if not self.store.exists():
                 return {
                     'total_articles': 0,
                     'sources': {},
                     'categories': {},
                     'date_range': None
                 }
-            
-            df = pd.read_csv(self.csv_file, encoding='utf-8')
-            
-            # Count by source
-            source_counts = df['source_name'].value_counts().to_dict() if 'source_name' in df.columns else {}
-            
-            # Count by category  
-            category_counts = df['category'].value_counts().to_dict() if 'category' in df.columns else {}
-            
-            # Date range
-            date_range = None
-            if 'publication_date' in df.columns and len(df) > 0:
-                try:
-                    df['publication_date'] = pd.to_datetime(df['publication_date'])
-                    min_date = df['publication_date'].min()
-                    max_date = df['publication_date'].max()
-                    date_range = f"{min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}"
-                except:
-                    date_range = "Date parsing error"
-            
-            return {
-                'total_articles': len(df),
-                'sources': source_counts,
-                'categories': category_counts,
-                'date_range': date_range
-            }
+            return self.article_stats.snapshot(self.store)
             
         except Exception as e:
             print(f"❌ Error getting statistics: {str(e)}")
             return {'total_articles': 0, 'sources': {}, 'categories': {}, 'date_range': None}
+    
+    def get_daily_counts(self):
+        """Articles per publication day ('YYYY-MM-DD' -> count), in date order"""
+        try:
+            if not self.store.exists():
+                return {}
+            return self.article_stats.daily_counts(self.store)
+            
+        except Exception as e:
+            print(f"❌ Error getting daily counts: {str(e)}")
+            return {}
@@ -0,0 +1,360 @@
+"""
+Entity Extraction Module
+
+Extracts institutions and persons from articles at ingest and stores them in
+an indexed entity -> article table, so questions like "all articles
+mentioning Bank X" are an index lookup instead of a scan of the CSV.
+
+Extraction:
+- Banks and agencies come from a gazetteer of names and aliases (e.g.
+  "Komisi Pemberantasan Korupsi" / "KPK"), compiled into a token trie and
+  matched longest-first in a single pass over the text. Short upper-case
+  aliases (KPK, BRI, OJK, ...) only match in upper case.
+- Persons are found with a capitalised-name heuristic on the article body:
+  runs of 2-4 capitalised words that are not common capitalised words,
+  titles or gazetteer entities.
+- Companies are runs of 1-4 capitalised words after a legal-form prefix
+  (PT, CV) or before a suffix (Tbk, Persero), e.g. "PT Sinar Jaya Abadi",
+  and are never reported as persons.
+
+Storage is a single SQLite file (output/entities.db by default).
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._sqlite import connect_sqlite
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Canonical name -> aliases, per entity type
+GAZETTEER = {
+    "bank": {
+        "Bank Mandiri": ["Bank Mandiri"],
+        "Bank Rakyat Indonesia": ["Bank Rakyat Indonesia", "Bank BRI", "BRI"],
+        "Bank Negara Indonesia": ["Bank Negara Indonesia", "Bank BNI", "BNI"],
+        "Bank Central Asia": ["Bank Central Asia", "Bank BCA", "BCA"],
+        "Bank Tabungan Negara": ["Bank Tabungan Negara", "Bank BTN", "BTN"],
+        "Bank Syariah Indonesia": ["Bank Syariah Indonesia", "Bank BSI", "BSI"],
+        "Bank CIMB Niaga": ["Bank CIMB Niaga", "CIMB Niaga"],
+        "Bank Danamon": ["Bank Danamon"],
+        "Bank Permata": ["Bank Permata", "PermataBank"],
+        "Bank Mega": ["Bank Mega"],
+        "Bank OCBC NISP": ["Bank OCBC NISP", "OCBC NISP"],
+        "Bank Panin": ["Bank Panin", "Panin Bank"],
+        "Maybank Indonesia": ["Maybank Indonesia", "Maybank"],
+        "Bank Jago": ["Bank Jago"],
+        "Bank DKI": ["Bank DKI"],
+        "Bank BJB": ["Bank BJB", "Bank Jabar Banten"],
+    },
+    "agency": {
+        "KPK": ["Komisi Pemberantasan Korupsi", "KPK"],
+        "PPATK": ["Pusat Pelaporan dan Analisis Transaksi Keuangan", "PPATK"],
+        "OJK": ["Otoritas Jasa Keuangan", "OJK"],
+        "Bank Indonesia": ["Bank Indonesia"],
+        "Kejaksaan Agung": ["Kejaksaan Agung", "Kejagung"],
+        "Polri": ["Kepolisian Negara Republik Indonesia", "Polri"],
+        "Bareskrim": ["Badan Reserse Kriminal", "Bareskrim"],
+        "BPK": ["Badan Pemeriksa Keuangan", "BPK"],
+        "BPKP": ["Badan Pengawasan Keuangan dan Pembangunan", "BPKP"],
+        "Ditjen Pajak": ["Direktorat Jenderal Pajak", "Ditjen Pajak", "DJP"],
+        "Bea Cukai": ["Direktorat Jenderal Bea dan Cukai", "Bea Cukai", "DJBC"],
+        "Kementerian Keuangan": ["Kementerian Keuangan", "Kemenkeu"],
+        "LPS": ["Lembaga Penjamin Simpanan", "LPS"],
+        "Mahkamah Agung": ["Mahkamah Agung"],
+        "Pengadilan Tipikor": ["Pengadilan Tipikor", "Pengadilan Tindak Pidana Korupsi"],
+        "Satgas PASTI": ["Satgas PASTI", "Satgas Waspada Investasi"],
+    },
+}
+
+# Capitalised words that are not (part of) person names
+NON_NAME_WORDS = {
+    # titles and roles
+    "bapak", "ibu", "pak", "bu", "sdr", "saudara", "saudari", "tersangka", "terdakwa", "terpidana",
+    "direktur", "dirut", "utama", "kepala", "ketua", "wakil", "menteri", "presiden", "gubernur", "bupati",
+    "walikota", "wali", "kota", "jaksa", "hakim", "kapolri", "kapolda", "kapolres", "kabareskrim",
+    "komisaris", "jenderal", "brigjen", "irjen", "kombes", "akbp", "kompol", "juru", "bicara",
+    "jubir", "anggota", "dewan", "sekretaris", "manajer", "staf", "pejabat", "mantan", "eks",
+    "dr", "prof", "ir", "drs", "sh", "mh", "se", "haji", "hj", "h",
+    # institutions and places
+    "bank", "komisi", "badan", "kementerian", "direktorat", "pengadilan", "negeri", "tinggi",
+    "kejaksaan", "kepolisian", "polda", "polres", "polsek", "pemerintah", "pemprov", "pemkot",
+    "pemkab", "dpr", "dprd", "republik", "indonesia", "jakarta", "selatan", "utara", "barat",
+    "timur", "tengah", "pusat", "jawa", "sumatera", "kalimantan", "sulawesi", "papua", "bali",
+    "provinsi", "kabupaten", "kecamatan", "desa", "pt", "tbk", "cv", "persero", "grup", "group",
+    # calendar
+    "senin", "selasa", "rabu", "kamis", "jumat", "sabtu", "minggu", "januari", "februari", "maret",
+    "april", "mei", "juni", "juli", "agustus", "september", "oktober", "november", "desember",
+    # frequent sentence starters
+    "dalam", "dengan", "untuk", "pada", "dari", "oleh", "sementara", "selain", "namun", "sedangkan",
+    "menurut", "saat", "setelah", "sebelum", "kasus", "hal", "ini", "itu", "para", "sejumlah",
+    "kami", "kita", "mereka", "ia", "dia", "adapun", "adapula", "berdasarkan", "terkait", "atas",
+    "baca", "juga", "lihat", "foto", "video", "sumber", "tim", "rp", "usd",
+}
+
+PERSON_MIN_WORDS = 2
+PERSON_MAX_WORDS = 4
+
+# Legal forms that mark the adjacent capitalised words as a company name
+COMPANY_PREFIXES = {"pt", "cv"}
+COMPANY_SUFFIXES = {"tbk", "persero"}
+
+
+def _is_name_word(token: str) -> bool:
+    """Capitalised, not all upper case, not a known non-name word"""
+    return (
+        len(token) > 1
+        and token[0].isupper()
+        and not token.isupper()
+        and token.isalpha()
+        and token.lower() not in NON_NAME_WORDS
+    )
+
+
+class EntityExtractor:
+    """
+    Gazetteer trie + capitalised-name heuristic entity extractor.
+
+    Attributes:
+        gazetteer (dict): {entity_type: {canonical name: [aliases]}}
+        aliases (dict): Lower-cased alias -> (canonical name, entity type)
+
+    Usage:
+        extractor = EntityExtractor()
+        extractor.extract("KPK memeriksa Budi Santoso terkait kredit Bank BRI")
+        # Counter({('KPK', 'agency'): 1, ('Bank Rakyat Indonesia', 'bank'): 1,
+        #          ('Budi Santoso', 'person'): 1})
+    """
+
+    def __init__(self, gazetteer: Optional[Dict[str, Dict[str, List[str]]]] = None):
+        self.gazetteer = gazetteer or GAZETTEER
+        self.aliases = {}
+        self._trie = {}
+        for entity_type, entities in self.gazetteer.items():
+            for canonical, aliases in entities.items():
+                for alias in set(aliases) | {canonical}:
+                    self._add_alias(alias, canonical, entity_type)
+
+    def _add_alias(self, alias: str, canonical: str, entity_type: str):
+        tokens = TOKEN_PATTERN.findall(alias)
+        if not tokens:
+            return
+        self.aliases[" ".join(tokens).lower()] = (canonical, entity_type)
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token.lower(), {})
+        # Short acronyms (KPK, BRI, ...) must match in upper case only
+        exact = tuple(tokens) if len(tokens) == 1 and tokens[0].isupper() and len(tokens[0]) <= 6 else None
+        node.setdefault(None, []).append((canonical, entity_type, exact))
+
+    def canonical_name(self, name: str) -> Optional[Tuple[str, str]]:
+        """(canonical name, entity type) of a gazetteer alias, or None"""
+        return self.aliases.get(" ".join(TOKEN_PATTERN.findall(name)).lower())
+
+    def _gazetteer_matches(self, tokens: List[str]):
+        """Longest gazetteer matches as (start, end, canonical, type), scanning left to right"""
+        matches = []
+        position = 0
+        while position < len(tokens):
+            node = self._trie
+            best = None
+            for end in range(position, len(tokens)):
+                node = node.get(tokens[end].lower())
+                if node is None:
+                    break
+                for canonical, entity_type, exact in node.get(None, ()):
+                    if exact is None or tuple(tokens[position:end + 1]) == exact:
+                        best = (position, end + 1, canonical, entity_type)
+                        break
+            if best is not None:
+                matches.append(best)
+                position = best[1]
+            else:
+                position += 1
+        return matches
+
+    def _names(self, text: str, covered: set, spans: List[Tuple[int, int]], tokens: List[str]):
+        """
+        Runs of capitalised name words separated by single spaces, as
+        {(name, "person" or "company"): mentions}
+        """
+        names = Counter()
+        run = []
+
+        def adjacent(left, right):
+            return 0 <= left and right < len(tokens) and text[spans[left][1]:spans[right][0]] in (" ", ". ")
+
+        def close_run():
+            if not run or len(run) > PERSON_MAX_WORDS:
+                return
+            first, last = run[0], run[-1]
+            words = [tokens[i] for i in run]
+            prefix = adjacent(first - 1, first) and tokens[first - 1].lower() in COMPANY_PREFIXES
+            suffix = adjacent(last, last + 1) and tokens[last + 1].lower() in COMPANY_SUFFIXES
+            # Named with its prefix if it has one, so "PT X" and "PT X Tbk" are one company
+            if prefix:
+                names[(" ".join([tokens[first - 1]] + words), "company")] += 1
+            elif suffix:
+                names[(" ".join(words + [tokens[last + 1]]), "company")] += 1
+            elif len(run) >= PERSON_MIN_WORDS:
+                names[(" ".join(words), "person")] += 1
+
+        for index, token in enumerate(tokens):
+            if index in covered or not _is_name_word(token):
+                close_run()
+                run = []
+                continue
+            if run and text[spans[run[-1]][1]:spans[index][0]] != " ":
+                close_run()
+                run = []
+            run.append(index)
+        close_run()
+        return names
+
+    def extract(self, text: str, title: str = "") -> Counter:
+        """
+        Extract entities from an article.
+
+        Gazetteer entities are matched in the title and body, persons and
+        companies in the body only (titles are written in title case).
+
+        Args:
+            text (str): Article body
+            title (str): Article title
+
+        Returns:
+            Counter: {(entity, entity_type): mentions}
+        """
+        entities = Counter()
+        for part, find_persons in ((f"{title or ''}", False), (f"{text or ''}", True)):
+            token_matches = list(TOKEN_PATTERN.finditer(part))
+            tokens = [match.group() for match in token_matches]
+            covered = set()
+            for start, end, canonical, entity_type in self._gazetteer_matches(tokens):
+                entities[(canonical, entity_type)] += 1
+                covered.update(range(start, end))
+            if find_persons:
+                spans = [match.span() for match in token_matches]
+                entities.update(self._names(part, covered, spans, tokens))
+        return entities
+
+
+class EntityIndex:
+    """
+    Entity -> article index backed by SQLite.
+
+    Table:
+    - entity_mentions(entity_key, entity, entity_type, article_id, count),
+      keyed by (entity_key, article_id) with an index on article_id, where
+      entity_key is the lower-cased entity name
+
+    Attributes:
+        db_path (str): Path of the SQLite index file
+
+    Usage:
+        index = EntityIndex("output/entities.db")
+        index.add_article("https://example.com/a", {("KPK", "agency"): 2})
+        index.articles_mentioning("kpk")   # {'https://example.com/a': 2}
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        """SQLite connection, opened (and the schema created) on first use"""
+        if self._connection is None:
+            self._connection = connect_sqlite(self.db_path)
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS entity_mentions (
+                    entity_key TEXT NOT NULL,
+                    entity TEXT NOT NULL,
+                    entity_type TEXT NOT NULL,
+                    article_id TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (entity_key, article_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS entity_mentions_article ON entity_mentions (article_id);
+                CREATE INDEX IF NOT EXISTS entity_mentions_type ON entity_mentions (entity_type, entity_key);
+            """)
+        return self._connection
+
+    def add_article(self, article_id, entities):
+        """Index (or re-index) the entities of one article"""
+        self.add_articles([(article_id, entities)])
+
+    def add_articles(self, articles: Iterable):
+        """
+        Index several articles in one transaction.
+
+        Args:
+            articles: Iterable of (article_id, {(entity, entity_type): count}) pairs
+        """
+        with self._lock, self.connection as connection:
+            for article_id, entities in articles:
+                connection.execute("DELETE FROM entity_mentions WHERE article_id = ?", (article_id,))
+                connection.executemany(
+                    "INSERT INTO entity_mentions (entity_key, entity, entity_type, article_id, count) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(entity_key, article_id) DO UPDATE SET count = count + excluded.count",
+                    [(entity.lower(), entity, entity_type, article_id, count)
+                     for (entity, entity_type), count in entities.items()]
+                )
+
+    def remove_article(self, article_id):
+        """Drop an article from the index"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM entity_mentions WHERE article_id = ?", (article_id,))
+
+    def clear(self):
+        """Remove every entry from the index"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM entity_mentions")
+
+    def article_count(self):
+        """Number of articles with at least one entity"""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COUNT(DISTINCT article_id) FROM entity_mentions"
+            ).fetchone()[0]
+
+    def articles_mentioning(self, entity) -> Dict[str, int]:
+        """Return {article_id: mentions} for an entity name (case-insensitive)"""
+        with self._lock:
+            return dict(self.connection.execute(
+                "SELECT article_id, count FROM entity_mentions WHERE entity_key = ?", (entity.lower(),)
+            ))
+
+    def entities_for(self, article_id) -> List[Tuple[str, str, int]]:
+        """Return [(entity, entity_type, mentions)] of one article, most mentioned first"""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT entity, entity_type, count FROM entity_mentions "
+                "WHERE article_id = ? ORDER BY count DESC, entity", (article_id,)
+            ).fetchall()
+
+    def top_entities(self, entity_type=None, limit=20) -> List[Tuple[str, str, int]]:
+        """Return [(entity, entity_type, article_count)] of the most mentioned entities"""
+        query = "SELECT MIN(entity), entity_type, COUNT(*) AS articles FROM entity_mentions"
+        parameters = []
+        if entity_type:
+            query += " WHERE entity_type = ?"
+            parameters.append(entity_type)
+        query += " GROUP BY entity_key, entity_type ORDER BY articles DESC, MIN(entity) LIMIT ?"
+        parameters.append(limit)
+        with self._lock:
+            return self.connection.execute(query, parameters).fetchall()
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
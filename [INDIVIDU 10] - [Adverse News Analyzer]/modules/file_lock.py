@@ -0,0 +1,116 @@
+"""
+File Lock Module
+
+Exclusive lock shared by the threads and processes writing to a store.
+
+Several processes may write to the same output directory, e.g. a scheduled
+`cli.py scrape` next to the Streamlit GO button, or scraper workers split by
+source. The article stores take a FileLock (a `.lock` file next to the
+store) around every write, so duplicate checks and appends of different
+processes never interleave.
+
+The lock is an OS lock on the lock file: fcntl.flock on Linux/macOS and
+msvcrt.locking on Windows (run_app.bat). The OS releases it when the
+holding process exits, so a crashed writer never leaves the store locked.
+It is reentrant within a thread, so a caller holding it can still call
+store methods that take it.
+
+Usage:
+    lock = FileLock("output/articles.csv.lock")
+    with lock:
+        ...
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _try_lock(fd: int):
+    """Lock the file without waiting; raises OSError if another holder has it"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+
+def _unlock(fd: int):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """
+    Reentrant exclusive lock across threads and processes.
+
+    Attributes:
+        path (str): Lock file (created if missing, never removed)
+        timeout (float): Seconds to wait for the lock before TimeoutError (None waits forever)
+        poll_interval (float): Seconds between attempts while another process holds it
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None, poll_interval: float = 0.01):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self):
+        """Wait for the lock (threads of this process first, then other processes)"""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._fd = self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def _lock_file(self) -> int:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                _try_lock(fd)
+                return fd
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Timed out waiting for lock {self.path}")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Release one level of the lock; the file lock is freed with the outermost level"""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
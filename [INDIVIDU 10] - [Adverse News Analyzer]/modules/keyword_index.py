@@ -0,0 +1,207 @@
+"""
+Keyword Index Module
+
+Persisted inverted index from word terms to article IDs, used to find which
+stored articles can be affected by a change of the categorizer keywords.
+
+Every article is tokenized once at ingest into lower-cased word terms
+(runs of \\w characters) with their occurrence counts. Categorizer keywords
+are plain substrings, so a keyword can only occur in an article if each of
+its words occurs inside some term of that article. Looking those words up
+in the (small) term vocabulary yields a superset of the affected articles,
+which are then re-scored exactly. For a categorizer matching word stems,
+terms are compared by their stem instead (stemmed=True).
+
+Storage is a single SQLite file (output/keyword_index.db by default).
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import re
+import threading
+from collections import Counter
+
+from ._sqlite import connect_sqlite
+from .text_normalizer import stem
+
+TERM_PATTERN = re.compile(r'\w+')
+
+
+class KeywordIndex:
+    """
+    Inverted index of article terms backed by SQLite.
+
+    Tables:
+    - terms(term, document_count): vocabulary of all indexed terms
+    - postings(term, article_id, count): term occurrences per article
+    - articles(article_id): indexed articles (also those without terms)
+    - meta(key, value): 'articles' holds their number, kept up to date by
+      every write so article_count() is a single row lookup
+
+    Attributes:
+        db_path (str): Path of the SQLite index file
+
+    Usage:
+        index = KeywordIndex("output/keyword_index.db")
+        index.add_article("https://example.com/a", "KPK tahan tersangka korupsi")
+        index.candidate_articles(["korupsi"])   # {'https://example.com/a'}
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        """SQLite connection, opened (and the schema created) on first use"""
+        if self._connection is None:
+            self._connection = connect_sqlite(self.db_path)
+            self._connection.create_function("stem", 1, stem, deterministic=True)
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS terms (
+                    term TEXT PRIMARY KEY,
+                    document_count INTEGER NOT NULL
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL,
+                    article_id TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (term, article_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS postings_article ON postings (article_id);
+                CREATE TABLE IF NOT EXISTS articles (
+                    article_id TEXT PRIMARY KEY
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                ) WITHOUT ROWID;
+            """)
+            with self._connection as connection:
+                if connection.execute("SELECT 1 FROM meta WHERE key = 'articles'").fetchone() is None:
+                    # Index written before the articles table existed
+                    connection.execute("INSERT OR IGNORE INTO articles SELECT DISTINCT article_id FROM postings")
+                    connection.execute("INSERT INTO meta (key, value) SELECT 'articles', COUNT(*) FROM articles")
+        return self._connection
+
+    @staticmethod
+    def tokenize(text):
+        """Lower-cased word terms of `text` with their counts"""
+        return Counter(TERM_PATTERN.findall(f"{text}".lower()))
+
+    def add_article(self, article_id, text):
+        """Index (or re-index) one article"""
+        self.add_articles([(article_id, text)])
+
+    def add_articles(self, articles):
+        """
+        Index several articles in one transaction.
+
+        Args:
+            articles: Iterable of (article_id, text) pairs
+        """
+        with self._lock, self.connection as connection:
+            for article_id, text in articles:
+                self._remove(connection, article_id)
+                term_counts = self.tokenize(text)
+                connection.executemany(
+                    "INSERT INTO postings (term, article_id, count) VALUES (?, ?, ?)",
+                    [(term, article_id, count) for term, count in term_counts.items()]
+                )
+                connection.executemany(
+                    "INSERT INTO terms (term, document_count) VALUES (?, 1) "
+                    "ON CONFLICT(term) DO UPDATE SET document_count = document_count + 1",
+                    [(term,) for term in term_counts]
+                )
+                connection.execute("INSERT INTO articles (article_id) VALUES (?)", (article_id,))
+                connection.execute("UPDATE meta SET value = value + 1 WHERE key = 'articles'")
+
+    def remove_article(self, article_id):
+        """Drop an article from the index"""
+        with self._lock, self.connection as connection:
+            self._remove(connection, article_id)
+
+    @staticmethod
+    def _remove(connection, article_id):
+        if connection.execute("DELETE FROM articles WHERE article_id = ?", (article_id,)).rowcount:
+            connection.execute("UPDATE meta SET value = value - 1 WHERE key = 'articles'")
+        terms = [row[0] for row in connection.execute(
+            "SELECT term FROM postings WHERE article_id = ?", (article_id,)
+        )]
+        if not terms:
+            return
+        connection.execute("DELETE FROM postings WHERE article_id = ?", (article_id,))
+        connection.executemany(
+            "UPDATE terms SET document_count = document_count - 1 WHERE term = ?",
+            [(term,) for term in terms]
+        )
+        connection.execute("DELETE FROM terms WHERE document_count <= 0")
+
+    def clear(self):
+        """Remove every entry from the index"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM postings")
+            connection.execute("DELETE FROM terms")
+            connection.execute("DELETE FROM articles")
+            connection.execute("UPDATE meta SET value = 0 WHERE key = 'articles'")
+
+    def article_count(self):
+        """Number of indexed articles (maintained counter, no scan)"""
+        with self._lock:
+            return self.connection.execute("SELECT value FROM meta WHERE key = 'articles'").fetchone()[0]
+
+    def term_postings(self, term):
+        """Return {article_id: count} for an exact term"""
+        with self._lock:
+            return dict(self.connection.execute(
+                "SELECT article_id, count FROM postings WHERE term = ?", (term.lower(),)
+            ))
+
+    def candidate_articles(self, keywords, stemmed=False):
+        """
+        Articles that may contain any of `keywords` as a substring.
+
+        Args:
+            keywords (list): Keyword strings (matched case-insensitively)
+            stemmed (bool): Keywords match whole words by stem (articles
+                containing a term with the stem of each keyword word)
+
+        Returns:
+            set: Candidate article IDs, or None if a keyword has no word
+                 characters and therefore cannot be narrowed down by the index
+        """
+        candidates = set()
+        with self._lock:
+            for keyword in keywords:
+                words = TERM_PATTERN.findall(keyword.lower())
+                if not words:
+                    if stemmed:
+                        # Never matches on stems
+                        continue
+                    return None
+                if stemmed:
+                    words = [stem(word) for word in words]
+                condition = "stem(t.term) = ?" if stemmed else "instr(t.term, ?) > 0"
+
+                keyword_candidates = None
+                # Rarest-looking (longest) words first to shrink the set quickly
+                for word in sorted(set(words), key=len, reverse=True):
+                    articles = {row[0] for row in self.connection.execute(
+                        "SELECT DISTINCT p.article_id FROM terms t "
+                        f"JOIN postings p ON p.term = t.term WHERE {condition}",
+                        (word,)
+                    )}
+                    keyword_candidates = articles if keyword_candidates is None else keyword_candidates & articles
+                    if not keyword_candidates:
+                        break
+                candidates |= keyword_candidates
+        return candidates
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,343 @@
+"""
+Linear Classifier Module
+
+Lightweight statistical alternative to the keyword rules of NewsCategorizor.
+
+Articles are turned into hashed sparse features (word unigrams, word bigrams
+and character n-grams inside words), and a linear model, either multinomial
+naive Bayes or multinomial logistic regression, is trained with NumPy only.
+The model is trained offline from the labelled `category` column of the
+stored articles and saved as plain .npy files, which are memory-mapped at
+load time so only the weight rows an article touches are read from disk.
+
+Usage:
+    python cli.py train-classifier --method logreg
+    categorizer = NewsCategorizor(backend="linear", model_path="output/classifier")
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import json
+import math
+import os
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+from ._lazy import lazy_import
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# 2**18 buckets x 6 classes x float32 = 6 MB of weights
+DEFAULT_FEATURES = 2 ** 18
+CHAR_NGRAM_RANGE = (3, 5)
+
+WEIGHTS_FILE = "weights.npy"
+BIAS_FILE = "bias.npy"
+META_FILE = "model.json"
+
+
+def _bucket(feature: str, n_features: int) -> int:
+    """Stable hash bucket of a feature string (independent of PYTHONHASHSEED)"""
+    return zlib.crc32(feature.encode('utf-8', 'surrogatepass')) % n_features
+
+
+@lru_cache(maxsize=200000)
+def _word_buckets(word: str, n_features: int) -> Tuple[int, ...]:
+    """Buckets of a word's unigram and its character n-grams (memoized per word)"""
+    buckets = [_bucket("w:" + word, n_features)]
+    padded = f"<{word}>"
+    low, high = CHAR_NGRAM_RANGE
+    for size in range(low, high + 1):
+        for start in range(len(padded) - size + 1):
+            buckets.append(_bucket("c:" + padded[start:start + size], n_features))
+    return tuple(buckets)
+
+
+def extract_features(text: str, n_features: int = DEFAULT_FEATURES) -> Tuple[List[int], List[float]]:
+    """
+    Hashed feature vector of a text.
+
+    Features are word unigrams and bigrams plus character 3-5 grams of each
+    word, with sublinear term frequency (1 + log tf) and L2 normalization.
+
+    Args:
+        text (str): Article text (title and body)
+        n_features (int): Number of hash buckets
+
+    Returns:
+        Tuple[List[int], List[float]]: Sorted bucket indices and their values
+    """
+    words = WORD_PATTERN.findall(f"{text}".lower())
+    counts = Counter()
+    for word, frequency in Counter(words).items():
+        for bucket in _word_buckets(word, n_features):
+            counts[bucket] += frequency
+    for bigram, frequency in Counter(zip(words, words[1:])).items():
+        counts[_bucket("b:" + " ".join(bigram), n_features)] += frequency
+
+    if not counts:
+        return [], []
+    indices = sorted(counts)
+    values = [1.0 + math.log(counts[index]) for index in indices]
+    norm = math.sqrt(sum(value * value for value in values))
+    return indices, [value / norm for value in values]
+
+
+def _feature_matrix(texts: Sequence[str], n_features: int):
+    """CSR arrays (indptr, indices, data) of the feature vectors of `texts`"""
+    indptr = [0]
+    indices, data = [], []
+    for text in texts:
+        text_indices, text_values = extract_features(text, n_features)
+        indices.extend(text_indices)
+        data.extend(text_values)
+        indptr.append(len(indices))
+    return (np.asarray(indptr, dtype=np.int64),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(data, dtype=np.float32))
+
+
+class LinearTextClassifier:
+    """
+    Hashed-feature linear text classifier (naive Bayes or logistic regression).
+
+    Attributes:
+        classes (List[str]): Class labels, in weight-column order
+        n_features (int): Number of hash buckets
+        method (str): "nb" (multinomial naive Bayes) or "logreg"
+        weights (ndarray): n_features x n_classes weight matrix (memory-mapped when loaded)
+        bias (ndarray): Per-class bias
+
+    Usage:
+        model = LinearTextClassifier(method="logreg").fit(texts, labels)
+        model.save("output/classifier")
+        model = LinearTextClassifier.load("output/classifier")
+        model.predict_one("KPK tahan tersangka korupsi")
+    """
+
+    METHODS = ("nb", "logreg")
+
+    def __init__(self, method: str = "logreg", n_features: int = DEFAULT_FEATURES):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method '{method}', expected one of {self.METHODS}")
+        self.method = method
+        self.n_features = n_features
+        self.classes = []
+        self.weights = None
+        self.bias = None
+        self.version = None
+
+    def fit(self, texts: Sequence[str], labels: Sequence[str], epochs: int = 15,
+            learning_rate: float = 0.5, l2: float = 1e-5, alpha: float = 0.1, seed: int = 0):
+        """
+        Train the model.
+
+        Args:
+            texts: Article texts
+            labels: Category label per text
+            epochs (int): Passes over the data (logreg only)
+            learning_rate (float): AdaGrad step size (logreg only)
+            l2 (float): L2 penalty on the touched weight rows (logreg only)
+            alpha (float): Additive smoothing (naive Bayes only)
+            seed (int): Shuffling seed (logreg only)
+
+        Returns:
+            LinearTextClassifier: self
+        """
+        if len(texts) != len(labels) or not texts:
+            raise ValueError("fit() needs the same, non-zero number of texts and labels")
+
+        self.classes = sorted(set(labels))
+        class_index = {label: index for index, label in enumerate(self.classes)}
+        y = np.asarray([class_index[label] for label in labels], dtype=np.int64)
+        indptr, indices, data = _feature_matrix(texts, self.n_features)
+
+        if self.method == "nb":
+            self._fit_naive_bayes(indptr, indices, data, y, alpha)
+        else:
+            self._fit_logistic_regression(indptr, indices, data, y, epochs, learning_rate, l2, seed)
+        self.version = self._compute_version()
+        logger.info(f"Trained {self.method} classifier on {len(texts)} articles, {len(self.classes)} classes")
+        return self
+
+    def _fit_naive_bayes(self, indptr, indices, data, y, alpha):
+        n_classes = len(self.classes)
+        rows = np.repeat(np.arange(len(y)), np.diff(indptr))
+        feature_class = y[rows] * self.n_features + indices
+        counts = np.bincount(feature_class, weights=data, minlength=n_classes * self.n_features)
+        counts = counts.reshape(n_classes, self.n_features) + alpha
+        log_probabilities = np.log(counts) - np.log(counts.sum(axis=1, keepdims=True))
+        self.weights = np.ascontiguousarray(log_probabilities.T, dtype=np.float32)
+        self.bias = np.log(np.bincount(y, minlength=n_classes) / len(y)).astype(np.float32)
+
+    def _fit_logistic_regression(self, indptr, indices, data, y, epochs, learning_rate, l2, seed,
+                                 batch_size=64):
+        n_classes = len(self.classes)
+        weights = np.zeros((self.n_features, n_classes), dtype=np.float32)
+        bias = np.zeros(n_classes, dtype=np.float32)
+        weight_history = np.full((self.n_features, n_classes), 1e-8, dtype=np.float32)
+        bias_history = np.full(n_classes, 1e-8, dtype=np.float32)
+        targets = np.eye(n_classes, dtype=np.float32)
+        rng = np.random.default_rng(seed)
+
+        for _ in range(epochs):
+            order = rng.permutation(len(y))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                lengths = indptr[batch + 1] - indptr[batch]
+                positions = np.concatenate([np.arange(indptr[row], indptr[row + 1]) for row in batch])
+                rows = np.repeat(np.arange(len(batch)), lengths)
+                batch_indices, batch_data = indices[positions], data[positions]
+
+                # Only the weight rows of features present in the batch are touched
+                touched, local = np.unique(batch_indices, return_inverse=True)
+                scores = np.tile(bias, (len(batch), 1))
+                np.add.at(scores, rows, batch_data[:, None] * weights[touched][local])
+                scores -= scores.max(axis=1, keepdims=True)
+                probabilities = np.exp(scores)
+                probabilities /= probabilities.sum(axis=1, keepdims=True)
+                error = (probabilities - targets[y[batch]]) / len(batch)
+
+                gradient = np.zeros((len(touched), n_classes), dtype=np.float32)
+                np.add.at(gradient, local, batch_data[:, None] * error[rows])
+                gradient += l2 * weights[touched]
+                weight_history[touched] += gradient ** 2
+                weights[touched] -= learning_rate * gradient / np.sqrt(weight_history[touched])
+
+                bias_gradient = error.sum(axis=0)
+                bias_history += bias_gradient ** 2
+                bias -= learning_rate * bias_gradient / np.sqrt(bias_history)
+
+        self.weights = weights
+        self.bias = bias
+
+    def _compute_version(self) -> str:
+        """Short content hash of the model, used to key memoized results"""
+        checksum = zlib.crc32(np.ascontiguousarray(self.bias).tobytes())
+        checksum = zlib.crc32(np.ascontiguousarray(self.weights).tobytes(), checksum)
+        return f"{self.method}-{checksum:08x}"
+
+    def decision_function(self, text: str):
+        """Per-class scores of one text"""
+        indices, values = extract_features(text, self.n_features)
+        if not indices:
+            return np.array(self.bias, dtype=np.float32)
+        # Fancy indexing on a memory map reads only the touched rows
+        return np.asarray(values, dtype=np.float32) @ self.weights[indices] + self.bias
+
+    def predict_one(self, text: str) -> str:
+        """Most likely class of one text"""
+        return self.classes[int(np.argmax(self.decision_function(text)))]
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        """Most likely class of each text"""
+        if not len(texts):
+            return []
+        indptr, indices, data = _feature_matrix(texts, self.n_features)
+        scores = np.tile(np.asarray(self.bias, dtype=np.float32), (len(texts), 1))
+        if len(indices):
+            rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+            np.add.at(scores, rows, data[:, None] * self.weights[indices])
+        return [self.classes[index] for index in scores.argmax(axis=1)]
+
+    def save(self, model_dir: str):
+        """Write the model as .npy weights plus a JSON metadata file"""
+        os.makedirs(model_dir, exist_ok=True)
+        np.save(os.path.join(model_dir, WEIGHTS_FILE), np.ascontiguousarray(self.weights, dtype=np.float32))
+        np.save(os.path.join(model_dir, BIAS_FILE), np.asarray(self.bias, dtype=np.float32))
+        with open(os.path.join(model_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'method': self.method,
+                'n_features': self.n_features,
+                'classes': self.classes,
+                'version': self.version,
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, model_dir: str, mmap: bool = True) -> "LinearTextClassifier":
+        """
+        Load a saved model.
+
+        Args:
+            model_dir (str): Directory written by save()
+            mmap (bool): Memory-map the weight matrix instead of reading it
+
+        Returns:
+            LinearTextClassifier: The loaded model
+        """
+        with open(os.path.join(model_dir, META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        model = cls(meta['method'], meta['n_features'])
+        model.classes = meta['classes']
+        model.version = meta['version']
+        model.weights = np.load(os.path.join(model_dir, WEIGHTS_FILE), mmap_mode='r' if mmap else None)
+        model.bias = np.load(os.path.join(model_dir, BIAS_FILE))
+        return model
+
+
+def article_text(title, full_text) -> str:
+    """Text fed to the classifier for an article (title first, then body)"""
+    return f"{title or ''}\n{full_text or ''}"
+
+
+def train_from_csv(csv_file: str, model_dir: str, method: str = "logreg",
+                   n_features: int = DEFAULT_FEATURES, validation_split: float = 0.2,
+                   seed: int = 0) -> Optional[Dict]:
+    """
+    Train a classifier from the labelled `category` column of the articles CSV.
+
+    A random `validation_split` of the articles is held out to report
+    accuracy, then the final model is trained on all articles and saved.
+
+    Args:
+        csv_file (str): Path to articles.csv
+        model_dir (str): Directory to save the model to
+        method (str): "nb" or "logreg"
+        n_features (int): Number of hash buckets
+        validation_split (float): Fraction of articles held out for the report
+        seed (int): Random seed for the split and the training order
+
+    Returns:
+        Dict: Training report (articles, classes, validation accuracy), or
+              None if there is nothing to train on
+    """
+    pd = lazy_import("pandas")
+    df = pd.read_csv(csv_file, usecols=['title', 'full_text', 'category'], encoding='utf-8')
+    df = df.dropna(subset=['category'])
+    if df.empty:
+        logger.warning(f"No labelled articles in {csv_file}")
+        return None
+
+    texts = [article_text(title, text) for title, text in
+             zip(df['title'].fillna('').tolist(), df['full_text'].fillna('').tolist())]
+    labels = df['category'].astype(str).tolist()
+
+    accuracy = None
+    holdout = int(len(texts) * validation_split)
+    if holdout and len(texts) - holdout >= 2:
+        order = np.random.default_rng(seed).permutation(len(texts))
+        train, test = order[holdout:], order[:holdout]
+        model = LinearTextClassifier(method, n_features).fit(
+            [texts[i] for i in train], [labels[i] for i in train], seed=seed
+        )
+        predictions = model.predict([texts[i] for i in test])
+        accuracy = float(np.mean([prediction == labels[i] for prediction, i in zip(predictions, test)]))
+
+    model = LinearTextClassifier(method, n_features).fit(texts, labels, seed=seed)
+    model.save(model_dir)
+    return {
+        'articles': len(texts),
+        'classes': model.classes,
+        'validation_accuracy': accuracy,
+        'model_dir': model_dir,
+        'version': model.version,
+    }
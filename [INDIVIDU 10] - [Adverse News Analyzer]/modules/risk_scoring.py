@@ -0,0 +1,328 @@
+"""
+Risk Scoring Module
+
+Per-entity risk scores maintained incrementally as articles are saved, so a
+ranked leaderboard is available at any corpus size without loading the
+articles.
+
+The score of an entity combines:
+- category severity: each article adds the severity of its category
+  (e.g. Money Laundering weighs more than Gambling; uncategorized adds nothing)
+- recency decay: a contribution halves every `half_life_days`
+- source count: the decayed sum is multiplied by 1 + ln(distinct sources),
+  so coverage confirmed by several outlets ranks higher
+
+Decay is applied without touching stored rows: a contribution published at
+time t is stored as severity * 2^((t - epoch) / half_life), i.e. scaled to a
+fixed epoch. Every stored value then decays by the same factor, so ranking
+needs no update over time, and the current score is the stored value times
+2^(-(now - epoch) / half_life). Saving an article is one upsert per entity
+(plus one insert per new source) and the leaderboard is an index scan.
+
+Each article's contribution is stored with it, so when its category changes
+update_articles() subtracts the old contribution and adds the new one
+without rescanning the other articles of the entity.
+
+Storage is a single SQLite file (output/risk_scores.db by default).
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import math
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ._sqlite import connect_sqlite
+
+CATEGORY_SEVERITY = {
+    "Money Laundering": 1.0,
+    "Corruption": 0.9,
+    "Fraud": 0.8,
+    "Tax Evasion": 0.7,
+    "Gambling": 0.6,
+    "Other/Uncategorized": 0.0,
+}
+
+# Institutions such as agencies report on cases rather than being subjects of them
+DEFAULT_ENTITY_TYPES = ("person", "company", "bank")
+
+EPOCH = datetime(2020, 1, 1)
+
+
+def _parse_date(value) -> Optional[datetime]:
+    for length, date_format in ((19, "%Y-%m-%d %H:%M:%S"), (10, "%Y-%m-%d")):
+        try:
+            return datetime.strptime(f"{value}"[:length], date_format)
+        except ValueError:
+            continue
+    return None
+
+
+class RiskScoreStore:
+    """
+    Incrementally maintained entity risk scores backed by SQLite.
+
+    Tables:
+    - risk_scores(entity_key, entity, entity_type, weighted, source_count,
+      article_count, last_date, rank_score): one row per entity
+    - risk_sources(entity_key, source_name, article_count): distinct
+      sources per entity, with the number of counted articles of each
+    - risk_articles(article_id, entity_key, source_name, published,
+      contribution): articles already counted and what each added
+
+    Attributes:
+        db_path (str): Path of the SQLite file
+        half_life_days (float): Days after which a contribution counts half
+        severity (Dict[str, float]): Category -> severity weight
+        entity_types (tuple): Entity types that are scored
+
+    Usage:
+        store = RiskScoreStore("output/risk_scores.db")
+        store.add_article(article_id, article_data, entities)
+        store.leaderboard(limit=10)
+    """
+
+    def __init__(self, db_path, half_life_days: float = 90.0,
+                 severity: Optional[Dict[str, float]] = None,
+                 entity_types: Iterable[str] = DEFAULT_ENTITY_TYPES):
+        self.db_path = db_path
+        self.half_life_days = half_life_days
+        self.severity = dict(CATEGORY_SEVERITY if severity is None else severity)
+        self.entity_types = tuple(entity_types)
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        """SQLite connection, opened (and the schema created) on first use"""
+        if self._connection is None:
+            self._connection = connect_sqlite(self.db_path)
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS risk_scores (
+                    entity_key TEXT PRIMARY KEY,
+                    entity TEXT NOT NULL,
+                    entity_type TEXT NOT NULL,
+                    weighted REAL NOT NULL,
+                    source_count INTEGER NOT NULL,
+                    article_count INTEGER NOT NULL,
+                    last_date TEXT,
+                    rank_score REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS risk_scores_rank ON risk_scores (rank_score DESC);
+                CREATE INDEX IF NOT EXISTS risk_scores_type_rank ON risk_scores (entity_type, rank_score DESC);
+                CREATE TABLE IF NOT EXISTS risk_sources (
+                    entity_key TEXT NOT NULL,
+                    source_name TEXT NOT NULL,
+                    article_count INTEGER NOT NULL,
+                    PRIMARY KEY (entity_key, source_name)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS risk_articles (
+                    article_id TEXT NOT NULL,
+                    entity_key TEXT NOT NULL,
+                    source_name TEXT NOT NULL,
+                    published TEXT NOT NULL,
+                    contribution REAL NOT NULL,
+                    PRIMARY KEY (article_id, entity_key)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS risk_articles_entity ON risk_articles (entity_key, published);
+            """)
+        return self._connection
+
+    def _growth(self, when: datetime) -> float:
+        """2^((when - epoch) / half_life): scale of a contribution relative to the epoch"""
+        days = (when - EPOCH).total_seconds() / 86400
+        return 2.0 ** (days / self.half_life_days)
+
+    def _contribution(self, article_data: Dict):
+        """(contribution, date_text, source) of an article, or None if its category has no severity"""
+        severity = self.severity.get(article_data.get('category', ''), 0.0)
+        if severity <= 0:
+            return None
+        published = _parse_date(article_data.get('publication_date')) or datetime.now()
+        source = f"{article_data.get('source_name', '') or ''}"
+        return severity * self._growth(published), published.strftime("%Y-%m-%d %H:%M:%S"), source
+
+    def _scored_entities(self, entities) -> Dict:
+        """{entity_key: (entity, entity_type)} of the entities of a scored type"""
+        scored = {}
+        for entity, entity_type in entities:
+            if entity_type in self.entity_types:
+                scored.setdefault(entity.lower(), (entity, entity_type))
+        return scored
+
+    @staticmethod
+    def _refresh_rank(connection, entity_key):
+        """rank_score = weighted * (1 + ln(source_count)), refreshed on the updated row"""
+        weighted, source_count = connection.execute(
+            "SELECT weighted, source_count FROM risk_scores WHERE entity_key = ?", (entity_key,)
+        ).fetchone()
+        connection.execute(
+            "UPDATE risk_scores SET rank_score = ? WHERE entity_key = ?",
+            (weighted * (1 + math.log(source_count)), entity_key)
+        )
+
+    def _add(self, connection, article_id, contribution, date_text, source, scored) -> int:
+        """Add one article's contribution to the scores of its entities (within a transaction)"""
+        updated = 0
+        for entity_key, (entity, entity_type) in scored.items():
+            counted = connection.execute(
+                "INSERT OR IGNORE INTO risk_articles (article_id, entity_key, source_name, published, "
+                "contribution) VALUES (?, ?, ?, ?, ?)",
+                (article_id, entity_key, source, date_text, contribution)
+            ).rowcount
+            if not counted:
+                continue
+            new_source = connection.execute(
+                "INSERT OR IGNORE INTO risk_sources (entity_key, source_name, article_count) VALUES (?, ?, 0)",
+                (entity_key, source)
+            ).rowcount
+            connection.execute(
+                "UPDATE risk_sources SET article_count = article_count + 1 "
+                "WHERE entity_key = ? AND source_name = ?", (entity_key, source)
+            )
+            connection.execute(
+                "INSERT INTO risk_scores (entity_key, entity, entity_type, weighted, source_count, "
+                "article_count, last_date, rank_score) VALUES (?, ?, ?, ?, 1, 1, ?, ?) "
+                "ON CONFLICT(entity_key) DO UPDATE SET "
+                "weighted = weighted + excluded.weighted, "
+                "source_count = source_count + ?, "
+                "article_count = article_count + 1, "
+                "last_date = MAX(COALESCE(last_date, ''), excluded.last_date)",
+                (entity_key, entity, entity_type, contribution, date_text, contribution, new_source)
+            )
+            self._refresh_rank(connection, entity_key)
+            updated += 1
+        return updated
+
+    def _remove(self, connection, article_id):
+        """Subtract one article's contribution from the scores of its entities (within a transaction)"""
+        counted = connection.execute(
+            "SELECT entity_key, source_name, contribution FROM risk_articles WHERE article_id = ?",
+            (article_id,)
+        ).fetchall()
+        connection.execute("DELETE FROM risk_articles WHERE article_id = ?", (article_id,))
+        for entity_key, source, contribution in counted:
+            connection.execute(
+                "UPDATE risk_sources SET article_count = article_count - 1 "
+                "WHERE entity_key = ? AND source_name = ?", (entity_key, source)
+            )
+            gone_source = connection.execute(
+                "DELETE FROM risk_sources WHERE entity_key = ? AND source_name = ? AND article_count <= 0",
+                (entity_key, source)
+            ).rowcount
+            if connection.execute(
+                "DELETE FROM risk_scores WHERE entity_key = ? AND article_count <= 1", (entity_key,)
+            ).rowcount:
+                continue
+            connection.execute(
+                "UPDATE risk_scores SET weighted = weighted - ?, source_count = source_count - ?, "
+                "article_count = article_count - 1, "
+                "last_date = (SELECT MAX(published) FROM risk_articles WHERE entity_key = ?) "
+                "WHERE entity_key = ?",
+                (contribution, gone_source, entity_key, entity_key)
+            )
+            self._refresh_rank(connection, entity_key)
+
+    def add_article(self, article_id, article_data: Dict, entities) -> int:
+        """
+        Fold one article into the scores of its entities. Articles already
+        counted for an entity are skipped.
+
+        Args:
+            article_id (str): Canonical article ID
+            article_data (dict): Article with category, source_name and publication_date
+            entities: (entity, entity_type) pairs of the article (e.g. EntityExtractor output)
+
+        Returns:
+            int: Number of entity scores updated
+        """
+        contribution = self._contribution(article_data)
+        if contribution is None:
+            return 0
+        scored = self._scored_entities(entities)
+        with self._lock, self.connection as connection:
+            return self._add(connection, article_id, *contribution, scored)
+
+    def update_articles(self, articles: Iterable, entities_for: Callable) -> int:
+        """
+        Re-apply the contributions of articles whose category (or date or
+        source) may have changed, e.g. after recategorization. An article's
+        old contribution is subtracted and the new one added; unchanged
+        articles cost one lookup.
+
+        Args:
+            articles: Iterable of (article_id, article_data) pairs
+            entities_for (callable): article_id -> (entity, entity_type) pairs,
+                only called for articles whose contribution changed
+
+        Returns:
+            int: Number of articles re-scored
+        """
+        changed = 0
+        with self._lock, self.connection as connection:
+            for article_id, article_data in articles:
+                contribution = self._contribution(article_data)
+                counted = connection.execute(
+                    "SELECT contribution, published, source_name FROM risk_articles WHERE article_id = ? LIMIT 1",
+                    (article_id,)
+                ).fetchone()
+                if counted is None and contribution is None:
+                    continue
+                if (counted is not None and contribution is not None
+                        and math.isclose(counted[0], contribution[0]) and tuple(counted[1:]) == contribution[1:]):
+                    continue
+                self._remove(connection, article_id)
+                if contribution is not None:
+                    self._add(connection, article_id, *contribution,
+                              self._scored_entities(entities_for(article_id)))
+                changed += 1
+        return changed
+
+    def leaderboard(self, limit: int = 20, entity_type: Optional[str] = None,
+                    now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Highest-risk entities with their current (decayed) score.
+
+        Returns:
+            List[dict]: entity, entity_type, score, article_count, source_count, last_date
+        """
+        query = ("SELECT entity, entity_type, rank_score, article_count, source_count, last_date "
+                 "FROM risk_scores")
+        parameters = []
+        if entity_type:
+            query += " WHERE entity_type = ?"
+            parameters.append(entity_type)
+        query += " ORDER BY rank_score DESC LIMIT ?"
+        parameters.append(limit)
+        with self._lock:
+            rows = self.connection.execute(query, parameters).fetchall()
+        decay = 1.0 / self._growth(now or datetime.now())
+        return [
+            {'entity': entity, 'entity_type': kind, 'score': round(rank_score * decay, 4),
+             'article_count': article_count, 'source_count': source_count, 'last_date': last_date}
+            for entity, kind, rank_score, article_count, source_count, last_date in rows
+        ]
+
+    def score(self, entity, now: Optional[datetime] = None) -> float:
+        """Current score of one entity (0 if it has none)"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT rank_score FROM risk_scores WHERE entity_key = ?", (f"{entity}".lower(),)
+            ).fetchone()
+        return row[0] / self._growth(now or datetime.now()) if row else 0.0
+
+    def clear(self):
+        """Remove all scores"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM risk_articles")
+            connection.execute("DELETE FROM risk_sources")
+            connection.execute("DELETE FROM risk_scores")
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -15,13 +15,17 @@ Updated keyword filtering system:
 - Enhanced precision for targeting specific fraud cases
 """
 
-import requests
-from bs4 import BeautifulSoup
 import re
 from datetime import datetime
 import time
 from urllib.parse import urljoin, urlparse
+from ._lazy import lazy_import
 from .data_manager import DataManager
+from .text_normalizer import StemmedKeywords
+
+# HTTP and HTML parsing libraries are loaded on first use
+requests = lazy_import("requests")
+bs4 = lazy_import("bs4")
 
 class NewsScraper:
     """
@@ -49,10 +53,14 @@ class NewsScraper:
         data_manager (DataManager): Handles data persistence and duplicate checking
     """
     
-    def __init__(self):
+    def __init__(self, profile=False, log_format="text"):
         """
         Initialize the NewsScraper with source configurations and settings.
         
+        Args:
+            profile (bool): Record a CPU and memory profile of the scrape session
+            log_format (str): Session log format, "text" or "json" (JSON lines)
+        
         Sets up:
         - Source configurations with URLs and CSS selectors
         - Financial crime keywords for filtering
@@ -219,15 +227,14 @@ class NewsScraper:
         ]
         
         # Condition 2: Must contain one of these crime/legal terms
+        # (matched as whole words after stemming, so affixed forms need not be listed)
         self.crime_keywords = [
             "tersangka",         # Suspect
             "korupsi",           # Corruption
             "fiktif",            # Fictitious/fake
-            "vonis",             # Verdict
-            "divonis",           # Sentenced
+            "vonis",             # Verdict (also divonis)
             "fraud",             # Fraud
-            "pembobol",          # Embezzler/hacker
-            "bobol",             # Breach/hack
+            "bobol",             # Breach/hack (also pembobol, dibobol)
             "ditahan",           # Detained
             "ditangkap",         # Arrested
             "skandal",           # Scandal
@@ -237,11 +244,21 @@ class NewsScraper:
             "judol",             # Online gambling (slang)
             "judi online",       # Online gambling
             "pencucian uang",   # Money laundering
-            "penipuan",          # Fraud/scam
+            "penipuan",          # Fraud/scam (also menipu, ditipu)
             "suap",              # Bribery
             "penggelapan pajak"  # Tax evasion
         ]
         
+        # Keywords matched only as written: their stems are too ambiguous
+        # ("ditahan" -> "tahan" as in "pertahanan", "bertahan"; "tersangka" -> "sangka")
+        self.exact_keywords = [
+            "ditahan",
+            "tersangka"
+        ]
+        
+        # Stemmed keyword matchers, keyed by keyword list
+        self._keyword_sets = {}
+        
         # Set up HTTP session with proper headers and connection pooling
         self.session = requests.Session()
         self.session.headers.update({
@@ -263,7 +280,7 @@ class NewsScraper:
         self.session.mount('https://', adapter)
         
         # Initialize data manager for duplicate checking and persistence
-        self.data_manager = DataManager()
+        self.data_manager = DataManager(profile=profile, log_format=log_format)
     
     def scrape_articles(self):
         """
@@ -324,6 +341,9 @@ class NewsScraper:
         self.data_manager._log(f"   - New articles saved: {total_new}")
         self.data_manager._log(f"   - Total in database: {self.data_manager.get_articles_count()}")
         
+        # Write profiling results (no-op when profiling is disabled)
+        self.data_manager.stop_profiling()
+        
         return all_articles
     
     def _scrape_category_page(self, source_name, source_config, category_url):
@@ -335,7 +355,7 @@ class NewsScraper:
             response = self.session.get(category_url, timeout=8)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = bs4.BeautifulSoup(response.content, 'html.parser')
             
             # Find article links using the configured selector
             article_links = soup.select(source_config["article_selector"])
@@ -428,7 +448,7 @@ class NewsScraper:
             response = self.session.get(url, timeout=8)  # Reduced timeout
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = bs4.BeautifulSoup(response.content, 'html.parser')
             
             # Extract title
             title_element = soup.select_one(source_config["title_selector"])
@@ -465,10 +485,22 @@ class NewsScraper:
             print(f"Error extracting data from {url}: {str(e)}")
             return None
     
+    def _keyword_set(self, keywords):
+        """Stemmed matcher for a keyword list, rebuilt when the list or the exact keywords change"""
+        signature = (tuple(keywords), tuple(self.exact_keywords))
+        if signature not in self._keyword_sets:
+            self._keyword_sets[signature] = StemmedKeywords(keywords, exact=self.exact_keywords)
+        return self._keyword_sets[signature]
+    
     def _contains_keywords(self, text):
         """
         Check if text contains both required keyword conditions (case-insensitive).
         
+        Keywords match whole words by their Indonesian stem, so "penipuan"
+        also matches "menipu" but "bank" does not match "bankrut". Keywords
+        in exact_keywords match only as written ("ditahan" does not match
+        "pertahanan"), and compounds such as "antikorupsi" match "korupsi".
+        
         Condition 1: Must contain at least one ABU-related keyword
         Condition 2: Must contain at least one crime/legal keyword
         
@@ -478,13 +510,11 @@ class NewsScraper:
         Returns:
             bool: True if both conditions are met, False otherwise
         """
-        text_lower = text.lower()
-        
         # Check condition 1: ABU-related keywords
-        # abu_found = any(keyword.lower() in text_lower for keyword in self.abu_keywords)
+        # abu_found = self._keyword_set(self.abu_keywords).contains(text)
         
-        # Check condition 2: Crime/legal keywords
-        crime_found = any(keyword.lower() in text_lower for keyword in self.crime_keywords)
+        # Check condition 2: Crime/legal keywords (whole words, any affixed form)
+        crime_found = self._keyword_set(self.crime_keywords).contains(text)
         
         # Both conditions must be met
         # return abu_found and crime_found # Original logic
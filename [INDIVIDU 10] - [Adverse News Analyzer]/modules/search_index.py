@@ -0,0 +1,197 @@
+"""
+Search Index Module
+
+Full-text search over article titles and bodies with SQLite FTS5.
+
+Every saved article is added to an FTS5 index at ingest, so ad-hoc searches
+such as `"kredit fiktif" BRI` are answered from the index (ranked with
+BM25, titles weighted above bodies, with a highlighted snippet) instead of
+running str.contains over every stored text.
+
+Queries use a small, forgiving syntax: text in double quotes is a phrase,
+other words must all occur (in any order), and a word ending in `*`
+matches as a prefix (`korup*`). Everything else is quoted before it
+reaches FTS5, so user input never causes a query syntax error.
+
+Storage is a single SQLite file (output/search.db by default). The article
+texts live in a regular `documents` table and the FTS5 table indexes it as
+external content, so texts are stored once and snippets can be built.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._sqlite import connect_sqlite
+
+QUERY_TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+WORD_PATTERN = re.compile(r'\w+')
+
+# BM25 column weights: (title, full_text)
+TITLE_WEIGHT = 5.0
+TEXT_WEIGHT = 1.0
+
+# Words of context around the matches in a snippet
+SNIPPET_TOKENS = 16
+
+
+def fts_query(text: str) -> str:
+    """
+    FTS5 MATCH expression for a user query ('' if it has no words).
+
+    Phrases in double quotes stay phrases; other words are quoted
+    individually (all must match); a trailing `*` makes a prefix query.
+    """
+    terms = []
+    for phrase, token in QUERY_TOKEN_PATTERN.findall(f"{text}"):
+        if phrase:
+            words = WORD_PATTERN.findall(phrase.lower())
+            if words:
+                terms.append('"' + " ".join(words) + '"')
+            continue
+        words = WORD_PATTERN.findall(token.lower())
+        for position, word in enumerate(words):
+            prefix = token.endswith("*") and position == len(words) - 1
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class SearchIndex:
+    """
+    FTS5 full-text index of article titles and texts.
+
+    Tables:
+    - documents(doc_id, article_id, url, title, source_name, publication_date, full_text)
+    - documents_fts: FTS5 index over documents(title, full_text)
+
+    Attributes:
+        db_path (str): Path of the SQLite index file
+
+    Usage:
+        index = SearchIndex("output/search.db")
+        index.add_article("https://example.com/a", article_data)
+        index.search('"kredit fiktif" BRI')
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        """SQLite connection, opened (and the schema created) on first use"""
+        if self._connection is None:
+            self._connection = connect_sqlite(self.db_path)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_id INTEGER PRIMARY KEY,
+                    article_id TEXT NOT NULL UNIQUE,
+                    url TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    source_name TEXT NOT NULL,
+                    publication_date TEXT NOT NULL,
+                    full_text TEXT NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    title, full_text,
+                    content='documents', content_rowid='doc_id',
+                    tokenize='unicode61 remove_diacritics 2'
+                );
+            """)
+        return self._connection
+
+    @staticmethod
+    def _row(article_id: str, article: Dict) -> Tuple:
+        def text(key):
+            value = article.get(key)
+            return '' if value is None or value != value else f"{value}"
+        return (article_id, text('url'), text('title'), text('source_name'),
+                text('publication_date'), text('full_text'))
+
+    def add_articles(self, articles: Iterable[Tuple[str, Dict]]) -> int:
+        """
+        Index articles in one transaction; articles already indexed are skipped.
+
+        Args:
+            articles: (article_id, article dict) pairs
+
+        Returns:
+            int: Number of newly indexed articles
+        """
+        added = 0
+        with self._lock, self.connection as connection:
+            for article_id, article in articles:
+                row = self._row(article_id, article)
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO documents "
+                    "(article_id, url, title, source_name, publication_date, full_text) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", row
+                )
+                if cursor.rowcount:
+                    connection.execute(
+                        "INSERT INTO documents_fts (rowid, title, full_text) VALUES (?, ?, ?)",
+                        (cursor.lastrowid, row[2], row[5])
+                    )
+                    added += 1
+        return added
+
+    def add_article(self, article_id: str, article: Dict) -> bool:
+        """Index one article; returns False if it was already indexed"""
+        return self.add_articles([(article_id, article)]) == 1
+
+    def search(self, query: str, limit: int = 20, source: Optional[str] = None) -> List[Dict]:
+        """
+        Ranked articles matching a query.
+
+        Args:
+            query (str): Words, "quoted phrases" and prefix* words, all required
+            limit (int): Maximum number of results
+            source (str): Only articles of this source_name
+
+        Returns:
+            List[Dict]: article_id, url, title, source_name, publication_date,
+            score (higher is better) and snippet (matches in **bold**)
+        """
+        expression = fts_query(query)
+        if not expression:
+            return []
+        condition, params = "", [expression]
+        if source is not None:
+            condition = "AND d.source_name = ?"
+            params.append(source)
+        with self._lock:
+            rows = self.connection.execute(f"""
+                SELECT d.article_id, d.url, d.title, d.source_name, d.publication_date,
+                       -bm25(documents_fts, {TITLE_WEIGHT}, {TEXT_WEIGHT}) AS score,
+                       snippet(documents_fts, -1, '**', '**', '…', {SNIPPET_TOKENS}) AS snippet
+                FROM documents_fts
+                JOIN documents d ON d.doc_id = documents_fts.rowid
+                WHERE documents_fts MATCH ? {condition}
+                ORDER BY bm25(documents_fts, {TITLE_WEIGHT}, {TEXT_WEIGHT})
+                LIMIT ?
+            """, params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """Number of indexed articles"""
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def clear(self):
+        """Remove all indexed articles"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM documents")
+            connection.execute("INSERT INTO documents_fts (documents_fts) VALUES ('delete-all')")
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,267 @@
+"""
+Session Archive Module
+
+Compaction and retention of the per-session files in the output directory.
+
+Every scrape session leaves an `articles_<session>.csv` and a
+`process_log_<session>.txt` (plus profiles when profiling) next to the
+article store, so after months of operation output/ holds thousands of
+small files and every listing or scan of it slows down. SessionArchive
+moves them into `output/archive/`:
+
+- Session CSVs are compacted into one gzip-compressed CSV segment per
+  session month (`archive/articles_YYYY-MM.csv.gz`) with a `session`
+  column; each segment holds an article URL once (articles without a URL
+  are all kept).
+- Session logs and profiles are gzip-compressed into
+  `archive/logs/YYYY-MM/`.
+- Logs older than the retention period are deleted, wherever they are.
+- `archive/manifest.json` lists the segments (rows, sessions, publication
+  date range, size) and the archived logs of every month.
+
+Only files untouched for `min_age_hours` are compacted, so running
+sessions keep their files. Segments and the manifest are replaced
+atomically and the session files are only removed afterwards, so an
+interrupted compaction is simply redone (and deduplicated) next time.
+
+Usage:
+    archive = SessionArchive("output")
+    archive.compact()
+    archive.expire_logs(retention_days=30)
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from ._lazy import lazy_import
+from .article_store import canonical_url
+from .file_lock import FileLock
+
+pd = lazy_import("pandas")
+
+MANIFEST_VERSION = 1
+
+SESSION_CSV_PATTERN = re.compile(r"^articles_(\d{8}_\d{6})\.csv$")
+
+# Session logs: process logs (rotated ones too) and profiler output
+SESSION_LOG_PATTERN = re.compile(
+    r"^(?:process_log_(\d{8}_\d{6})\.(?:txt|jsonl)(?:\.\d+)?|profile_(\d{8}_\d{6})\.folded|memory_(\d{8}_\d{6})\.txt)$"
+)
+
+# Files modified more recently than this may belong to a running session
+DEFAULT_MIN_AGE_HOURS = 1
+
+DEFAULT_LOG_RETENTION_DAYS = 30
+
+
+def _session_time(session: str) -> datetime:
+    return datetime.strptime(session, "%Y%m%d_%H%M%S")
+
+
+def _month(session: str) -> str:
+    return f"{session[:4]}-{session[4:6]}"
+
+
+class SessionArchive:
+    """
+    Month-partitioned archive of session CSVs and logs.
+
+    Attributes:
+        output_dir (str): Directory holding the session files
+        archive_dir (str): Directory holding the segments, logs and manifest
+        manifest_file (str): Path of manifest.json
+    """
+
+    def __init__(self, output_dir: str = "output", archive_dir: Optional[str] = None):
+        self.output_dir = output_dir
+        self.archive_dir = archive_dir or os.path.join(output_dir, "archive")
+        self.manifest_file = os.path.join(self.archive_dir, "manifest.json")
+        self.logs_dir = os.path.join(self.archive_dir, "logs")
+
+    def manifest(self) -> Dict:
+        """The manifest (empty if nothing was archived yet)"""
+        try:
+            with open(self.manifest_file, encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            manifest = None
+        if not manifest or manifest.get('version') != MANIFEST_VERSION:
+            manifest = {'version': MANIFEST_VERSION, 'segments': {}, 'logs': {}}
+        return manifest
+
+    def _write_manifest(self, manifest: Dict):
+        manifest['updated'] = datetime.now().isoformat(timespec="seconds")
+        temp_file = self.manifest_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(temp_file, self.manifest_file)
+
+    def _lock(self) -> FileLock:
+        os.makedirs(self.archive_dir, exist_ok=True)
+        return FileLock(os.path.join(self.archive_dir, "archive.lock"))
+
+    def segment_file(self, month: str) -> str:
+        """Path of the article segment of a month ('YYYY-MM')"""
+        return os.path.join(self.archive_dir, f"articles_{month}.csv.gz")
+
+    def _inactive(self, pattern, min_age_hours: float, now: float) -> Dict[str, str]:
+        """{file name: session} of the session files untouched for min_age_hours"""
+        files = {}
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match and entry.is_file() and now - entry.stat().st_mtime >= min_age_hours * 3600:
+                    files[entry.name] = next(group for group in match.groups() if group)
+        return files
+
+    def compact(self, min_age_hours: float = DEFAULT_MIN_AGE_HOURS, now: Optional[float] = None) -> Dict:
+        """
+        Move inactive session CSVs into month segments and session logs into archive/logs.
+
+        Args:
+            min_age_hours (float): Only files not modified for this long are archived
+            now (float): Current time as a timestamp (default: time.time())
+
+        Returns:
+            dict: sessions, rows, duplicates, months and logs archived
+        """
+        now = time.time() if now is None else now
+        result = {'sessions': 0, 'rows': 0, 'duplicates': 0, 'months': [], 'logs': 0}
+        with self._lock():
+            manifest = self.manifest()
+
+            by_month = {}
+            for name, session in sorted(self._inactive(SESSION_CSV_PATTERN, min_age_hours, now).items()):
+                by_month.setdefault(_month(session), []).append((name, session))
+            for month, files in sorted(by_month.items()):
+                rows, duplicates = self._compact_month(manifest, month, files)
+                result['sessions'] += len(files)
+                result['rows'] += rows
+                result['duplicates'] += duplicates
+                result['months'].append(month)
+
+            for name, session in sorted(self._inactive(SESSION_LOG_PATTERN, min_age_hours, now).items()):
+                self._archive_log(manifest, name, _month(session))
+                result['logs'] += 1
+        return result
+
+    def _compact_month(self, manifest: Dict, month: str, files: List) -> tuple:
+        """Merge session files into the segment of a month; returns (rows added, duplicates dropped)"""
+        segment_file = self.segment_file(month)
+        frames = []
+        if os.path.exists(segment_file):
+            frames.append(pd.read_csv(segment_file, dtype=str, keep_default_na=False, encoding='utf-8'))
+        existing_rows = len(frames[0]) if frames else 0
+        for name, session in files:
+            df = pd.read_csv(os.path.join(self.output_dir, name), dtype=str, keep_default_na=False,
+                             encoding='utf-8')
+            df['session'] = session
+            frames.append(df)
+        df = pd.concat(frames, ignore_index=True)
+        total = len(df)
+        # Articles without a URL are never duplicates (see DataManager.check_duplicate)
+        keys = df['url'].map(canonical_url)
+        df = df[(keys == '') | ~keys.duplicated()]
+
+        temp_file = segment_file + '.tmp'
+        df.to_csv(temp_file, index=False, encoding='utf-8', compression='gzip')
+        os.replace(temp_file, segment_file)
+
+        segment = manifest['segments'].get(month, {})
+        dates = pd.to_datetime(df['publication_date'], format='mixed', errors='coerce').dropna()
+        manifest['segments'][month] = {
+            'file': os.path.basename(segment_file),
+            'rows': len(df),
+            'bytes': os.path.getsize(segment_file),
+            'sessions': sorted(set(segment.get('sessions', [])) | {session for _, session in files}),
+            'min_date': dates.min().isoformat(sep=' ') if len(dates) else None,
+            'max_date': dates.max().isoformat(sep=' ') if len(dates) else None,
+        }
+        self._write_manifest(manifest)
+
+        # The session files are only removed once the segment and manifest are in place
+        for name, _ in files:
+            os.remove(os.path.join(self.output_dir, name))
+        return len(df) - existing_rows, total - len(df)
+
+    def _archive_log(self, manifest: Dict, name: str, month: str):
+        """Gzip a session log into archive/logs/<month>/ and remove the original"""
+        directory = os.path.join(self.logs_dir, month)
+        os.makedirs(directory, exist_ok=True)
+        target = os.path.join(directory, name + ".gz")
+        with open(os.path.join(self.output_dir, name), 'rb') as source, gzip.open(target + '.tmp', 'wb') as file:
+            shutil.copyfileobj(source, file)
+        os.replace(target + '.tmp', target)
+        logs = set(manifest['logs'].get(month, []))
+        logs.add(name + ".gz")
+        manifest['logs'][month] = sorted(logs)
+        self._write_manifest(manifest)
+        os.remove(os.path.join(self.output_dir, name))
+
+    def expire_logs(self, retention_days: float = DEFAULT_LOG_RETENTION_DAYS,
+                    now: Optional[float] = None) -> int:
+        """
+        Delete session logs (archived or not) of sessions older than retention_days.
+
+        Returns:
+            int: Number of files deleted
+        """
+        now = time.time() if now is None else now
+        cutoff = datetime.fromtimestamp(now) - timedelta(days=retention_days)
+        deleted = 0
+        with self._lock():
+            manifest = self.manifest()
+            for name, session in self._inactive(SESSION_LOG_PATTERN, 0, now).items():
+                if _session_time(session) < cutoff:
+                    os.remove(os.path.join(self.output_dir, name))
+                    deleted += 1
+
+            archived_deleted = 0
+            for month in sorted(manifest['logs']):
+                kept = []
+                for name in manifest['logs'][month]:
+                    match = SESSION_LOG_PATTERN.match(name[:-len(".gz")])
+                    session = next(group for group in match.groups() if group)
+                    if _session_time(session) < cutoff:
+                        try:
+                            os.remove(os.path.join(self.logs_dir, month, name))
+                        except FileNotFoundError:
+                            pass
+                        archived_deleted += 1
+                    else:
+                        kept.append(name)
+                if kept:
+                    manifest['logs'][month] = kept
+                else:
+                    del manifest['logs'][month]
+                    shutil.rmtree(os.path.join(self.logs_dir, month), ignore_errors=True)
+            if archived_deleted:
+                self._write_manifest(manifest)
+        return deleted + archived_deleted
+
+    def load(self, months: Optional[List[str]] = None, columns: Optional[List[str]] = None):
+        """
+        Archived session articles as one DataFrame.
+
+        Args:
+            months: Only these months ('YYYY-MM'; default: all)
+            columns: Only these columns (default: all, including `session`)
+        """
+        segments = self.manifest()['segments']
+        frames = [
+            pd.read_csv(os.path.join(self.archive_dir, segments[month]['file']), usecols=columns,
+                        dtype=str, keep_default_na=False, encoding='utf-8')
+            for month in sorted(segments) if months is None or month in months
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
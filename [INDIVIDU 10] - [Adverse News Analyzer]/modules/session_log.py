@@ -0,0 +1,153 @@
+"""
+Session Log Module
+
+Streaming writer for the per-session process log (process_log_<session>.txt).
+
+DataManager used to keep every log line of a session in a list and rewrite
+the whole file from it at the end, so memory grew with the session and a
+crash before the final save lost the whole log. A SessionLog instead hands
+each line to a bounded queue; one background thread, shared by all session
+logs of the process, appends the lines to their files as they arrive.
+
+- Logging never blocks on disk I/O: a full queue drops the line and counts
+  it in `dropped` instead of waiting.
+- Memory is bounded by the queue size, whatever the length of the session.
+- Files rotate by size (`process_log_<session>.txt.1`, `.2`, ...).
+- With json_lines=True every line is a JSON object (time, session,
+  message and any extra fields) for log tooling.
+
+Built on the standard library: logging.handlers.QueueListener drains the
+queue into one RotatingFileHandler per session log.
+
+Usage:
+    log = SessionLog("output/process_log_20250801_120000.txt", session="20250801_120000")
+    log.write("Scraping started")
+    log.flush()
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from datetime import datetime
+
+# Lines waiting to be written, across all session logs of the process
+QUEUE_SIZE = 10000
+
+# Size at which a session log rotates, and rotated files kept
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: time, session, message and extra fields"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="seconds"),
+            "session": record.session,
+            "message": record.getMessage(),
+        }
+        entry.update(record.fields)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _Dispatcher(logging.Handler):
+    """Hands each queued record to the file handler of its session log"""
+
+    def handle(self, record):
+        record.target.handle(record)
+        return True
+
+
+class _Writer:
+    """The process-wide queue and the background thread draining it"""
+
+    def __init__(self):
+        self.queue = queue.Queue(QUEUE_SIZE)
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = logging.handlers.QueueListener(self.queue, _Dispatcher())
+                self._listener.start()
+                atexit.register(self.stop)
+
+    def stop(self):
+        """Write the remaining lines and stop the thread"""
+        with self._lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+
+
+_writer = _Writer()
+
+
+class SessionLog:
+    """
+    Asynchronous, size-rotated log file of one session.
+
+    Attributes:
+        path (str): Log file
+        session (str): Session ID recorded in JSON lines
+        json_lines (bool): Write JSON objects instead of "[time] message" lines
+        dropped (int): Lines dropped because the queue was full
+    """
+
+    def __init__(self, path: str, session: str = "", max_bytes: int = DEFAULT_MAX_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, json_lines: bool = False):
+        self.path = path
+        self.session = session
+        self.json_lines = json_lines
+        self.dropped = 0
+        self._closed = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # The file is only created when the first line is written
+        self._handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+        )
+        self._handler.setFormatter(
+            JsonLinesFormatter() if json_lines
+            else logging.Formatter("[%(asctime)s] %(message)s", TIMESTAMP_FORMAT)
+        )
+
+    def write(self, message: str, **fields):
+        """Queue a line (timestamped now); never blocks"""
+        if self._closed:
+            return
+        record = logging.LogRecord("session", logging.INFO, __file__, 0, message, None, None)
+        record.target = self._handler
+        record.session = self.session
+        record.fields = fields
+        _writer.ensure_started()
+        try:
+            _writer.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Wait until every queued line has been written"""
+        if _writer._listener is not None:
+            _writer.queue.join()
+
+    def close(self):
+        """Write the queued lines and close the file; later writes are ignored"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._handler.close()
@@ -0,0 +1,283 @@
+"""
+Text Normalization Module
+
+Word-boundary tokenization and Indonesian stemming for keyword matching.
+
+Matching keywords as raw substrings needs every inflected form listed
+("menipu", "penipu", "penipuan", "ditipu") and lets short keywords match
+inside unrelated words ("bank" in "bankrut"). Here texts and keywords are
+both reduced to sequences of word stems, so one root keyword ("tipu")
+covers all its affixed forms and only ever matches whole words.
+
+The stemmer is a rule-based affix stripper in the style of Nazief & Adriani:
+particles (-lah, -kah, -tah, -pun), possessives (-ku, -mu, -nya), a
+derivational suffix (-kan, -an, -i) and up to two prefixes (di-, ke-, se-,
+ter-, ber-, per-, meN-, peN-, with the nasal sound changes of meN-/peN-
+undone, e.g. "menipu" -> "tipu", "penyuapan" -> "suap"). Without a full
+dictionary some affixes are ambiguous; the alternatives are tried and the
+first one found in a small seed lexicon of roots (ROOT_WORDS) wins, else
+the default rule applies. Texts and keywords go through the same function,
+so a stem only needs to be consistent, not linguistically exact.
+
+News vocabulary is highly repetitive, so stems are memoized in a large LRU
+cache: after warm-up, normalizing an article is mostly cache hits.
+
+StemmedKeywords matches a keyword list against texts. Keywords whose stem
+is too ambiguous ("ditahan" -> "tahan", as in "pertahanan" and "bertahan")
+can be matched exactly as written instead, and single-word keywords also
+match behind a compounding prefix ("antikorupsi").
+
+Usage:
+    from modules.text_normalizer import stem, stem_tokens
+    stem("penipuan")                       # 'tipu'
+    stem_tokens("Pelaku menipu nasabah")   # ['laku', 'tipu', 'nasabah']
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Distinct word forms kept in the stem cache
+STEM_CACHE_SIZE = 200_000
+
+# Words this short are never stemmed, and stems never get shorter than this
+MIN_STEM_LENGTH = 3
+
+PARTICLES = ("lah", "kah", "tah", "pun")
+POSSESSIVES = ("nya", "ku", "mu")
+DERIVATIONAL_SUFFIXES = ("kan", "an", "i")
+
+VOWELS = set("aeiou")
+
+# Bound prefixes written together with the word they modify ("antikorupsi", "pascavonis")
+COMPOUND_PREFIXES = ("anti", "antar", "multi", "nir", "non", "pasca", "pra")
+
+# Roots that look affixed, or resolve ambiguous affixes (seed lexicon)
+ROOT_WORDS = {
+    # Domain roots
+    "bank", "pajak", "tahan", "cuci", "suap", "tipu", "judi", "korupsi", "kirim", "kelabu",
+    "palsu", "periksa", "peras", "perintah", "pidana", "pihak", "tindak", "masuk", "rusak",
+    "dakwa", "adil", "aman", "aku", "ajar", "curi", "sita", "awas", "usut", "ungkap", "usaha",
+    "rampok", "rugi", "tuntut", "duga", "dana", "kasus", "modus", "teror", "beli", "bayar", "laku",
+    # Common words that only look affixed
+    "berita", "bersih", "besar", "benar", "beda", "sekolah", "kepala", "semua", "serta", "sedang",
+    "sesuai", "selama", "sekitar", "kena", "kemarin", "pemilu", "peran", "perlu", "pernah",
+    "tengah", "terus", "teman", "tepat", "dengan", "dinas", "diri", "dia", "manusia", "milik",
+    "masalah", "jumlah", "sejumlah",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens (runs of word characters) of a text"""
+    return TOKEN_PATTERN.findall(f"{text}".lower())
+
+
+def _strip_inflection(word: str) -> str:
+    """Remove a particle, then a possessive suffix"""
+    for suffixes in (PARTICLES, POSSESSIVES):
+        for suffix in suffixes:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH + 1:
+                word = word[:-len(suffix)]
+                break
+    return word
+
+
+def _suffix_variants(word: str) -> List[Tuple[str, bool]]:
+    """
+    Word forms with a derivational suffix removed, as (form, is_default) pairs.
+
+    -kan and -an are default removals; -i is only accepted when the result is
+    a known root, since many loanwords end in -i ("korupsi", "investasi").
+    At least MIN_STEM_LENGTH + 1 letters must remain ("bukan" is kept).
+    """
+    variants = []
+    for suffix in DERIVATIONAL_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) > MIN_STEM_LENGTH:
+            variants.append((word[:-len(suffix)], suffix != "i"))
+    variants.append((word, True))
+    return variants
+
+
+def _prefix_variants(word: str) -> List[str]:
+    """Forms with one prefix removed, default reading first (empty if no prefix)"""
+    if len(word) < MIN_STEM_LENGTH + 2:
+        return []
+    for prefix in ("di", "ke", "se"):
+        if word.startswith(prefix):
+            return [word[2:]]
+
+    for nasal in ("me", "pe"):
+        if not word.startswith(nasal):
+            continue
+        rest = word[2:]
+        if rest.startswith("ny") and rest[2:3] in VOWELS:
+            return ["s" + rest[2:]]
+        if rest.startswith("ng"):
+            if rest[2:3] in VOWELS:
+                return [rest[2:], "k" + rest[2:]]
+            return [rest[2:]]
+        if rest.startswith("m"):
+            if rest[1:2] in VOWELS:
+                return ["p" + rest[1:], rest[1:], rest]
+            if rest[1:2] in ("b", "f", "p", "v"):
+                return [rest[1:]]
+        if rest.startswith("n"):
+            if rest[1:2] in VOWELS:
+                return ["t" + rest[1:], rest]
+            if rest[1:2] in ("c", "d", "j", "z", "t", "s"):
+                return [rest[1:]]
+        if nasal == "pe" and rest.startswith("r"):
+            # per- (perbankan) or pe- + r-root (perampok)
+            if rest[1:2] in VOWELS:
+                return [rest, rest[1:]]
+            return [rest[1:]]
+        if rest[:1] in ("l", "m", "n", "r", "w", "y"):
+            return [rest]
+        return []
+
+    if word.startswith("ber") or word.startswith("ter"):
+        rest = word[3:]
+        return [rest, "r" + rest] if rest[:1] in VOWELS else [rest]
+    if word.startswith("belajar"):
+        return [word[3:]]
+    return []
+
+
+def _prefix_forms(word: str, depth: int = 2) -> List[str]:
+    """All forms reachable by removing up to `depth` prefixes, default reading first"""
+    forms = []
+    for form in _prefix_variants(word):
+        if len(form) < MIN_STEM_LENGTH:
+            continue
+        forms.append(form)
+        if depth > 1 and form not in ROOT_WORDS:
+            forms.extend(_prefix_forms(form, depth - 1))
+    return forms
+
+
+def _default_prefix_form(word: str, depth: int = 2) -> str:
+    """Remove up to `depth` prefixes, always taking the default reading"""
+    for _ in range(depth):
+        if word in ROOT_WORDS:
+            break
+        variants = [form for form in _prefix_variants(word) if len(form) >= MIN_STEM_LENGTH]
+        if not variants:
+            break
+        word = variants[0]
+    return word
+
+
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem(word: str) -> str:
+    """
+    Stem of one lower-cased word.
+
+    Words with digits or of at most MIN_STEM_LENGTH letters are returned as is.
+    """
+    if len(word) <= MIN_STEM_LENGTH or word in ROOT_WORDS or not word.isalpha():
+        return word
+    stripped = _strip_inflection(word)
+    # The unstripped word is also tried: "pelaku" is "laku", not "pela" + -ku
+    bases = [stripped] if stripped == word else [stripped, word]
+
+    default = None
+    for base in bases:
+        for form, is_default in _suffix_variants(base):
+            if form in ROOT_WORDS:
+                return form
+            for candidate in _prefix_forms(form):
+                if candidate in ROOT_WORDS:
+                    return candidate
+            if is_default and default is None:
+                default = _default_prefix_form(form)
+    return default
+
+
+def stem_tokens(text: str) -> List[str]:
+    """Stems of the word tokens of a text, in order"""
+    return [stem(token) for token in TOKEN_PATTERN.findall(f"{text}".lower())]
+
+
+def stem_spans(text: str) -> List[Tuple[str, int]]:
+    """(stem, end offset) of every word token of a lower-cased text"""
+    return [(stem(match.group()), match.end()) for match in TOKEN_PATTERN.finditer(text)]
+
+
+def stem_phrase(phrase: str) -> Tuple[str, ...]:
+    """Stem sequence of a keyword phrase (empty if it has no word characters)"""
+    return tuple(stem_tokens(phrase))
+
+
+def stem_cache_info():
+    """Hit/miss statistics of the stem cache (functools.lru_cache info)"""
+    return stem.cache_info()
+
+
+def _by_first(phrases: List[Tuple[str, ...]]) -> Dict[str, List[Tuple[str, ...]]]:
+    """Phrases grouped by their first word"""
+    groups = {}
+    for phrase in phrases:
+        groups.setdefault(phrase[0], []).append(phrase)
+    return groups
+
+
+def _find(by_first: Dict[str, List[Tuple[str, ...]]], words: List[str]):
+    """Yield (position, phrase) for every phrase occurrence in a word sequence"""
+    for position, current in enumerate(words):
+        for phrase in by_first.get(current, ()):
+            if len(phrase) == 1 or tuple(words[position:position + len(phrase)]) == phrase:
+                yield position, phrase
+
+
+class StemmedKeywords:
+    """
+    Set of keywords matched on whole-word stems.
+
+    Keywords that reduce to the same stems ("menipu", "penipuan") collapse
+    into one entry. Keywords listed in `exact` are matched as the words
+    written instead. Single-word stemmed keywords also match as the second
+    part of a compound with one of COMPOUND_PREFIXES ("antikorupsi").
+
+    Usage:
+        keywords = StemmedKeywords(["penipuan", "pencucian uang", "ditahan"], exact=["ditahan"])
+        keywords.contains("Pelaku diduga menipu nasabah")   # True
+        keywords.contains("Rupiah bertahan di level 16.000")   # False
+    """
+
+    def __init__(self, keywords: Iterable[str], exact: Iterable[str] = ()):
+        exact = {f"{keyword}".lower() for keyword in exact}
+        keywords = [f"{keyword}".lower() for keyword in keywords]
+        stemmed = [keyword for keyword in keywords if keyword not in exact]
+        self.phrases = sorted({phrase for phrase in map(stem_phrase, stemmed) if phrase})
+        self.exact_phrases = sorted({phrase for phrase in (tuple(tokenize(keyword)) for keyword in keywords
+                                                           if keyword in exact) if phrase})
+        self._by_first = _by_first(self.phrases)
+        self._exact_by_first = _by_first(self.exact_phrases)
+
+        words = sorted({keyword for keyword in stemmed if len(tokenize(keyword)) == 1}, key=len, reverse=True)
+        self._compounds = None
+        if words:
+            self._compounds = re.compile(r"\b(?:%s)(?:%s)" % ("|".join(COMPOUND_PREFIXES),
+                                                              "|".join(map(re.escape, words))))
+
+    def __len__(self):
+        return len(self.phrases) + len(self.exact_phrases)
+
+    def find(self, stems: List[str]):
+        """Yield (position, phrase) for every stemmed keyword occurrence in a stem sequence"""
+        return _find(self._by_first, stems)
+
+    def contains(self, text: str) -> bool:
+        """Whether any keyword occurs in `text` as whole words (or behind a compounding prefix)"""
+        tokens = tokenize(text)
+        if next(_find(self._exact_by_first, tokens), None) is not None:
+            return True
+        if next(self.find([stem(token) for token in tokens]), None) is not None:
+            return True
+        return self._compounds is not None and self._compounds.search(f"{text}".lower()) is not None
@@ -0,0 +1,265 @@
+"""
+Transformer Classifier Module
+
+Opt-in transformer backend for NewsCategorizor, tuned for CPU-only backfills.
+
+The model (a fine-tuned sequence-classification checkpoint whose labels are
+the category names, or are mapped to them with `label_map`) is only loaded
+on the first prediction, so selecting the backend costs nothing until it is
+used. Long articles are split into overlapping token windows of the model's
+maximum length; windows of all articles are sorted by length and packed into
+dynamically sized batches bounded by a token budget, so little time is spent
+on padding. Window probabilities are averaged per article.
+
+CPU options:
+- num_threads: torch intra-op threads (torch.set_num_threads)
+- quantize: dynamic int8 quantization of the Linear layers (PyTorch models
+  only; ignored with a warning for ONNX models)
+- onnx: run an ONNX export through onnxruntime (requires `optimum[onnxruntime]`)
+
+The version that keys memoized results hashes the name, size and
+modification time of the model's config, tokenizer and weight files plus the
+options that change predictions, so retraining a model in place or changing
+its windowing does not reuse stale cached categories.
+
+torch, transformers and optimum are optional dependencies: they are imported
+when the model is loaded, never at module import.
+
+Usage:
+    categorizer = NewsCategorizor(backend="transformer", model_path="models/aml-indobert",
+                                  backend_options={"num_threads": 4, "quantize": True})
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+import logging
+from ._lazy import lazy_import
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Padded tokens per forward pass; ~16 windows of 512 tokens
+DEFAULT_MAX_BATCH_TOKENS = 8192
+
+# Files of a model directory that determine its predictions (config, tokenizer, weights)
+MODEL_FILE_SUFFIXES = (".json", ".txt", ".model", ".safetensors", ".bin", ".pt", ".onnx")
+
+
+def plan_batches(lengths: Sequence[int], max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+                 max_batch_size: int = 64) -> List[List[int]]:
+    """
+    Group sequences into batches of similar length under a padded-token budget.
+
+    Sequences are sorted by length, and a batch is closed as soon as adding
+    the next sequence would make (batch size x longest length) exceed
+    `max_batch_tokens` or the batch reach `max_batch_size`.
+
+    Args:
+        lengths: Token length of each sequence
+        max_batch_tokens (int): Budget of padded tokens per batch
+        max_batch_size (int): Maximum number of sequences per batch
+
+    Returns:
+        List[List[int]]: Sequence indices per batch
+    """
+    batches, current, longest = [], [], 0
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        length = max(lengths[index], 1)
+        if current and (max(longest, length) * (len(current) + 1) > max_batch_tokens
+                        or len(current) >= max_batch_size):
+            batches.append(current)
+            current, longest = [], 0
+        current.append(index)
+        longest = max(longest, length)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def average_by_article(probabilities, article_of_window, article_count: int):
+    """
+    Average window probabilities per article.
+
+    Args:
+        probabilities: windows x classes probability matrix
+        article_of_window: Article index of each window
+        article_count (int): Number of articles
+
+    Returns:
+        ndarray: articles x classes averaged probabilities
+    """
+    article_of_window = np.asarray(article_of_window, dtype=np.intp)
+    totals = np.zeros((article_count, probabilities.shape[1]), dtype=np.float64)
+    np.add.at(totals, article_of_window, probabilities)
+    counts = np.bincount(article_of_window, minlength=article_count)[:, None]
+    return totals / np.maximum(counts, 1)
+
+
+class TransformerTextClassifier:
+    """
+    Lazily loaded transformer sequence classifier with dynamic batching.
+
+    Attributes:
+        model_path (str): Hugging Face model name or local directory
+        version (str): Identifier used to key memoized results (no load needed)
+        classes (List[str]): Category per model output (available after loading)
+
+    Args:
+        model_path (str): Model name or directory (ONNX export when onnx=True)
+        max_length (int): Window length in tokens (default: model maximum, capped at 512)
+        stride (int): Tokens shared by consecutive windows of a long article
+        max_windows (int): Maximum windows per article (bounds cost of very long texts)
+        max_batch_tokens (int): Padded-token budget per forward pass
+        num_threads (int): torch intra-op threads (None keeps the torch default)
+        quantize (bool): Apply dynamic int8 quantization (PyTorch models; ignored with onnx)
+        onnx (bool): Load an ONNX model through optimum/onnxruntime
+        label_map (Dict[str, str]): Model label -> category name
+    """
+
+    def __init__(self, model_path: str, max_length: Optional[int] = None, stride: int = 64,
+                 max_windows: int = 8, max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+                 num_threads: Optional[int] = None, quantize: bool = False, onnx: bool = False,
+                 label_map: Optional[Dict[str, str]] = None):
+        self.model_path = model_path
+        self.max_length = max_length
+        self.stride = stride
+        self.max_windows = max_windows
+        self.max_batch_tokens = max_batch_tokens
+        self.num_threads = num_threads
+        if quantize and onnx:
+            logger.warning("quantize is ignored for ONNX models; quantize the ONNX export instead")
+        self.quantize = quantize and not onnx
+        self.onnx = onnx
+        self.label_map = label_map or {}
+        self.classes = []
+        self.version = self._compute_version()
+        self._tokenizer = None
+        self._model = None
+        self._torch = None
+        self._lock = threading.Lock()
+
+    def _compute_version(self) -> str:
+        """Model name plus a short hash of its files and of the options that change predictions"""
+        digest = hashlib.sha1()
+        if os.path.isdir(self.model_path):
+            for name in sorted(os.listdir(self.model_path)):
+                path = os.path.join(self.model_path, name)
+                if name.endswith(MODEL_FILE_SUFFIXES) and os.path.isfile(path):
+                    stat = os.stat(path)
+                    digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+        else:
+            # Hugging Face model name
+            digest.update(self.model_path.encode('utf-8'))
+        options = (self.onnx, self.quantize, self.max_length, self.stride, self.max_windows,
+                   sorted(self.label_map.items()))
+        digest.update(repr(options).encode('utf-8'))
+        name = os.path.basename(os.path.normpath(self.model_path))
+        return f"{name}{'-onnx' if self.onnx else ''}{'-int8' if self.quantize else ''}-{digest.hexdigest()[:12]}"
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the model has been loaded"""
+        return self._model is not None
+
+    def _load(self):
+        """Import the optional dependencies and load tokenizer and model"""
+        with self._lock:
+            if self._model is not None:
+                return
+            try:
+                import torch
+                from transformers import AutoTokenizer
+            except ImportError as e:
+                raise ImportError(
+                    "The transformer backend needs torch and transformers (pip install torch transformers)"
+                ) from e
+
+            if self.num_threads:
+                torch.set_num_threads(self.num_threads)
+            tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+
+            if self.onnx:
+                try:
+                    from optimum.onnxruntime import ORTModelForSequenceClassification
+                except ImportError as e:
+                    raise ImportError(
+                        "ONNX models need optimum with onnxruntime (pip install optimum[onnxruntime])"
+                    ) from e
+                import onnxruntime
+                session_options = onnxruntime.SessionOptions()
+                if self.num_threads:
+                    session_options.intra_op_num_threads = self.num_threads
+                model = ORTModelForSequenceClassification.from_pretrained(
+                    self.model_path, session_options=session_options
+                )
+            else:
+                from transformers import AutoModelForSequenceClassification
+                model = AutoModelForSequenceClassification.from_pretrained(self.model_path)
+                model.eval()
+                if self.quantize:
+                    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+            model_max = getattr(tokenizer, "model_max_length", 512) or 512
+            self.max_length = min(self.max_length or model_max, model_max, 512)
+            id2label = model.config.id2label
+            self.classes = [self.label_map.get(id2label[i], id2label[i]) for i in range(len(id2label))]
+            self._torch, self._tokenizer, self._model = torch, tokenizer, model
+            logger.info(f"Loaded transformer model {self.model_path} "
+                        f"({'onnx' if self.onnx else 'torch'}, {torch.get_num_threads()} threads)")
+
+    def _windows(self, texts: Sequence[str]):
+        """Tokenize texts into overlapping windows; returns (encodings, article index per window)"""
+        encoded = self._tokenizer(
+            list(texts),
+            truncation=True,
+            max_length=self.max_length,
+            stride=self.stride,
+            return_overflowing_tokens=True,
+        )
+        article_of_window = encoded.pop("overflow_to_sample_mapping")
+        # Keep the first max_windows windows of each article
+        kept, per_article = [], {}
+        for window, article in enumerate(article_of_window):
+            per_article[article] = per_article.get(article, 0) + 1
+            if per_article[article] <= self.max_windows:
+                kept.append(window)
+        windows = [{key: encoded[key][window] for key in encoded.keys()} for window in kept]
+        return windows, [article_of_window[window] for window in kept]
+
+    def predict_proba(self, texts: Sequence[str]):
+        """
+        Category probabilities of each text.
+
+        Returns:
+            ndarray: texts x classes probabilities (averaged over windows)
+        """
+        if self._model is None:
+            self._load()
+        if not len(texts):
+            return np.zeros((0, len(self.classes)))
+
+        windows, article_of_window = self._windows(texts)
+        probabilities = np.zeros((len(windows), len(self.classes)), dtype=np.float32)
+        lengths = [len(window["input_ids"]) for window in windows]
+        with self._torch.inference_mode():
+            for batch in plan_batches(lengths, self.max_batch_tokens):
+                inputs = self._tokenizer.pad([windows[i] for i in batch], return_tensors="pt")
+                logits = self._model(**inputs).logits
+                probabilities[batch] = self._torch.softmax(logits.float(), dim=-1).cpu().numpy()
+        return average_by_article(probabilities, article_of_window, len(texts))
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        """Most likely category of each text"""
+        probabilities = self.predict_proba(texts)
+        return [self.classes[index] for index in probabilities.argmax(axis=1)]
+
+    def predict_one(self, text: str) -> str:
+        """Most likely category of one text"""
+        return self.predict([text])[0]
@@ -0,0 +1,306 @@
+"""
+Watchlist Screening Module
+
+Screens articles against a watchlist of names at ingest, tolerant to the
+spelling variants common in Indonesian reporting (old spelling such as
+"Soeharto" / "Suharto", doubled letters, missing diacritics, ...).
+
+Matching works in two steps:
+1. Candidate lookup: names are normalized and split into padded character
+   q-grams (trigrams by default) held in an inverted index. A name can only
+   reach the Dice threshold if it shares a minimum number of q-grams with
+   the mention, so it must contain one of the mention's rarest q-grams
+   (prefix filtering). Only those short postings lists are read, so the
+   cost depends on the mention, not on the size of the watchlist.
+2. Verification: the few remaining candidates are scored with an edit-based
+   similarity ratio and kept above a threshold.
+
+Mentions screened per article are the entities found by EntityExtractor
+(persons and institutions), including the 2+ word sub-spans of person names.
+Single-word names ("Gayus"), common in Indonesian reporting but never an
+EntityExtractor person, are found by screening the capitalized words of the
+article against the single-word watchlist names only, through their own
+q-gram index.
+Hits are stored as screening alerts keyed by article (output/screening.db).
+
+The watchlist is a CSV file with a `name` column (other columns, e.g. `list`
+or `notes`, are kept as metadata) or a plain text file with one name per line.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import csv
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from difflib import SequenceMatcher
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._sqlite import connect_sqlite
+
+# Old Indonesian spelling (pre-1972) and common transliteration variants
+SPELLING_VARIANTS = [
+    ("oe", "u"),
+    ("dj", "j"),
+    ("tj", "c"),
+    ("sj", "sy"),
+    ("nj", "ny"),
+    ("ch", "kh"),
+]
+
+HONORIFICS = {"h", "hj", "haji", "hajjah", "dr", "drs", "dra", "ir", "prof", "sh", "mh", "se", "mm", "st"}
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical form of a name for matching.
+
+    Lower-cases, strips diacritics and punctuation, drops honorifics,
+    maps old spelling to the modern one and collapses doubled letters.
+    """
+    text = unicodedata.normalize("NFKD", f"{name}").encode("ascii", "ignore").decode("ascii").lower()
+    # Dotted abbreviations ("S.E.", "H.") become single words
+    text = text.replace(".", "")
+    words = [word for word in re.findall(r"[a-z0-9]+", text) if word not in HONORIFICS]
+    text = " ".join(words)
+    for old, new in SPELLING_VARIANTS:
+        text = text.replace(old, new)
+    return re.sub(r"([a-z])\1+", r"\1", text)
+
+
+def capitalized_words(text: str) -> List[str]:
+    """Distinct capitalized words of a text (single-word name candidates), in order"""
+    return list(dict.fromkeys(re.findall(r"\b[A-Z][A-Za-z]{2,}\b", f"{text}")))
+
+
+def qgrams(text: str, q: int = 3) -> set:
+    """Set of padded character q-grams of a normalized name"""
+    padded = f"{'#' * (q - 1)}{text}{'#' * (q - 1)}"
+    return {padded[i:i + q] for i in range(len(padded) - q + 1)}
+
+
+class Watchlist:
+    """
+    In-memory q-gram index over watchlist names.
+
+    Attributes:
+        entries (List[dict]): Watchlist rows ("name" plus any metadata)
+        q (int): q-gram length
+        threshold (float): Minimum verified similarity (0-1) of a hit
+
+    Usage:
+        watchlist = Watchlist.from_file("output/watchlist.csv")
+        watchlist.match("Soeharto")   # [({'name': 'Suharto', ...}, 1.0)]
+    """
+
+    def __init__(self, entries: Iterable, q: int = 3, threshold: float = 0.88):
+        self.q = q
+        self.threshold = threshold
+        # Candidates must reach this Dice coefficient on q-grams before verification
+        self.candidate_threshold = max(0.0, threshold - 0.2)
+        self.entries = []
+        self._normalized = []
+        self._grams = []
+        self._postings = {}
+        # Postings of the single-word names only, for screening capitalized words
+        self._single_word_postings = {}
+        for entry in entries:
+            entry = {"name": entry} if isinstance(entry, str) else dict(entry)
+            normalized = normalize_name(entry.get("name", ""))
+            if not normalized:
+                continue
+            entry_id = len(self.entries)
+            grams = qgrams(normalized, q)
+            self.entries.append(entry)
+            self._normalized.append(normalized)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(entry_id)
+                if " " not in normalized:
+                    self._single_word_postings.setdefault(gram, []).append(entry_id)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "Watchlist":
+        """Load a watchlist from a CSV file with a `name` column or a text file"""
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            first_line = f.readline()
+            f.seek(0)
+            if "name" in [column.strip().lower() for column in first_line.split(",")]:
+                reader = csv.DictReader(f)
+                entries = [{key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+                           for row in reader]
+            else:
+                entries = [line.strip() for line in f if line.strip()]
+        return cls(entries, **kwargs)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def candidates(self, normalized: str, single_word: bool = False) -> List[int]:
+        """
+        Entry IDs whose q-gram Dice coefficient with a normalized mention reaches the candidate threshold.
+
+        With single_word, only single-word names are considered.
+        """
+        postings = self._single_word_postings if single_word else self._postings
+        grams = qgrams(normalized, self.q)
+        size = len(grams)
+        t = self.candidate_threshold
+        # Dice >= t implies |B| >= t/(2-t)|A| and so a minimum overlap with A;
+        # any such name contains one of the (|A| - overlap + 1) rarest grams of A
+        min_overlap = max(1, math.ceil(t * size / (2 - t)))
+        rare_grams = sorted(grams, key=lambda gram: len(postings.get(gram, ())))
+        probe_grams = rare_grams[:size - min_overlap + 1]
+        probe_counts = Counter(chain.from_iterable(postings.get(gram, ()) for gram in probe_grams))
+        # Upper bound of the overlap: shared probe grams + all remaining grams
+        remaining = size - len(probe_grams)
+        result = []
+        for entry_id, count in probe_counts.items():
+            entry_grams = self._grams[entry_id]
+            needed = t * (size + len(entry_grams)) / 2
+            if count + remaining >= needed and len(grams & entry_grams) >= needed:
+                result.append(entry_id)
+        return result
+
+    def match(self, mention: str, single_word: bool = False) -> List[Tuple[Dict, float]]:
+        """
+        Watchlist entries matching a mention, best first (only single-word names with single_word).
+
+        Returns:
+            List[Tuple[dict, float]]: (entry, similarity) pairs above the threshold
+        """
+        normalized = normalize_name(mention)
+        if not normalized:
+            return []
+        hits = []
+        for entry_id in self.candidates(normalized, single_word):
+            candidate = self._normalized[entry_id]
+            # Cheap length bound before the quadratic ratio computation
+            if 2 * min(len(candidate), len(normalized)) < self.threshold * (len(candidate) + len(normalized)):
+                continue
+            score = SequenceMatcher(None, normalized, candidate, autojunk=False).ratio()
+            if score >= self.threshold:
+                hits.append((self.entries[entry_id], score))
+        return sorted(hits, key=lambda hit: -hit[1])
+
+    def screen(self, mentions: Iterable[str], words: Iterable[str] = ()) -> List[Dict]:
+        """
+        Screen the mentions of one article.
+
+        Person names are also screened by their contiguous sub-spans of two or
+        more words, so "Budi Santoso Wijaya" hits a listed "Budi Santoso".
+        `words` (see capitalized_words()) are screened against the single-word
+        names only, so "Gayus" hits a listed "Gayus" but "Budi" never hits
+        "Budi Santoso".
+
+        Returns:
+            List[dict]: One hit per watchlist entry (best mention), with keys
+                watchlist_name, matched_text, score and entry
+        """
+        best = {}
+        for mention in set(mentions):
+            words = mention.split()
+            spans = {mention}
+            for size in range(2, len(words)):
+                spans.update(" ".join(words[i:i + size]) for i in range(len(words) - size + 1))
+            for span in spans:
+                self._keep_best(best, span, self.match(span))
+        if self._single_word_postings:
+            for word in set(words):
+                self._keep_best(best, word, self.match(word, single_word=True))
+        return sorted(best.values(), key=lambda hit: (-hit["score"], hit["watchlist_name"]))
+
+    @staticmethod
+    def _keep_best(best: Dict, text: str, matches: List[Tuple[Dict, float]]):
+        """Record the matches of one screened text, keeping the best hit per watchlist entry"""
+        for entry, score in matches:
+            name = entry["name"]
+            if name not in best or score > best[name]["score"]:
+                best[name] = {"watchlist_name": name, "matched_text": text, "score": score, "entry": entry}
+
+
+class ScreeningAlerts:
+    """
+    Screening alerts backed by SQLite, keyed by (article_id, watchlist_name).
+
+    Attributes:
+        db_path (str): Path of the SQLite alerts file
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        """SQLite connection, opened (and the schema created) on first use"""
+        if self._connection is None:
+            self._connection = connect_sqlite(self.db_path)
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS screening_alerts (
+                    article_id TEXT NOT NULL,
+                    watchlist_name TEXT NOT NULL,
+                    matched_text TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (article_id, watchlist_name)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS screening_alerts_name ON screening_alerts (watchlist_name);
+                CREATE INDEX IF NOT EXISTS screening_alerts_created ON screening_alerts (created_at);
+            """)
+        return self._connection
+
+    def add_alerts(self, article_id, hits: List[Dict]):
+        """Replace the alerts of an article with `hits` (from Watchlist.screen)"""
+        created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM screening_alerts WHERE article_id = ?", (article_id,))
+            connection.executemany(
+                "INSERT INTO screening_alerts (article_id, watchlist_name, matched_text, score, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(article_id, hit["watchlist_name"], hit["matched_text"], round(hit["score"], 4), created_at)
+                 for hit in hits]
+            )
+
+    def clear(self):
+        """Remove every alert"""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM screening_alerts")
+
+    def alerts(self, article_id: Optional[str] = None, watchlist_name: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Tuple]:
+        """
+        Stored alerts, newest first.
+
+        Returns:
+            List[Tuple]: (article_id, watchlist_name, matched_text, score, created_at) rows
+        """
+        query = "SELECT article_id, watchlist_name, matched_text, score, created_at FROM screening_alerts"
+        conditions, parameters = [], []
+        if article_id is not None:
+            conditions.append("article_id = ?")
+            parameters.append(article_id)
+        if watchlist_name is not None:
+            conditions.append("watchlist_name = ?")
+            parameters.append(watchlist_name)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at DESC, score DESC"
+        if limit:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        with self._lock:
+            return self.connection.execute(query, parameters).fetchall()
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
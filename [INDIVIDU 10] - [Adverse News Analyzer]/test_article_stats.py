@@ -0,0 +1,172 @@
+"""
+Test script for materialized article statistics
+
+Validates that the aggregates maintained at ingest match a full scan of the
+store, that reads do not touch the store (also after reopening it), and
+that the aggregates are rebuilt after another writer or a recategorization
+changed the store.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.article_stats import ArticleStatistics
+from modules.article_store import CsvArticleStore
+from modules.data_manager import DataManager
+
+
+def make_articles(count, start=0):
+    return [
+        {
+            "title": f"Artikel {i}",
+            "url": f"https://news-{i % 3}.com/artikel-{i}",
+            "source_name": f"news-{i % 3}.com",
+            "publication_date": f"2025-07-{1 + i % 28:02d} 10:00:00",
+            "category": ["Fraud", "Corruption"][i % 2],
+            "full_text": f"Isi artikel {i}",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def full_scan(store):
+    """Statistics computed from every row of the store"""
+    df = store.load(['source_name', 'category', 'publication_date'])
+    dates = pd.to_datetime(df['publication_date'])
+    return {
+        'total_articles': len(df),
+        'sources': df['source_name'].value_counts().to_dict(),
+        'categories': df['category'].value_counts().to_dict(),
+        'date_range': f"{dates.min():%Y-%m-%d} to {dates.max():%Y-%m-%d}"
+    }
+
+
+class TestMaterializedStatistics(unittest.TestCase):
+    """DataManager.get_statistics() from the aggregates file"""
+
+    storage = "csv"
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_stats_")
+        self.data_manager = self.open_manager()
+
+    def tearDown(self):
+        self.close(self.data_manager)
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def open_manager(self):
+        return DataManager(self.test_output_dir, storage=self.storage)
+
+    def close(self, data_manager):
+        for store in (data_manager.store, data_manager.search_index, data_manager.risk_scores,
+                      data_manager.case_clusterer, data_manager.screening_alerts, data_manager.entity_index,
+                      data_manager.keyword_index):
+            store.close()
+
+    def test_incremental_matches_full_scan(self):
+        """Aggregates updated batch by batch equal the statistics of the whole store"""
+        self.data_manager.get_statistics()
+        for start in (0, 4, 9):
+            self.data_manager.save_articles_batch(make_articles(5, start))
+        stats = self.data_manager.get_statistics()
+        self.assertEqual(stats, full_scan(self.data_manager.store))
+        self.assertEqual(self.data_manager.get_articles_count(), 14)
+        daily = self.data_manager.get_daily_counts()
+        self.assertEqual(sum(daily.values()), 14)
+        self.assertEqual(list(daily)[0], "2025-07-01")
+
+    def test_reads_do_not_touch_the_store(self):
+        """After warm-up, statistics and counts never load the store"""
+        self.data_manager.get_statistics()
+        self.data_manager.save_articles_batch(make_articles(6))
+        with mock.patch.object(self.data_manager.store, "load") as load, \
+                mock.patch.object(self.data_manager.store, "count") as count:
+            for _ in range(3):
+                self.assertEqual(self.data_manager.get_statistics()['total_articles'], 6)
+                self.assertEqual(self.data_manager.get_articles_count(), 6)
+        load.assert_not_called()
+        count.assert_not_called()
+
+        # A new manager reuses the persisted aggregates
+        other = self.open_manager()
+        with mock.patch.object(other.store, "load") as load:
+            self.assertEqual(other.get_statistics()['categories'], {"Fraud": 3, "Corruption": 3})
+        load.assert_not_called()
+        self.close(other)
+
+    def test_reopened_store_not_rebuilt(self):
+        """Closing and reopening the store (SQLite checkpoints its WAL) keeps the aggregates valid"""
+        self.data_manager.save_articles_batch(make_articles(6))
+        self.data_manager.get_statistics()
+        self.close(self.data_manager)
+        self.assertFalse(os.path.exists(self.data_manager.store.path + "-wal"))
+
+        self.data_manager = self.open_manager()
+        with mock.patch.object(ArticleStatistics, "_rebuild") as rebuild:
+            for _ in range(2):
+                self.assertEqual(self.data_manager.get_statistics()['total_articles'], 6)
+        rebuild.assert_not_called()
+
+    def test_rebuilt_after_recategorization(self):
+        """Rewriting the store invalidates the aggregates"""
+        self.data_manager.save_articles_batch([{
+            "title": "Bandar judi online ditangkap",
+            "url": "https://news.com/judi",
+            "source_name": "news.com",
+            "publication_date": "2025-07-01 10:00:00",
+            "full_text": "Polisi menangkap bandar judi online dan togel.",
+            "category": "Fraud",
+        }])
+        self.assertEqual(self.data_manager.get_statistics()['categories'], {"Fraud": 1})
+        self.data_manager.recategorize_articles()
+        self.assertEqual(self.data_manager.get_statistics()['categories'], {"Gambling": 1})
+
+
+class TestMaterializedStatisticsOnSQLite(TestMaterializedStatistics):
+    storage = "sqlite"
+
+
+class TestExternalWriter(unittest.TestCase):
+    """Writes by another process are detected from the store fingerprint"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_stats_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_external_append_triggers_rebuild(self):
+        """An append that bypassed this manager shows up in the next read"""
+        data_manager = DataManager(self.test_output_dir)
+        data_manager.save_articles_batch(make_articles(3))
+        self.assertEqual(data_manager.get_articles_count(), 3)
+
+        other = CsvArticleStore(data_manager.csv_file, data_manager.csv_schema)
+        other.append(make_articles(2, start=10))
+        self.assertEqual(data_manager.get_articles_count(), 5)
+
+        # Later batches are applied incrementally again
+        data_manager.save_articles_batch(make_articles(1, start=20))
+        with mock.patch.object(data_manager.store, "load") as load:
+            self.assertEqual(data_manager.get_statistics()['total_articles'], 6)
+        load.assert_not_called()
+        for store in (data_manager.risk_scores, data_manager.case_clusterer, data_manager.screening_alerts,
+                      data_manager.entity_index, data_manager.keyword_index):
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,670 @@
+"""
+Test script for the article storage backends
+
+Validates that the CSV, SQLite and Parquet stores behave the same (dedup, counts,
+fingerprints, atomic replacement, CSV export), the in-memory URL set of the
+CSV store, the SQLite indexes, the single-write batch save (and its
+article-by-article fallback), DataManager on SQLite storage including
+migration from CSV, and concurrent writer processes (dedup across
+processes, the cross-process file lock, no index entries lost).
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import importlib.util
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from unittest import mock
+
+import pandas as pd
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.article_store import (CsvArticleStore, SQLiteArticleStore, append_csv, category_key, page_cursor,
+                                   create_store, detect_backend)
+from modules.data_manager import DataManager
+from modules.file_lock import FileLock
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+SCHEMA = ["title", "url", "source_name", "publication_date", "category", "full_text"]
+
+
+def make_articles(count, start=0):
+    return [
+        {
+            "title": f"Artikel {i}",
+            "url": f"https://news-{i % 3}.com/artikel-{i}",
+            "source_name": f"news-{i % 3}.com",
+            "publication_date": f"2025-07-{1 + i % 28:02d} 10:00:00",
+            "category": ["Fraud", "Corruption"][i % 2],
+            "full_text": f"Isi artikel {i}",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def append_in_process(backend, output_dir, start):
+    """Worker: append overlapping batches to a store; returns the number stored"""
+    store = create_store(backend, output_dir, SCHEMA)
+    stored = sum(store.append(make_articles(10, start + batch * 5)) for batch in range(10))
+    store.close()
+    return stored
+
+
+def save_in_process(output_dir, start):
+    """Worker: save overlapping batches through a DataManager; returns the number saved"""
+    data_manager = DataManager(output_dir, session_log=False)
+    saved = sum(data_manager.save_articles_batch(make_articles(8, start + batch * 4)) for batch in range(6))
+    for store in (data_manager.store, data_manager.search_index, data_manager.risk_scores,
+                  data_manager.case_clusterer, data_manager.screening_alerts,
+                  data_manager.entity_index, data_manager.keyword_index):
+        store.close()
+    return saved
+
+
+def entity_articles(count, start=0):
+    """Articles mentioning KPK, Bank BRI and a watchlisted person"""
+    return [
+        dict(article, full_text=f"KPK memeriksa Djoko Tjandra terkait suap di Bank BRI, perkara nomor {i}.")
+        for i, article in enumerate(make_articles(count, start), start)
+    ]
+
+
+def index_in_process(output_dir, start):
+    """Worker: save batches of entity-rich articles; returns the number saved"""
+    data_manager = DataManager(output_dir, session_log=False)
+    saved = sum(data_manager.save_articles_batch(entity_articles(5, start + batch * 5)) for batch in range(6))
+    for store in (data_manager.store, data_manager.search_index, data_manager.risk_scores,
+                  data_manager.case_clusterer, data_manager.screening_alerts,
+                  data_manager.entity_index, data_manager.keyword_index):
+        store.close()
+    return saved
+
+
+def run_workers(function, arguments):
+    """Run a worker per argument tuple in separate processes (spawned, as on Windows)"""
+    with multiprocessing.get_context("spawn").Pool(len(arguments)) as pool:
+        return pool.starmap(function, arguments)
+
+
+class StoreContract:
+    """Behaviour shared by every store backend"""
+
+    backend = None
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_store_")
+        self.store = create_store(self.backend, self.test_output_dir, SCHEMA)
+        self.store.initialize()
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_append_and_lookup(self):
+        """Appended articles are found by canonical URL"""
+        self.assertEqual(self.store.append(make_articles(4)), 4)
+        self.assertEqual(self.store.count(), 4)
+        self.assertTrue(self.store.contains("  HTTPS://NEWS-1.COM/ARTIKEL-1 "))
+        self.assertFalse(self.store.contains("https://news-1.com/artikel-99"))
+        self.assertEqual(
+            self.store.existing_urls(["https://news-0.com/artikel-0", "https://x.com/new", ""]),
+            {"https://news-0.com/artikel-0"}
+        )
+
+    def test_articles_without_url_kept(self):
+        """Articles without a URL are never treated as duplicates"""
+        articles = [dict(article, url="") for article in make_articles(2)]
+        self.assertEqual(self.store.append(articles), 2)
+        self.assertEqual(self.store.append(articles[:1] + make_articles(1)), 2)
+        self.assertEqual(self.store.count(), 4)
+        self.assertFalse(self.store.contains(""))
+        self.store.replace_all(self.store.load())
+        self.assertEqual(self.store.count(), 4)
+
+    def test_load_by_urls(self):
+        """Rows are fetched by canonical URL, in store order, with only the requested columns"""
+        self.store.append(make_articles(8))
+        df = self.store.load_by_urls(["HTTPS://NEWS-2.COM/ARTIKEL-5 ", "https://news-1.com/artikel-1",
+                                      "https://x.com/missing", ""])
+        self.assertEqual(df['url'].tolist(), ["https://news-1.com/artikel-1", "https://news-2.com/artikel-5"])
+        self.assertEqual(list(df.columns), SCHEMA)
+        df = self.store.load_by_urls(["https://news-0.com/artikel-3"], columns=['title', 'category'])
+        self.assertEqual(df.to_dict('records'), [{"title": "Artikel 3", "category": "Corruption"}])
+        self.assertEqual(len(self.store.load_by_urls([])), 0)
+
+    def categories(self):
+        return self.store.load(['category'])['category'].value_counts().to_dict()
+
+    def test_stamp(self):
+        """The fingerprint changes with every write and only then, also across reopening"""
+        stamps = [self.store.stamp()]
+        self.store.append(make_articles(6))
+        stamps.append(self.store.stamp())
+        self.store.append(make_articles(2))
+        self.assertEqual(self.store.stamp(), stamps[-1])
+        self.store.update_categories({"https://news-1.com/artikel-1": "Gambling"})
+        stamps.append(self.store.stamp())
+        self.store.replace_all(self.store.load())
+        stamps.append(self.store.stamp())
+        self.assertEqual(len(set(stamps)), len(stamps))
+
+        self.store.close()
+        self.store = create_store(self.backend, self.test_output_dir, SCHEMA)
+        self.assertEqual(self.store.stamp(), stamps[-1])
+
+    def test_replace_and_export(self):
+        """replace_all swaps the corpus; export_csv writes it as CSV"""
+        self.store.append(make_articles(5))
+        df = self.store.load()
+        self.assertEqual(list(df.columns), SCHEMA)
+        df['category'] = "Gambling"
+        self.store.replace_all(df)
+        self.assertEqual(self.categories(), {"Gambling": 5})
+
+        export_file = os.path.join(self.test_output_dir, "export.csv")
+        self.assertEqual(self.store.export_csv(export_file), 5)
+        exported = pd.read_csv(export_file, encoding='utf-8')
+        self.assertEqual(exported['url'].tolist(), df['url'].tolist())
+        self.assertFalse(os.path.exists(export_file + '.tmp'))
+
+    def test_update_categories(self):
+        """Categories are rewritten by URL"""
+        self.store.append(make_articles(3))
+        self.assertEqual(self.store.update_categories({"https://news-1.com/artikel-1": "Gambling"}), 1)
+        self.assertEqual(self.categories(), {"Fraud": 2, "Gambling": 1})
+
+    def test_update_categories_without_url(self):
+        """Articles without a URL are updated by their text; empty URL keys are ignored"""
+        articles = [dict(article, url="") for article in make_articles(2)] + make_articles(1, start=2)
+        self.store.append(articles)
+        self.assertEqual(self.store.update_categories({"": "Tax Evasion", "https://news-2.com/artikel-2": "Fraud",
+                                                       category_key("", "Artikel 1", "Isi artikel 1"): "Gambling"}), 2)
+        df = self.store.load()
+        self.assertEqual(dict(zip(df['title'], df['category'])),
+                         {"Artikel 0": "Fraud", "Artikel 1": "Gambling", "Artikel 2": "Fraud"})
+
+    def test_concurrent_writer_processes(self):
+        """Processes appending overlapping batches store every article exactly once"""
+        starts = [0, 20, 30, 60]
+        stored = run_workers(append_in_process, [(self.backend, self.test_output_dir, start) for start in starts])
+        expected = {a["url"] for start in starts for a in make_articles(55, start)}
+        df = self.store.load()
+        self.assertEqual(sorted(df['url']), sorted(expected))
+        self.assertEqual(sum(stored), len(expected))
+        self.assertFalse(df['title'].isna().any())
+
+    def test_keyset_pagination(self):
+        """Pages follow (publication_date, url) descending without gaps or repeats"""
+        articles = make_articles(40)
+        self.store.append(articles)
+        expected = [a["url"] for a in sorted(articles, key=lambda a: (a["publication_date"], a["url"]),
+                                             reverse=True)]
+        urls, after = [], None
+        while True:
+            page = self.store.query(['title'], limit=7, after=after)
+            if len(page) == 0:
+                break
+            self.assertEqual(list(page.columns), ['title', 'publication_date', 'url'])
+            urls.extend(page['url'])
+            after = page_cursor(page)
+        self.assertEqual(urls, expected)
+
+    def test_query_filters(self):
+        """Source, category and inclusive date range filters"""
+        self.store.append(make_articles(40))
+        page = self.store.query(source="news-1.com", category="Corruption", limit=100)
+        self.assertEqual(len(page), 7)
+        self.assertEqual(set(page['url'].str[:18]), {"https://news-1.com"})
+        page = self.store.query(start="2025-07-03", end="2025-07-04", limit=100)
+        self.assertEqual(len(page), 4)
+        self.assertEqual(page['url'].tolist(), ["https://news-1.com/artikel-31", "https://news-0.com/artikel-3",
+                                                "https://news-2.com/artikel-2", "https://news-0.com/artikel-30"])
+
+
+class TestCsvArticleStore(StoreContract, unittest.TestCase):
+    backend = "csv"
+
+    def test_duplicate_checks_do_not_reread_the_file(self):
+        """The URL set is loaded once and kept in sync by appends"""
+        self.store.append(make_articles(50))
+        with mock.patch.object(pd, "read_csv", wraps=pd.read_csv) as read_csv:
+            for article in make_articles(60):
+                if not self.store.contains(article["url"]):
+                    self.assertEqual(self.store.append([article]), 1)
+            self.assertEqual(read_csv.call_count, 0)
+        self.assertEqual(self.store.count(), 60)
+
+    def test_count_reads_only_urls(self):
+        """Counting parses only the url column, so article texts are never loaded"""
+        self.store.append([dict(article, full_text="Baris satu\nbaris dua") for article in make_articles(7)])
+        with mock.patch.object(pd, "read_csv", wraps=pd.read_csv) as read_csv:
+            self.assertEqual(self.store.count(), 7)
+        self.assertEqual([call.kwargs['usecols'] for call in read_csv.call_args_list], [['url']])
+
+    def test_batch_duplicates_skipped(self):
+        """URLs already stored or repeated in the batch are not appended"""
+        articles = make_articles(3)
+        self.assertEqual(self.store.append(articles + [dict(articles[0], url=articles[0]["url"].upper())]), 3)
+        self.assertEqual(self.store.append(make_articles(5)), 2)
+        self.assertEqual(self.store.count(), 5)
+
+    def test_external_write_invalidates_urls(self):
+        """A write by another process (mtime/size change) reloads the URL set"""
+        self.store.append(make_articles(2))
+        self.assertFalse(self.store.contains("https://other.com/a"))
+        other = CsvArticleStore(self.store.path, SCHEMA)
+        other.append([dict(make_articles(1)[0], url="https://other.com/a")])
+        self.assertTrue(self.store.contains("https://other.com/a"))
+        self.assertEqual(self.store.append([dict(make_articles(1)[0], url="https://other.com/a")]), 0)
+
+
+class TestSQLiteArticleStore(StoreContract, unittest.TestCase):
+    backend = "sqlite"
+
+    def test_unique_url_index(self):
+        """Duplicate URLs (in any case) are skipped inside a batch and across batches"""
+        articles = make_articles(3)
+        duplicate = dict(articles[0], url=articles[0]["url"].upper())
+        self.assertEqual(self.store.append(articles + [duplicate]), 3)
+        self.assertEqual(self.store.append(make_articles(5)), 2)
+        self.assertEqual(self.store.count(), 5)
+
+    def test_wal_mode_and_indexes(self):
+        """The database runs in WAL mode and lookups use the indexes"""
+        connection = self.store.connection
+        self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(articles)")}
+        self.assertTrue({"articles_url_key", "articles_date",
+                         "articles_source_date", "articles_category_date"} <= indexes)
+        plan = " ".join(row[-1] for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT 1 FROM articles WHERE url_key = ?", ("x",)
+        ))
+        self.assertIn("articles_url_key", plan)
+
+    def test_pages_come_off_the_index(self):
+        """Filtered, cursor-continued pages need no sort of the table"""
+        for source, index in (("a.com", "articles_source_date"), (None, "articles_date")):
+            condition = "source_name = ? AND " if source else ""
+            params = ([source] if source else []) + ["2025-07-05 10:00:00", "x", 20]
+            plan = " ".join(row[-1] for row in self.store.connection.execute(
+                f"EXPLAIN QUERY PLAN SELECT title FROM articles WHERE {condition}"
+                "(publication_date, url_key) < (?, ?) ORDER BY publication_date DESC, url_key DESC LIMIT ?",
+                params
+            ))
+            self.assertIn(index, plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_lookup_cost_does_not_grow_with_corpus(self):
+        """Duplicate checks stay fast on a large corpus"""
+        for start in range(0, 20000, 5000):
+            self.store.append(make_articles(5000, start))
+        started = time.perf_counter()
+        for i in range(1000):
+            self.store.contains(f"https://news-{i % 3}.com/artikel-{i * 7}")
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+
+@unittest.skipUnless(HAS_PYARROW, "needs pyarrow")
+class TestParquetArticleStore(StoreContract, unittest.TestCase):
+    backend = "parquet"
+
+    def test_month_partitions_and_types(self):
+        """Files are partitioned by month with typed dates and dictionary-encoded columns"""
+        import pyarrow.parquet as pq
+
+        articles = make_articles(2) + [dict(make_articles(1, start=5)[0], url="https://x.com/aug",
+                                            publication_date="2025-08-03 09:00:00")]
+        self.assertEqual(self.store.append(articles), 3)
+        self.assertEqual(sorted(os.listdir(self.store.path)), ["month=2025-07", "month=2025-08"])
+        schema = pq.read_schema(self.store._files()[0])
+        self.assertEqual(str(schema.field("publication_date").type), "timestamp[us]")
+        self.assertEqual(str(schema.field("category").type), "dictionary<values=string, indices=int32, ordered=0>")
+
+    def test_column_pruning(self):
+        """Only the requested columns are read"""
+        self.store.append(make_articles(4))
+        df = self.store.load(['title', 'category'])
+        self.assertEqual(list(df.columns), ['title', 'category'])
+        self.assertEqual(len(df), 4)
+        self.assertEqual(self.store.count(), 4)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(self.store.load(['publication_date'])['publication_date']))
+
+    def test_update_rewrites_only_changed_files(self):
+        """Files without a changed category are neither read in full nor rewritten"""
+        self.store.append(make_articles(3))
+        self.store.append([dict(make_articles(1, start=5)[0], url="https://x.com/aug",
+                                publication_date="2025-08-03 09:00:00")])
+        july, august = self.store._files()
+        mtime = os.stat(july).st_mtime_ns
+        with mock.patch.object(self.store, "_read", wraps=self.store._read) as read:
+            self.assertEqual(self.store.update_categories({"https://x.com/aug": "Gambling",
+                                                           "https://news-0.com/artikel-0": "Fraud"}), 2)
+        self.assertEqual(os.stat(july).st_mtime_ns, mtime)
+        self.assertEqual([call.args[0] for call in read.call_args_list if len(call.args) == 1], [[august]])
+        df = self.store.load()
+        self.assertEqual(df.loc[df['url'] == "https://x.com/aug", 'category'].tolist(), ["Gambling"])
+        self.assertEqual(len(df), 4)
+
+
+class TestBatchSave(unittest.TestCase):
+    """save_articles_batch: one categorize call and one write per file"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_store_")
+        self.data_manager = DataManager(self.test_output_dir)
+
+    def tearDown(self):
+        for store in (self.data_manager.risk_scores, self.data_manager.case_clusterer,
+                      self.data_manager.screening_alerts, self.data_manager.entity_index,
+                      self.data_manager.keyword_index, self.data_manager.search_index):
+            store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_single_categorize_and_write(self):
+        """Duplicates are dropped up front; survivors are categorized and written once"""
+        self.data_manager.save_articles_batch(make_articles(2))
+        batch = make_articles(6)
+        for article in batch:
+            article["category"] = ""
+        batch.append(dict(batch[3], url=batch[3]["url"].upper()))
+
+        categorizer = self.data_manager.categorizer
+        with mock.patch.object(categorizer, "categorize_batch", wraps=categorizer.categorize_batch) as categorize_batch, \
+                mock.patch.object(categorizer, "categorize_article") as categorize_article, \
+                mock.patch("modules.article_store.append_csv", wraps=append_csv) as store_write, \
+                mock.patch("modules.data_manager.append_csv", wraps=append_csv) as session_write:
+            self.assertEqual(self.data_manager.save_articles_batch(batch), 4)
+
+        self.assertEqual(categorize_batch.call_count, 1)
+        self.assertEqual(len(categorize_batch.call_args[0][0]), 4)
+        categorize_article.assert_not_called()
+        self.assertEqual((store_write.call_count, session_write.call_count), (1, 1))
+
+        stored = pd.read_csv(self.data_manager.csv_file, encoding='utf-8')
+        self.assertEqual(len(stored), 6)
+        self.assertFalse(stored['category'].isna().any())
+        session = pd.read_csv(self.data_manager.session_csv_file, encoding='utf-8')
+        self.assertEqual(list(session.columns), self.data_manager.csv_schema)
+        self.assertEqual(len(session), 6)
+
+    def test_all_duplicates_write_nothing(self):
+        """A batch of known articles does not touch the files"""
+        self.data_manager.save_articles_batch(make_articles(3))
+        with mock.patch("modules.article_store.append_csv") as store_write:
+            self.assertEqual(self.data_manager.save_articles_batch(make_articles(3)), 0)
+        store_write.assert_not_called()
+
+    def test_articles_without_url_always_saved(self):
+        """Empty URLs are let through, like check_duplicate(''), and each is indexed"""
+        batch = [dict(article, url="") for article in make_articles(2)] + make_articles(1, start=2)
+        self.assertEqual(self.data_manager.save_articles_batch(batch), 3)
+        self.assertFalse(self.data_manager.check_duplicate(""))
+        self.assertEqual(self.data_manager.save_articles_batch(batch), 2)
+        self.assertEqual(self.data_manager.get_articles_count(), 5)
+        self.assertEqual(self.data_manager.search_index.count(), 5)
+        self.assertEqual(self.data_manager.keyword_index.article_count(), 5)
+
+    def test_recategorize_articles_without_url(self):
+        """Articles without a URL keep their own category through a recategorization"""
+        articles = [
+            {"title": "Bandar judi online ditangkap", "url": "", "source_name": "news.com",
+             "publication_date": "2025-07-01 10:00:00", "full_text": "Polisi menangkap bandar judi online dan togel.",
+             "category": "Fraud"},
+            {"title": "KPK menahan bupati", "url": "", "source_name": "news.com",
+             "publication_date": "2025-07-02 10:00:00", "full_text": "Bupati ditahan KPK atas kasus korupsi dan suap.",
+             "category": "Fraud"},
+        ]
+        self.data_manager.save_articles_batch(articles)
+        self.assertEqual(self.data_manager.recategorize_articles(), 2)
+        stored = pd.read_csv(self.data_manager.csv_file, encoding='utf-8')
+        self.assertEqual(stored['category'].tolist(), ["Gambling", "Corruption"])
+
+    def test_failed_batch_saved_one_by_one(self):
+        """One article that breaks the batch does not lose the others"""
+        batch = make_articles(3)
+        for article in batch:
+            article["category"] = ""
+        categorizer = self.data_manager.categorizer
+        categorize_batch = categorizer.categorize_batch
+
+        def fail_on_broken(articles):
+            if any(article["title"] == "Artikel 1" for article in articles):
+                raise ValueError("broken article")
+            return categorize_batch(articles)
+
+        with mock.patch.object(categorizer, "categorize_batch", side_effect=fail_on_broken):
+            self.assertEqual(self.data_manager.save_articles_batch(batch), 2)
+        stored = pd.read_csv(self.data_manager.csv_file, encoding='utf-8')
+        self.assertEqual(stored['title'].tolist(), ["Artikel 0", "Artikel 2"])
+        self.assertFalse(self.data_manager.save_article(make_articles(1)[0]))
+
+
+class TestFileLock(unittest.TestCase):
+    """The store write lock"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_store_")
+        self.path = os.path.join(self.test_output_dir, "articles.csv.lock")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_reentrant_and_exclusive(self):
+        """The holder can re-enter; another holder of the file waits and times out"""
+        lock = FileLock(self.path)
+        other = FileLock(self.path, timeout=0.1)
+        with lock:
+            with lock:
+                pass
+            self.assertRaises(TimeoutError, other.acquire)
+        with other:
+            pass
+
+
+class TestConcurrentDataManagers(unittest.TestCase):
+    """DataManagers of several processes saving to one output directory"""
+
+    storage = "csv"
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_store_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_dedup_and_statistics_across_processes(self):
+        """Each article is saved by exactly one process; statistics match the store"""
+        DataManager(self.test_output_dir, storage=self.storage, session_log=False).store.close()
+        starts = [0, 10, 12]
+        saved = run_workers(save_in_process, [(self.test_output_dir, start) for start in starts])
+        expected = {a["url"] for start in starts for a in make_articles(28, start)}
+        self.assertEqual(sum(saved), len(expected))
+
+        data_manager = DataManager(self.test_output_dir, session_log=False)
+        self.assertEqual(data_manager.storage, self.storage)
+        df = data_manager.load_articles()
+        self.assertEqual(sorted(df['url']), sorted(expected))
+        stats = data_manager.get_statistics()
+        self.assertEqual(stats['total_articles'], len(expected))
+        self.assertEqual(stats['sources'], df['source_name'].value_counts().to_dict())
+        self.assertEqual(stats['categories'], df['category'].value_counts().to_dict())
+        self.assertEqual(data_manager.search_index.count(), len(expected))
+        for store in (data_manager.store, data_manager.search_index, data_manager.risk_scores,
+                      data_manager.case_clusterer, data_manager.screening_alerts,
+                      data_manager.entity_index, data_manager.keyword_index):
+            store.close()
+
+
+class TestConcurrentDataManagersOnSQLite(TestConcurrentDataManagers):
+    storage = "sqlite"
+
+
+class TestConcurrentIndexing(unittest.TestCase):
+    """Derived indexes written by two processes while another connection holds a write transaction"""
+
+    # Longer than sqlite3's default busy timeout (5 s)
+    busy_seconds = 6
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_store_")
+        with open(os.path.join(self.test_output_dir, "watchlist.csv"), "w", encoding="utf-8") as file:
+            file.write("name,list\nDjoko Tjandra,internal\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def close(self, data_manager):
+        for store in (data_manager.store, data_manager.search_index, data_manager.risk_scores,
+                      data_manager.case_clusterer, data_manager.screening_alerts,
+                      data_manager.entity_index, data_manager.keyword_index):
+            store.close()
+
+    def test_no_index_entries_lost(self):
+        """Writers wait for a busy index instead of dropping its entries"""
+        data_manager = DataManager(self.test_output_dir, session_log=False)
+        data_manager.keyword_index.article_count()
+        self.close(data_manager)
+
+        blocker = sqlite3.connect(data_manager.keyword_index.db_path)
+        blocker.execute("BEGIN IMMEDIATE")
+        try:
+            with multiprocessing.get_context("spawn").Pool(2) as pool:
+                result = pool.starmap_async(index_in_process, [(self.test_output_dir, 0), (self.test_output_dir, 30)])
+                time.sleep(self.busy_seconds)
+                blocker.commit()
+                self.assertEqual(sum(result.get()), 60)
+        finally:
+            blocker.close()
+
+        data_manager = DataManager(self.test_output_dir, session_log=False)
+        self.assertEqual(data_manager.keyword_index.article_count(), 60)
+        self.assertEqual(data_manager.search_index.count(), 60)
+        self.assertEqual(data_manager.entity_index.article_count(), 60)
+        self.assertEqual(len(data_manager.entity_index.articles_mentioning("KPK")), 60)
+        self.assertEqual(len({alert[0] for alert in data_manager.screening_alerts.alerts()}), 60)
+        self.assertTrue(all(data_manager.case_clusterer.case_for(a["url"]) is not None for a in entity_articles(60)))
+        self.assertEqual(sum(case['article_count'] for case in data_manager.case_clusterer.cases(min_articles=1)), 60)
+        bank = data_manager.risk_scores.leaderboard(limit=100, entity_type="bank")
+        self.assertEqual([(row['entity'], row['article_count']) for row in bank], [("Bank Rakyat Indonesia", 60)])
+        self.close(data_manager)
+
+
+class TestDataManagerOnSQLite(unittest.TestCase):
+    """DataManager with SQLite storage"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_store_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def close(self, data_manager):
+        for store in (data_manager.store, data_manager.risk_scores, data_manager.case_clusterer,
+                      data_manager.screening_alerts, data_manager.entity_index, data_manager.keyword_index):
+            store.close()
+
+    def test_save_dedup_and_stats(self):
+        """Articles are saved once; counts and statistics come from SQLite"""
+        data_manager = DataManager(self.test_output_dir, storage="sqlite")
+        articles = make_articles(4)
+        self.assertEqual(data_manager.save_articles_batch(articles + articles[:2]), 4)
+        self.assertTrue(data_manager.check_duplicate(articles[0]["url"].upper()))
+        self.assertEqual(data_manager.get_articles_count(), 4)
+        self.assertEqual(data_manager.get_statistics()['total_articles'], 4)
+        self.assertEqual(data_manager.get_duplicate_urls([articles[1]["url"], "https://x.com/new"]),
+                         [articles[1]["url"]])
+        self.assertFalse(os.path.exists(data_manager.csv_file))
+        self.close(data_manager)
+
+    def test_migrate_and_auto_detect(self):
+        """A CSV corpus is migrated once; later managers pick SQLite automatically"""
+        data_manager = DataManager(self.test_output_dir)
+        self.assertEqual(data_manager.storage, "csv")
+        data_manager.save_articles_batch(make_articles(3))
+        self.assertEqual(data_manager.migrate_to_sqlite(), 3)
+        self.assertEqual(data_manager.storage, "sqlite")
+        self.close(data_manager)
+
+        self.assertEqual(detect_backend(self.test_output_dir), "sqlite")
+        data_manager = DataManager(self.test_output_dir)
+        self.assertIsInstance(data_manager.store, SQLiteArticleStore)
+        self.assertTrue(data_manager.save_article(make_articles(1, start=10)[0]))
+        self.assertEqual(data_manager.export_csv(), 4)
+        self.assertEqual(len(pd.read_csv(data_manager.csv_file, encoding='utf-8')), 4)
+        self.close(data_manager)
+
+    def test_paged_queries(self):
+        """recent/by_source/by_category/in_date_range never load the whole store"""
+        data_manager = DataManager(self.test_output_dir, storage="sqlite")
+        data_manager.save_articles_batch(make_articles(30))
+        with mock.patch.object(data_manager.store, "load") as load:
+            recent = data_manager.recent(5, columns=['title'])
+            self.assertEqual(recent['publication_date'].tolist(),
+                             [f"2025-07-{day} 10:00:00" for day in range(28, 23, -1)])
+            first = data_manager.by_source("news-2.com", limit=4)
+            second = data_manager.by_source("news-2.com", limit=4, after=data_manager.next_cursor(first))
+            self.assertEqual(len(set(first['url']) | set(second['url'])), 8)
+            self.assertEqual(len(data_manager.by_category("Fraud", limit=100)), 15)
+            self.assertEqual(len(data_manager.in_date_range("2025-07-01", "2025-07-02", limit=100)), 4)
+        load.assert_not_called()
+        self.close(data_manager)
+
+    @unittest.skipUnless(HAS_PYARROW, "needs pyarrow")
+    def test_migrate_to_parquet(self):
+        """A CSV corpus moves to Parquet; the dashboard columns load without full_text"""
+        data_manager = DataManager(self.test_output_dir)
+        data_manager.save_articles_batch(make_articles(3))
+        self.assertEqual(data_manager.migrate_storage("parquet"), 3)
+        self.close(data_manager)
+
+        data_manager = DataManager(self.test_output_dir)
+        self.assertEqual(data_manager.storage, "parquet")
+        df = data_manager.load_articles(columns=['publication_date', 'title', 'category'])
+        self.assertEqual(list(df.columns), ['publication_date', 'title', 'category'])
+        self.assertEqual(data_manager.get_statistics()['total_articles'], 3)
+        self.close(data_manager)
+
+    @unittest.skipUnless(HAS_PYARROW, "needs pyarrow")
+    def test_latest_migration_wins(self):
+        """After CSV -> SQLite -> Parquet, new managers open Parquet although articles.db remains"""
+        data_manager = DataManager(self.test_output_dir)
+        data_manager.save_articles_batch(make_articles(3))
+        data_manager.migrate_storage("sqlite")
+        self.assertEqual(data_manager.migrate_storage("parquet"), 3)
+        self.close(data_manager)
+
+        self.assertTrue(os.path.exists(os.path.join(self.test_output_dir, "articles.db")))
+        data_manager = DataManager(self.test_output_dir)
+        self.assertEqual(data_manager.storage, "parquet")
+        self.assertEqual(data_manager.get_articles_count(), 3)
+        self.close(data_manager)
+
+    def test_recategorize_on_sqlite(self):
+        """Recategorization rewrites the categories stored in SQLite"""
+        data_manager = DataManager(self.test_output_dir, storage="sqlite")
+        data_manager.save_article({
+            "title": "Bandar judi online ditangkap",
+            "url": "https://news.com/judi",
+            "source_name": "news.com",
+            "publication_date": "2025-07-01 10:00:00",
+            "full_text": "Polisi menangkap bandar judi online dan togel.",
+            "category": "Fraud",
+        })
+        self.assertEqual(data_manager.recategorize_articles(), 1)
+        self.assertEqual(data_manager.get_statistics()['categories'], {"Gambling": 1})
+        self.close(data_manager)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
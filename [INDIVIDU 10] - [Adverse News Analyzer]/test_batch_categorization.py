@@ -0,0 +1,127 @@
+"""
+Test script for batch categorization
+
+Validates NewsCategorizor.categorize_batch against per-article
+categorization, for both DataFrame and list-of-dict input, and the
+DataManager batch recategorization of the stored corpus.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.categorizer import NewsCategorizor
+from modules.data_manager import DataManager
+
+
+SAMPLE_ARTICLES = [
+    {"title": "KPK Tangkap Pejabat Pajak Terkait Suap Rp 2 Miliar",
+     "full_text": "KPK menangkap pejabat pajak karena menerima suap dan gratifikasi."},
+    {"title": "Polda Bongkar Sindikat Pencucian Uang",
+     "full_text": "Sindikat pencucian uang (money laundering) memakai layering melalui rekening bank."},
+    {"title": "Investasi Bodong Rugikan Ribuan Nasabah",
+     "full_text": "Skema ponzi berhasil menipu ribuan nasabah. Para penipu menjanjikan untung tinggi."},
+    {"title": "Polri Gerebek Situs Judi Online",
+     "full_text": "Situs judi ini menyediakan togel, slot online, dan poker online."},
+    {"title": "Kebakaran Hutan di Kalimantan Meluas",
+     "full_text": "Asap tebal mengganggu aktivitas penerbangan dan kesehatan masyarakat."},
+    {"title": "", "full_text": "Dirjen Pajak menyelidiki penggelapan pajak dan tax avoidance."},
+    {"title": "Artikel Kosong", "full_text": ""},
+]
+
+
+class TestBatchCategorization(unittest.TestCase):
+    """Batch categorization must agree with categorize_article"""
+
+    def setUp(self):
+        self.categorizer = NewsCategorizor()
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_batch_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def expected(self, articles):
+        return [self.categorizer.categorize_article(a["full_text"], a["title"]) for a in articles]
+
+    def test_batch_matches_single_article_list_input(self):
+        """List of article dicts gives the same categories as one-by-one"""
+        self.assertEqual(self.categorizer.categorize_batch(SAMPLE_ARTICLES), self.expected(SAMPLE_ARTICLES))
+
+    def test_batch_matches_single_article_dataframe_input(self):
+        """DataFrame input gives the same categories as one-by-one"""
+        df = pd.DataFrame(SAMPLE_ARTICLES)
+        self.assertEqual(self.categorizer.categorize_batch(df), self.expected(SAMPLE_ARTICLES))
+
+    def test_batch_matches_on_random_corpus(self):
+        """Random keyword-heavy corpus, including long articles, agrees per article"""
+        rng = random.Random(3)
+        words = [kw for kws in self.categorizer.category_keywords.values() for kw in kws]
+        words += ["pemerintah", "daerah", "rupiah", "bank", "nasabah", "polisi"] * 10
+        articles = [
+            {"title": " ".join(rng.choice(words) for _ in range(rng.randint(0, 6))),
+             "full_text": " ".join(rng.choice(words) for _ in range(rng.randint(0, 600)))}
+            for _ in range(150)
+        ]
+        self.assertEqual(self.categorizer.categorize_batch(articles), self.expected(articles))
+
+    def test_missing_values_and_empty_batch(self):
+        """NaN/None fields are treated as empty and an empty batch returns []"""
+        df = pd.DataFrame([
+            {"title": None, "full_text": "kasus korupsi dan suap"},
+            {"title": "Judi Online", "full_text": float("nan")},
+        ])
+        self.assertEqual(self.categorizer.categorize_batch(df), ["Corruption", "Other/Uncategorized"])
+        self.assertEqual(self.categorizer.categorize_batch([]), [])
+
+    def test_batch_uses_updated_keywords(self):
+        """Keywords added after the first batch are used by the next one"""
+        articles = [{"title": "", "full_text": "kejahatan finansial lintas negara"}]
+        self.assertEqual(self.categorizer.categorize_batch(articles), ["Other/Uncategorized"])
+        self.categorizer.add_keywords("Money Laundering", ["kejahatan finansial"])
+        self.assertEqual(self.categorizer.categorize_batch(articles), ["Money Laundering"])
+
+    def test_data_manager_recategorizes_corpus(self):
+        """DataManager rewrites stored categories from one batch call"""
+        data_manager = DataManager(self.test_output_dir)
+        for index, article in enumerate(SAMPLE_ARTICLES[:5]):
+            data_manager.save_article(dict(
+                article,
+                url=f"https://example.com/batch-{index}",
+                source_name="example.com",
+                publication_date="2025-08-01 10:00:00",
+                category="Other/Uncategorized"
+            ))
+
+        changed = data_manager.recategorize_articles()
+        df = data_manager.load_articles()
+
+        self.assertEqual(changed, 4)
+        self.assertEqual(df['category'].tolist(), self.expected(SAMPLE_ARTICLES[:5]))
+        self.assertFalse(os.path.exists(data_manager.csv_file + '.tmp'))
+
+    def test_batch_throughput(self):
+        """A few thousand articles are categorized in well under a few seconds"""
+        articles = SAMPLE_ARTICLES * 500
+        start = time.perf_counter()
+        results = self.categorizer.categorize_batch(articles)
+        elapsed = time.perf_counter() - start
+        print(f"\n   {len(articles)} articles in {elapsed:.2f}s")
+        self.assertEqual(len(results), len(articles))
+        self.assertLess(elapsed, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
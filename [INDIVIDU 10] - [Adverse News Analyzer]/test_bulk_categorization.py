@@ -0,0 +1,136 @@
+"""
+Test script for the parallel bulk categorization job
+
+Validates that streaming, multi-process recategorization of the article
+store gives the same categories as an in-memory batch, preserves every other
+column and the row order, replaces the store atomically and reports progress,
+and that on SQLite and Parquet storage the categories of articles without a
+URL are written back to the right rows.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import importlib.util
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.bulk_categorizer import bulk_recategorize, count_rows
+from modules.categorizer import NewsCategorizor
+from modules.data_manager import DataManager
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def write_corpus(csv_file, size, seed=5):
+    """Write a synthetic articles CSV with every article still uncategorized"""
+    rng = random.Random(seed)
+    categorizer = NewsCategorizor()
+    words = [kw for kws in categorizer.category_keywords.values() for kw in kws]
+    words += ["pemerintah", "daerah", "rupiah", "polisi", "jakarta"] * 10
+    rows = [{
+        "title": " ".join(rng.choice(words) for _ in range(rng.randint(0, 6))),
+        "url": f"https://example.com/bulk-{index}",
+        "source_name": "example.com",
+        "publication_date": "2025-08-01 10:00:00",
+        "category": "Other/Uncategorized",
+        "full_text": " ".join(rng.choice(words) for _ in range(rng.randint(0, 200))) + "\nbaris kedua, \"dikutip\"",
+    } for index in range(size)]
+    df = pd.DataFrame(rows)
+    df.to_csv(csv_file, index=False, encoding='utf-8')
+    return df
+
+
+class TestBulkCategorization(unittest.TestCase):
+    """Streaming process-pool recategorization of the article store"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_bulk_")
+        self.csv_file = os.path.join(self.test_output_dir, "articles.csv")
+        self.original = write_corpus(self.csv_file, 450)
+        self.categorizer = NewsCategorizor()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def assertRecategorized(self, result):
+        df = pd.read_csv(self.csv_file, encoding='utf-8')
+        expected = NewsCategorizor().categorize_batch(self.original)
+        self.assertEqual(df['category'].tolist(), expected)
+        self.assertEqual(df['url'].tolist(), self.original['url'].tolist())
+        self.assertEqual(df['full_text'].tolist(), self.original['full_text'].tolist())
+        self.assertEqual(result['rows'], 450)
+        self.assertEqual(result['changed'], sum(c != "Other/Uncategorized" for c in expected))
+        self.assertFalse(os.path.exists(self.csv_file + '.tmp'))
+
+    def test_parallel_matches_batch_categorization(self):
+        """A multi-process run gives the same categories, in the original order"""
+        result = bulk_recategorize(self.csv_file, self.categorizer, workers=2, chunk_size=100)
+        self.assertRecategorized(result)
+
+    def test_in_process_run(self):
+        """workers=1 runs without a process pool and gives the same result"""
+        result = bulk_recategorize(self.csv_file, self.categorizer, workers=1, chunk_size=64)
+        self.assertRecategorized(result)
+
+    def test_progress_reports_throughput_and_eta(self):
+        """Progress is reported after every chunk, ending at the total"""
+        reports = []
+        bulk_recategorize(self.csv_file, self.categorizer, workers=2, chunk_size=100, progress=reports.append)
+        self.assertEqual([r['done'] for r in reports], [100, 200, 300, 400, 450])
+        self.assertTrue(all(r['total'] == 450 for r in reports))
+        self.assertEqual(reports[-1]['eta'], 0)
+        self.assertGreater(reports[-1]['rate'], 0)
+
+    def test_workers_use_caller_keywords(self):
+        """Keywords added to the caller's categorizer are used by the workers"""
+        self.categorizer.add_keywords("Gambling", ["baris kedua"] * 50)
+        bulk_recategorize(self.csv_file, self.categorizer, workers=2, chunk_size=200)
+        df = pd.read_csv(self.csv_file, encoding='utf-8')
+        self.assertEqual(set(df['category']), {"Gambling"})
+
+    def test_data_manager_bulk_recategorize(self):
+        """DataManager exposes the bulk job for its own store"""
+        data_manager = DataManager(self.test_output_dir)
+        self.assertEqual(count_rows(data_manager.csv_file), 450)
+        result = data_manager.bulk_recategorize(workers=2, chunk_size=150)
+        self.assertRecategorized(result)
+
+    def test_articles_without_url_on_other_stores(self):
+        """The export's URL-less rows get their own categories back on SQLite and Parquet"""
+        articles = [
+            {"title": "Bandar judi online ditangkap", "url": "", "source_name": "news.com",
+             "publication_date": "2025-07-01 10:00:00", "full_text": "Polisi menangkap bandar judi online dan togel.",
+             "category": "Fraud"},
+            {"title": "KPK menahan bupati", "url": "", "source_name": "news.com",
+             "publication_date": "2025-07-02 10:00:00", "full_text": "Bupati ditahan KPK atas kasus korupsi dan suap.",
+             "category": "Fraud"},
+        ]
+        for storage in ["sqlite"] + (["parquet"] if HAS_PYARROW else []):
+            with self.subTest(storage=storage):
+                output_dir = os.path.join(self.test_output_dir, storage)
+                data_manager = DataManager(output_dir, storage=storage, session_log=False)
+                data_manager.save_articles_batch([dict(article) for article in articles])
+                result = data_manager.bulk_recategorize(workers=1, chunk_size=10)
+                self.assertEqual(result['changed'], 2)
+                df = data_manager.load_articles()
+                self.assertEqual(dict(zip(df['title'], df['category'])),
+                                 {"Bandar judi online ditangkap": "Gambling", "KPK menahan bupati": "Corruption"})
+                for store in (data_manager.store, data_manager.search_index, data_manager.risk_scores,
+                              data_manager.case_clusterer, data_manager.screening_alerts,
+                              data_manager.entity_index, data_manager.keyword_index):
+                    store.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
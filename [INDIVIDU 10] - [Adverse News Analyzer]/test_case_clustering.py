@@ -0,0 +1,149 @@
+"""
+Test script for case clustering
+
+Validates that articles about the same case from different sources and
+stages are grouped into one timeline, that unrelated or stale articles start
+new cases, and that DataManager clusters articles at ingest.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.case_clustering import CaseClusterer, article_stage
+from modules.data_manager import DataManager
+from modules.entity_extractor import EntityExtractor
+
+CASE_ARTICLES = [
+    ("2025-03-02 09:00:00", "news-a.com", "KPK Tangkap Bupati Rahmat Hidayat dalam OTT",
+     "Penyidik KPK menangkap Bupati Rahmat Hidayat dalam operasi tangkap tangan terkait suap proyek jalan. "
+     "Uang tunai disita dari rumah dinas bupati."),
+    ("2025-03-04 14:00:00", "news-b.com", "Rahmat Hidayat Ditetapkan Tersangka Suap Proyek Jalan",
+     "KPK menetapkan Bupati Rahmat Hidayat sebagai tersangka suap proyek jalan kabupaten. "
+     "Rahmat Hidayat ditahan selama dua puluh hari."),
+    ("2025-05-20 10:00:00", "news-c.com", "Jaksa Tuntut Rahmat Hidayat Delapan Tahun",
+     "Dalam sidang di Pengadilan Tipikor, jaksa menuntut Rahmat Hidayat delapan tahun penjara "
+     "atas suap proyek jalan kabupaten."),
+    ("2025-06-18 11:00:00", "news-a.com", "Rahmat Hidayat Divonis Tujuh Tahun Penjara",
+     "Majelis hakim memvonis Bupati Rahmat Hidayat tujuh tahun penjara karena terbukti menerima suap "
+     "proyek jalan kabupaten."),
+]
+
+UNRELATED_ARTICLE = (
+    "2025-03-05 08:00:00", "news-b.com", "Polisi Bongkar Judi Online Jaringan Internasional",
+    "Polda Metro Jaya membongkar jaringan judi online dan menangkap Sinta Maharani sebagai operator "
+    "situs taruhan yang beromzet miliaran rupiah."
+)
+
+
+def make_article(index, published, source, title, text):
+    return {
+        "title": title,
+        "url": f"https://{source}/case-{index}",
+        "source_name": source,
+        "publication_date": published,
+        "full_text": text,
+    }
+
+
+class TestCaseClusterer(unittest.TestCase):
+    """Incremental, entity-blocked clustering"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_cases_")
+        self.clusterer = CaseClusterer(os.path.join(self.test_output_dir, "cases.db"))
+        self.extractor = EntityExtractor()
+
+    def tearDown(self):
+        self.clusterer.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def add(self, index, published, source, title, text):
+        article = make_article(index, published, source, title, text)
+        entities = self.extractor.extract(text, title)
+        return self.clusterer.add_article(f"case-{index}", article, entities)
+
+    def test_stages(self):
+        """The latest stage mentioned by an article is reported"""
+        self.assertEqual(article_stage("", "KPK Tangkap Bupati dalam OTT"), "Arrest")
+        self.assertEqual(article_stage("ditetapkan sebagai tersangka"), "Charge")
+        self.assertEqual(article_stage("jaksa menuntut dalam sidang"), "Trial")
+        self.assertEqual(article_stage("hakim memvonis terdakwa yang ditangkap tahun lalu"), "Verdict")
+        self.assertEqual(article_stage("Rapat anggaran berlangsung lancar"), "Report")
+
+    def test_same_case_across_sources_and_stages(self):
+        """Arrest, charge, trial and verdict reports form one timeline"""
+        case_ids = {self.add(index, *article) for index, article in enumerate(CASE_ARTICLES)}
+        self.assertEqual(len(case_ids), 1)
+
+        timeline = self.clusterer.timeline(case_ids.pop())
+        self.assertEqual([row['stage'] for row in timeline], ["Arrest", "Charge", "Trial", "Verdict"])
+        self.assertEqual({row['source_name'] for row in timeline}, {"news-a.com", "news-b.com", "news-c.com"})
+
+        cases = self.clusterer.cases()
+        self.assertEqual(len(cases), 1)
+        self.assertEqual(cases[0]['label'], "Rahmat Hidayat")
+        self.assertEqual(cases[0]['first_date'], "2025-03-02 09:00:00")
+        self.assertEqual(cases[0]['last_date'], "2025-06-18 11:00:00")
+
+    def test_unrelated_article_starts_new_case(self):
+        """An article sharing no entity with a case gets its own case"""
+        case_id = self.add(0, *CASE_ARTICLES[0])
+        other_id = self.add(1, *UNRELATED_ARTICLE)
+        self.assertNotEqual(case_id, other_id)
+        self.assertEqual(self.add(2, *CASE_ARTICLES[1]), case_id)
+
+    def test_stale_case_is_not_extended(self):
+        """An article published after max_gap_days starts a new case"""
+        self.clusterer.max_gap_days = 30
+        first = self.add(0, *CASE_ARTICLES[0])
+        self.assertNotEqual(self.add(3, *CASE_ARTICLES[3]), first)
+
+    def test_add_is_idempotent(self):
+        """Re-adding an article keeps its case and does not count it twice"""
+        case_id = self.add(0, *CASE_ARTICLES[0])
+        self.add(1, *CASE_ARTICLES[1])
+        self.assertEqual(self.add(0, *CASE_ARTICLES[0]), case_id)
+        self.assertEqual(self.clusterer.cases()[0]['article_count'], 2)
+        self.assertEqual(self.clusterer.case_for("case-0"), case_id)
+
+
+class TestCasesAtIngest(unittest.TestCase):
+    """DataManager clusters articles when they are saved"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_cases_")
+        self.data_manager = DataManager(self.test_output_dir)
+
+    def tearDown(self):
+        for store in (self.data_manager.case_clusterer, self.data_manager.screening_alerts,
+                      self.data_manager.entity_index, self.data_manager.keyword_index):
+            store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_cases_built_at_ingest_and_rebuilt(self):
+        """Saved articles are clustered; a rebuild gives the same cases"""
+        for index, article in enumerate(CASE_ARTICLES + [UNRELATED_ARTICLE]):
+            self.data_manager.save_article(make_article(index, *article))
+
+        cases = self.data_manager.get_cases()
+        self.assertEqual(cases['label'].tolist(), ["Rahmat Hidayat"])
+        self.assertEqual(cases['article_count'].tolist(), [4])
+        timeline = self.data_manager.get_case_timeline(cases['case_id'].iloc[0])
+        self.assertEqual(timeline['stage'].tolist(), ["Arrest", "Charge", "Trial", "Verdict"])
+
+        self.assertEqual(self.data_manager.rebuild_cases(), 1)
+        self.assertEqual(self.data_manager.get_cases()['article_count'].tolist(), [4])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
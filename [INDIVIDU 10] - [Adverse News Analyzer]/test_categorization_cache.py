@@ -0,0 +1,107 @@
+"""
+Test script for categorization memoization
+
+Validates the content-hash LRU cache of NewsCategorizor: repeated texts are
+served from the cache, keyword changes invalidate stale results, the cache
+stays bounded, and the optional SQLite persistence survives a restart.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.categorizer import NewsCategorizor
+
+
+ARTICLE_TITLE = "Polisi Selidiki Kejahatan Finansial"
+ARTICLE_TEXT = "Polisi menyelidiki kasus kejahatan finansial yang melibatkan beberapa bank."
+
+
+class TestCategorizationCache(unittest.TestCase):
+    """Memoization behaviour of NewsCategorizor"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_cache_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_repeat_categorization_hits_cache(self):
+        """The second categorization of the same content is a cache hit"""
+        categorizer = NewsCategorizor()
+        first = categorizer.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+        second = categorizer.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+        self.assertEqual(first, second)
+        self.assertEqual(categorizer.cache_info()['hits'], 1)
+        self.assertEqual(categorizer.cache_info()['misses'], 1)
+
+    def test_case_variants_share_cache_entry(self):
+        """Normalized (lower-cased) content maps to the same entry"""
+        categorizer = NewsCategorizor()
+        categorizer.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+        categorizer.categorize_article(ARTICLE_TEXT.upper(), ARTICLE_TITLE.lower())
+        self.assertEqual(categorizer.cache_info()['hits'], 1)
+
+    def test_add_keywords_invalidates_cached_results(self):
+        """A keyword table change produces new cache keys"""
+        categorizer = NewsCategorizor()
+        version = categorizer.keyword_version
+        before = categorizer.categorize_article(ARTICLE_TEXT, "Laporan Polisi")
+        categorizer.add_keywords("Money Laundering", ["kejahatan finansial"] * 3)
+        after = categorizer.categorize_article(ARTICLE_TEXT, "Laporan Polisi")
+
+        self.assertNotEqual(categorizer.keyword_version, version)
+        self.assertEqual(before, "Corruption")
+        self.assertEqual(after, "Money Laundering")
+
+    def test_cache_is_bounded(self):
+        """The LRU never grows beyond its configured size"""
+        categorizer = NewsCategorizor(cache_size=3)
+        for index in range(10):
+            categorizer.categorize_article(f"kasus korupsi nomor {index}")
+        self.assertEqual(categorizer.cache_info()['size'], 3)
+
+    def test_cache_can_be_disabled(self):
+        """cache_size=0 turns memoization off"""
+        categorizer = NewsCategorizor(cache_size=0)
+        categorizer.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+        categorizer.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+        self.assertIsNone(categorizer.cache)
+        self.assertEqual(categorizer.cache_info()['hits'], 0)
+
+    def test_persistent_cache_survives_restart(self):
+        """Results written to the SQLite cache are reused by a new instance"""
+        cache_path = os.path.join(self.test_output_dir, "categorization_cache.db")
+        first = NewsCategorizor(cache_path=cache_path)
+        category = first.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+
+        second = NewsCategorizor(cache_path=cache_path)
+        self.assertEqual(second.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE), category)
+        self.assertEqual(second.cache_info()['hits'], 1)
+        self.assertEqual(second.cache_info()['misses'], 0)
+
+    def test_batch_uses_and_fills_cache(self):
+        """Batch categorization reuses cached results and caches new ones"""
+        categorizer = NewsCategorizor()
+        articles = [
+            {"title": ARTICLE_TITLE, "full_text": ARTICLE_TEXT},
+            {"title": "Judi Online", "full_text": "situs judi online diblokir"},
+        ]
+        categorizer.categorize_article(ARTICLE_TEXT, ARTICLE_TITLE)
+        results = categorizer.categorize_batch(articles)
+        self.assertEqual(categorizer.cache_info()['hits'], 1)
+        self.assertEqual(results, [categorizer.categorize_article(a["full_text"], a["title"]) for a in articles])
+        self.assertEqual(categorizer.cache_info()['hits'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
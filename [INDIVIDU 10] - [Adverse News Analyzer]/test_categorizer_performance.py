@@ -0,0 +1,157 @@
+"""
+Categorizer Scoring Engine Test and Benchmark
+
+Checks that the compiled keyword matcher produces exactly the
+same category scores as the original per-keyword regex scan, and benchmarks
+both implementations on long articles.
+
+Run directly for a benchmark report:
+    python test_categorizer_performance.py
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import random
+import re
+import sys
+import time
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.categorizer import NewsCategorizor
+
+
+def reference_category_scores(categorizer, article_text, title=""):
+    """Original scoring loop: one regex scan per keyword of every category"""
+    combined_text = f"{title} {title} {article_text}".lower()
+    category_scores = {}
+    for category, keywords in categorizer.category_keywords.items():
+        score = 0
+        for keyword in keywords:
+            score += len(re.findall(re.escape(keyword.lower()), combined_text))
+            if title and keyword.lower() in title.lower():
+                score += 2
+        category_scores[category] = score
+    return category_scores
+
+
+SAMPLE_PARAGRAPH = (
+    "Komisi Pemberantasan Korupsi (KPK) menetapkan tersangka baru dalam kasus "
+    "dugaan korupsi pengadaan dan pencucian uang. PPATK menemukan transaksi "
+    "mencurigakan melalui rekening bank dan investasi bodong dengan skema ponzi. "
+    "Para penipu juga menjalankan situs judi online dan menghindari pajak melalui "
+    "faktur pajak fiktif. Pembobol rekening nasabah ditangkap dan ditahan polisi, "
+    "sementara hakim menjatuhkan vonis kepada terdakwa penyuapan. "
+)
+
+
+def make_long_article(paragraphs=200):
+    """Build a long article (~100 KB) from repeated realistic paragraphs"""
+    return SAMPLE_PARAGRAPH * paragraphs
+
+
+class TestCompiledScoringEngine(unittest.TestCase):
+    """Equivalence and speed of the compiled keyword matcher"""
+
+    def setUp(self):
+        self.categorizer = NewsCategorizor()
+
+    def assertScoresMatchReference(self, article_text, title=""):
+        expected = reference_category_scores(self.categorizer, article_text, title)
+        actual = self.categorizer.get_category_scores(article_text, title)
+        self.assertEqual(actual, expected, f"title={title!r} text={article_text[:80]!r}")
+
+    def test_identical_scores_on_realistic_articles(self):
+        """Scores match the reference on realistic Indonesian text"""
+        self.assertScoresMatchReference(SAMPLE_PARAGRAPH, "KPK Tangkap Pejabat Pajak Terkait Suap")
+        self.assertScoresMatchReference(SAMPLE_PARAGRAPH)
+        self.assertScoresMatchReference("Kebakaran hutan di Kalimantan meluas", "Kebakaran Hutan")
+
+    def test_identical_scores_on_overlapping_keywords(self):
+        """Nested and overlapping keywords are each counted like re.findall"""
+        cases = [
+            ("judi online judi judi onlinejudi", "Situs Judi Online"),
+            ("pembobol bobol bobolbobol", "Pembobol"),
+            ("penipuan online penipuanpenipu menipu tipu", ""),
+            ("penggelapan pajak dirjen pajakpajak wajib pajak", "Pajak"),
+            ("aaa aml amlaml", "AML"),
+        ]
+        for article_text, title in cases:
+            self.assertScoresMatchReference(article_text, title)
+
+    def test_identical_scores_across_title_body_boundary(self):
+        """Keywords spanning the title/body separator are counted as before"""
+        self.assertScoresMatchReference("online dan lainnya", "judi")
+        self.assertScoresMatchReference("uang hasil kejahatan", "Pencucian")
+        self.assertScoresMatchReference("ponzi", "skema")
+
+    def test_identical_scores_on_random_text(self):
+        """Randomised text built from keyword fragments matches the reference"""
+        rng = random.Random(42)
+        fragments = [kw for kws in self.categorizer.category_keywords.values() for kw in kws]
+        fragments += ["a", "n", " ", "pen", "ipu", "uang", "bank", "  ", "\n", "\t"]
+        for _ in range(200):
+            article_text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 40)))
+            title = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 5)))
+            self.assertScoresMatchReference(article_text, title.upper())
+
+    def test_identical_scores_on_long_random_text(self):
+        """Long texts scored through the vocabulary path match the reference"""
+        rng = random.Random(7)
+        fragments = [kw for kws in self.categorizer.category_keywords.values() for kw in kws]
+        fragments += ["a", "n", " ", " ", " ", "pen", "ipu", "uang", "bank", "  ", "\n", "\t", "Rp 5 miliar"]
+        for _ in range(50):
+            article_text = "".join(rng.choice(fragments) for _ in range(rng.randint(300, 1500)))
+            title = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 8)))
+            self.assertGreater(len(article_text), 2000)
+            self.assertScoresMatchReference(article_text, title.upper())
+
+    def test_matcher_recompiles_after_keyword_changes(self):
+        """Keywords added later are picked up by the compiled matcher"""
+        self.categorizer.add_keywords("Money Laundering", ["kejahatan finansial"])
+        self.assertScoresMatchReference("kasus kejahatan finansial di bank", "Kejahatan Finansial")
+        self.categorizer.category_keywords["Gambling"].append("sabung ayam")
+        self.assertScoresMatchReference("sabung ayam ilegal", "")
+
+    def test_compiled_engine_is_faster_on_long_articles(self):
+        """The compiled engine beats the per-keyword scan on long articles"""
+        article_text = make_long_article()
+        title = "KPK Tetapkan Tersangka Kasus Korupsi dan Pencucian Uang"
+
+        legacy_time, compiled_time = benchmark(self.categorizer, article_text, title, repeat=3)
+        print(f"\n   Legacy: {legacy_time * 1000:.1f} ms, compiled: {compiled_time * 1000:.1f} ms, "
+              f"speedup: {legacy_time / compiled_time:.1f}x")
+        self.assertLess(compiled_time, legacy_time)
+
+
+def benchmark(categorizer, article_text, title, repeat=5):
+    """Return the best-of-`repeat` time of the legacy and compiled scorers"""
+    categorizer.get_category_scores("warm up", "warm up")
+
+    legacy_times, compiled_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reference_category_scores(categorizer, article_text, title)
+        legacy_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        categorizer.get_category_scores(article_text, title)
+        compiled_times.append(time.perf_counter() - start)
+    return min(legacy_times), min(compiled_times)
+
+
+if __name__ == '__main__':
+    categorizer = NewsCategorizor()
+    print("📏 Categorizer benchmark (best of 5)")
+    for paragraphs in (1, 10, 100, 1000):
+        text = make_long_article(paragraphs)
+        legacy_time, compiled_time = benchmark(categorizer, text, "KPK Tetapkan Tersangka Kasus Korupsi")
+        print(f"   {len(text) / 1024:8.1f} KB: legacy {legacy_time * 1000:8.2f} ms | "
+              f"compiled {compiled_time * 1000:8.2f} ms | {legacy_time / compiled_time:5.1f}x")
+    print()
+    unittest.main(verbosity=2)
@@ -0,0 +1,154 @@
+"""
+Test script for entity extraction
+
+Validates gazetteer matching (aliases, longest match, upper-case acronyms),
+the capitalised-name person and company heuristics, and the entity -> article index
+maintained by DataManager at ingest.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager
+from modules.entity_extractor import EntityExtractor, EntityIndex
+
+
+SAMPLE_TEXT = (
+    "Komisi Pemberantasan Korupsi (KPK) memeriksa Direktur Utama Bank BRI, Budi Santoso Wijaya, "
+    "di Jakarta pada Senin. Menurut Ali Fikri, aliran dana dilaporkan oleh PPATK kepada OJK."
+)
+
+
+class TestEntityExtractor(unittest.TestCase):
+    """Gazetteer trie and person heuristic"""
+
+    def setUp(self):
+        self.extractor = EntityExtractor()
+
+    def test_gazetteer_aliases_map_to_canonical_names(self):
+        """Full names and acronyms resolve to one canonical entity"""
+        entities = self.extractor.extract(SAMPLE_TEXT)
+        self.assertEqual(entities[("KPK", "agency")], 2)
+        self.assertEqual(entities[("Bank Rakyat Indonesia", "bank")], 1)
+        self.assertEqual(entities[("PPATK", "agency")], 1)
+        self.assertEqual(entities[("OJK", "agency")], 1)
+
+    def test_longest_match_wins(self):
+        """'Bank Indonesia' is not reported inside 'Bank Rakyat Indonesia' and vice versa"""
+        entities = self.extractor.extract("Bank Rakyat Indonesia diawasi Bank Indonesia.")
+        self.assertEqual(entities[("Bank Rakyat Indonesia", "bank")], 1)
+        self.assertEqual(entities[("Bank Indonesia", "agency")], 1)
+        self.assertEqual(len(entities), 2)
+
+    def test_short_acronyms_require_upper_case(self):
+        """Lower-case words that spell an acronym are not entities"""
+        self.assertEqual(self.extractor.extract("harga bca dan lps"), {})
+        self.assertEqual(self.extractor.extract("Bank bri"), {("Bank Rakyat Indonesia", "bank"): 1})
+
+    def test_persons_from_capitalised_names(self):
+        """Runs of capitalised words become persons; titles, places and dates do not"""
+        entities = self.extractor.extract(SAMPLE_TEXT)
+        persons = {name for name, entity_type in entities if entity_type == "person"}
+        self.assertEqual(persons, {"Budi Santoso Wijaya", "Ali Fikri"})
+
+    def test_companies_are_not_persons(self):
+        """Capitalised words after PT/CV or before Tbk are a company, not a person"""
+        entities = self.extractor.extract(
+            "PT Sinar Jaya Abadi diduga menyuap pejabat. Direktur PT Sinar Jaya Abadi Tbk, Hendra Gunawan, "
+            "dan pemilik CV Maju diperiksa. Saham emiten Sentosa Makmur Tbk disuspensi."
+        )
+        self.assertEqual(entities, {
+            ("PT Sinar Jaya Abadi", "company"): 2,
+            ("CV Maju", "company"): 1,
+            ("Sentosa Makmur Tbk", "company"): 1,
+            ("Hendra Gunawan", "person"): 1,
+        })
+
+    def test_persons_not_taken_from_title(self):
+        """Title-case headlines do not produce persons"""
+        entities = self.extractor.extract("", "Polisi Tangkap Pelaku Penipuan Online")
+        self.assertEqual(entities, {})
+
+    def test_canonical_name(self):
+        """Aliases can be resolved for lookups"""
+        self.assertEqual(self.extractor.canonical_name("komisi pemberantasan korupsi"), ("KPK", "agency"))
+        self.assertEqual(self.extractor.canonical_name("BRI"), ("Bank Rakyat Indonesia", "bank"))
+        self.assertIsNone(self.extractor.canonical_name("Budi Santoso"))
+
+
+class TestEntityIndex(unittest.TestCase):
+    """Entity -> article lookups through DataManager"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_entities_")
+        self.data_manager = DataManager(self.test_output_dir)
+        articles = [
+            ("KPK Periksa Dirut BRI", SAMPLE_TEXT),
+            ("PPATK Temukan Transaksi Mencurigakan", "PPATK menemukan transaksi di Bank Mandiri dan BRI."),
+            ("Judi Online", "Situs judi online diblokir oleh Kominfo."),
+        ]
+        for index, (title, text) in enumerate(articles):
+            self.data_manager.save_article({
+                "title": title,
+                "url": f"https://example.com/entity-{index}",
+                "source_name": "example.com",
+                "publication_date": "2025-08-01 10:00:00",
+                "full_text": text,
+            })
+
+    def tearDown(self):
+        self.data_manager.entity_index.close()
+        self.data_manager.keyword_index.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_entities_indexed_at_ingest(self):
+        """Lookups by canonical name or alias return the mentioning articles"""
+        df = self.data_manager.articles_mentioning("BRI")
+        self.assertEqual(df['url'].tolist(), ["https://example.com/entity-0", "https://example.com/entity-1"])
+        self.assertEqual(df['mentions'].tolist(), [2, 1])
+        self.assertEqual(len(self.data_manager.articles_mentioning("Bank Rakyat Indonesia")), 2)
+        self.assertEqual(len(self.data_manager.articles_mentioning("budi santoso wijaya")), 1)
+        self.assertEqual(len(self.data_manager.articles_mentioning("Bank Danamon")), 0)
+
+    def test_lookup_does_not_load_the_store(self):
+        """Only the mentioning articles are read from the store"""
+        with mock.patch.object(self.data_manager.store, "load") as load:
+            self.assertEqual(len(self.data_manager.articles_mentioning("PPATK")), 2)
+        load.assert_not_called()
+
+    def test_entities_for_article_and_top_entities(self):
+        """Per-article entities and the most mentioned entities"""
+        index = self.data_manager.entity_index
+        entities = index.entities_for("https://example.com/entity-1")
+        self.assertIn(("PPATK", "agency", 2), entities)
+        self.assertEqual(index.top_entities("agency", limit=1), [("PPATK", "agency", 2)])
+
+    def test_rebuild_entity_index(self):
+        """The index can be rebuilt from the stored articles"""
+        self.data_manager.entity_index.clear()
+        self.assertEqual(self.data_manager.rebuild_entity_index(), 3)
+        self.assertEqual(len(self.data_manager.articles_mentioning("PPATK")), 2)
+
+    def test_reindexing_replaces_mentions(self):
+        """Re-adding an article replaces its previous mentions"""
+        index = EntityIndex(os.path.join(self.test_output_dir, "other.db"))
+        index.add_article("a", {("KPK", "agency"): 2})
+        index.add_article("a", {("OJK", "agency"): 1})
+        self.assertEqual(index.articles_mentioning("KPK"), {})
+        self.assertEqual(index.articles_mentioning("ojk"), {"a": 1})
+        index.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
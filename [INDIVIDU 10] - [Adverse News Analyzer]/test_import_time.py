@@ -0,0 +1,89 @@
+"""
+Import Time Budget Test
+
+Guards the cold-start cost of the application modules. Importing the
+`modules` package (and its submodules) must not load pandas, requests or
+BeautifulSoup, and must stay within a small fixed time budget.
+
+Each measurement runs in a fresh interpreter so results are not affected
+by modules already imported by the test runner.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Generous enough for slow CI machines, far below the cost of importing pandas
+IMPORT_BUDGET_SECONDS = 0.25
+
+HEAVY_DEPENDENCIES = ['pandas', 'numpy', 'requests', 'bs4', 'torch', 'transformers']
+
+
+def _measure_import(statement):
+    """Run `statement` in a fresh interpreter and report its duration and loaded deps"""
+    code = f"""
+import json, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+from modules._lazy import is_loaded
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [name for name in {HEAVY_DEPENDENCIES!r} if is_loaded(name)]
+}}))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTimeBudget(unittest.TestCase):
+    """Cold-start import budget for the application modules"""
+
+    def test_package_import_is_lightweight(self):
+        """`import modules` loads no heavy dependency"""
+        result = _measure_import("import modules")
+        print(f"\n   import modules: {result['elapsed'] * 1000:.1f} ms")
+        self.assertEqual(result['loaded'], [])
+        self.assertLess(result['elapsed'], IMPORT_BUDGET_SECONDS)
+
+    def test_submodule_imports_defer_heavy_dependencies(self):
+        """Importing every submodule still defers pandas, requests and bs4"""
+        result = _measure_import(
+            "import modules.scraper, modules.categorizer, modules.data_manager"
+        )
+        print(f"\n   import submodules: {result['elapsed'] * 1000:.1f} ms")
+        self.assertEqual(result['loaded'], [])
+        self.assertLess(result['elapsed'], IMPORT_BUDGET_SECONDS)
+
+    def test_cli_help_is_fast(self):
+        """Short CLI commands do not import the data stack"""
+        result = _measure_import(
+            "import cli\ntry:\n    cli.build_parser().parse_args(['--help'])\nexcept SystemExit:\n    pass"
+        )
+        self.assertEqual(result['loaded'], [])
+        self.assertLess(result['elapsed'], IMPORT_BUDGET_SECONDS)
+
+    def test_lazy_module_loads_on_first_use(self):
+        """Heavy modules are loaded transparently on first attribute access"""
+        result = _measure_import(
+            "import modules.data_manager as dm\ndm.pd.DataFrame()"
+        )
+        self.assertIn('pandas', result['loaded'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,175 @@
+"""
+Test script for the inverted keyword index
+
+Validates KeywordIndex candidate lookup (including keywords that occur
+inside longer words or span several words), its maintained article count,
+and the DataManager incremental re-categorization that only reads and
+re-scores the articles affected by a keyword change.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from unittest import mock
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager
+from modules.keyword_index import KeywordIndex
+
+
+SAMPLE_ARTICLES = [
+    {"title": "Kejahatan Finansial Lintas Negara",
+     "full_text": "Polisi menyelidiki kejahatan finansial yang melibatkan rekening bank."},
+    {"title": "Sabung Ayam Digerebek",
+     "full_text": "Polisi membubarkan arena sabung ayam di desa."},
+    {"title": "KPK Tangkap Pejabat",
+     "full_text": "KPK menangkap pejabat karena kasus korupsi dan suap."},
+    {"title": "Kebakaran Hutan",
+     "full_text": "Asap tebal mengganggu penerbangan."},
+]
+
+
+class TestKeywordIndex(unittest.TestCase):
+    """Candidate lookup of the SQLite inverted index"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_index_")
+        self.index = KeywordIndex(os.path.join(self.test_output_dir, "keyword_index.db"))
+        self.index.add_articles([
+            ("a", "KPK tahan tersangka korupsi"),
+            ("b", "Situs judi online diblokir"),
+            ("c", "Pembobol rekening ditangkap"),
+        ])
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_candidates_for_words_and_phrases(self):
+        """Single words and multi-word phrases map to the right articles"""
+        self.assertEqual(self.index.candidate_articles(["korupsi"]), {"a"})
+        self.assertEqual(self.index.candidate_articles(["judi online"]), {"b"})
+        self.assertEqual(self.index.candidate_articles(["judi online", "kpk"]), {"a", "b"})
+        self.assertEqual(self.index.candidate_articles(["sabung ayam"]), set())
+
+    def test_candidates_for_substrings_inside_terms(self):
+        """Keywords match inside longer words, like the categorizer does"""
+        self.assertEqual(self.index.candidate_articles(["bobol"]), {"c"})
+        self.assertEqual(self.index.candidate_articles(["TANGKAP"]), {"c"})
+
+    def test_keyword_without_word_characters(self):
+        """Punctuation-only keywords cannot be narrowed down"""
+        self.assertIsNone(self.index.candidate_articles(["--"]))
+
+    def test_reindex_and_remove(self):
+        """Re-indexing replaces postings and removal drops the article"""
+        self.index.add_article("a", "Berita cuaca")
+        self.assertEqual(self.index.candidate_articles(["korupsi"]), set())
+        self.assertEqual(self.index.term_postings("cuaca"), {"a": 1})
+
+        self.index.remove_article("b")
+        self.assertEqual(self.index.candidate_articles(["judi"]), set())
+        self.assertEqual(self.index.article_count(), 2)
+
+    def test_article_count_maintained(self):
+        """The count follows adds, re-adds, removals and clears without scanning postings"""
+        self.index.add_article("a", "Berita cuaca")
+        self.index.add_article("d", "")
+        self.assertEqual(self.index.article_count(), 4)
+        self.index.remove_article("d")
+        self.index.remove_article("missing")
+        self.assertEqual(self.index.article_count(), 3)
+        self.index.clear()
+        self.assertEqual(self.index.article_count(), 0)
+
+    def test_count_backfilled_for_older_index(self):
+        """An index written without the articles table gets its count on first open"""
+        self.index.close()
+        with sqlite3.connect(self.index.db_path) as connection:
+            connection.executescript("DROP TABLE articles; DROP TABLE meta;")
+        connection.close()
+        reopened = KeywordIndex(self.index.db_path)
+        self.assertEqual(reopened.article_count(), 3)
+        reopened.close()
+
+    def test_index_persists(self):
+        """A new instance reads the postings written by the previous one"""
+        self.index.close()
+        reopened = KeywordIndex(self.index.db_path)
+        self.assertEqual(reopened.candidate_articles(["korupsi"]), {"a"})
+        reopened.close()
+
+
+class TestIncrementalRecategorization(unittest.TestCase):
+    """DataManager re-scores only the articles affected by keyword changes"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_index_")
+        self.data_manager = DataManager(self.test_output_dir)
+        for index, article in enumerate(SAMPLE_ARTICLES):
+            self.data_manager.save_article(dict(
+                article,
+                url=f"https://example.com/index-{index}",
+                source_name="example.com",
+                publication_date="2025-08-01 10:00:00",
+                category=self.data_manager.categorizer.categorize_article(
+                    article["full_text"], article["title"]
+                )
+            ))
+
+    def tearDown(self):
+        self.data_manager.keyword_index.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_articles_are_indexed_at_ingest(self):
+        """Saved articles are added to the index"""
+        self.assertEqual(self.data_manager.keyword_index.article_count(), len(SAMPLE_ARTICLES))
+
+    def test_add_keywords_rescores_only_candidates(self):
+        """Only articles containing the new keyword are read and passed to the categorizer"""
+        categorizer = self.data_manager.categorizer
+        with mock.patch.object(categorizer, 'categorize_batch', wraps=categorizer.categorize_batch) as batch, \
+                mock.patch.object(self.data_manager, 'load_articles') as load:
+            changed = self.data_manager.add_keywords("Gambling", ["sabung ayam"])
+
+        self.assertEqual(changed, 1)
+        self.assertEqual(len(batch.call_args[0][0]), 1)
+        load.assert_not_called()
+        df = self.data_manager.load_articles()
+        self.assertEqual(df.loc[df['url'].str.endswith('index-1'), 'category'].item(), "Gambling")
+        self.assertFalse(os.path.exists(self.data_manager.csv_file + '.tmp'))
+
+    def test_remove_keywords_reverts_category(self):
+        """Removing a keyword re-scores the articles that contained it"""
+        self.data_manager.add_keywords("Money Laundering", ["kejahatan finansial"] * 3)
+        df = self.data_manager.load_articles()
+        self.assertEqual(df['category'].iloc[0], "Money Laundering")
+
+        changed = self.data_manager.remove_keywords("Money Laundering", ["kejahatan finansial"])
+        df = self.data_manager.load_articles()
+        self.assertEqual(changed, 1)
+        self.assertNotEqual(df['category'].iloc[0], "Money Laundering")
+
+    def test_unknown_category(self):
+        """Keyword changes for unknown categories are rejected"""
+        self.assertEqual(self.data_manager.add_keywords("Unknown", ["abc"]), -1)
+
+    def test_missing_index_is_rebuilt(self):
+        """A store written without the index is indexed on first use"""
+        self.data_manager.keyword_index.clear()
+        changed = self.data_manager.add_keywords("Gambling", ["sabung ayam"])
+        self.assertEqual(changed, 1)
+        self.assertEqual(self.data_manager.keyword_index.article_count(), len(SAMPLE_ARTICLES))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
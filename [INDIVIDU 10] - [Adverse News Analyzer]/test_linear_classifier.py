@@ -0,0 +1,186 @@
+"""
+Test script for the linear classifier backend
+
+Validates the hashed-feature naive Bayes / logistic regression classifier:
+training on a labelled corpus, held-out accuracy, memory-mapped save/load,
+training from articles.csv, and its use as a NewsCategorizor backend.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.categorizer import NewsCategorizor
+from modules.data_manager import DataManager
+from modules.linear_classifier import LinearTextClassifier, extract_features, train_from_csv
+
+
+CATEGORY_VOCABULARY = {
+    "Money Laundering": ["pencucian", "uang", "ppatk", "tppu", "transaksi", "mencurigakan", "rekening"],
+    "Fraud": ["penipuan", "investasi", "bodong", "ponzi", "korban", "penipu", "nasabah"],
+    "Gambling": ["judi", "online", "togel", "bandar", "situs", "taruhan", "slot"],
+    "Corruption": ["korupsi", "kpk", "suap", "pejabat", "gratifikasi", "tersangka", "pengadaan"],
+    "Tax Evasion": ["pajak", "faktur", "fiktif", "dirjen", "wajib", "penggelapan", "spt"],
+}
+COMMON_WORDS = ["polisi", "kasus", "pemerintah", "daerah", "rupiah", "miliar", "jakarta", "menurut"]
+
+# The keyword rules score Tax Evasion ("pajak" x3), the model sees mostly gambling words
+MIXED_ARTICLE = "bandar togel slot taruhan situs pajak pajak pajak"
+
+
+def make_corpus(size, seed):
+    """Synthetic labelled articles: category words mixed with shared filler words"""
+    rng = random.Random(seed)
+    categories = sorted(CATEGORY_VOCABULARY)
+    texts, labels = [], []
+    for _ in range(size):
+        category = rng.choice(categories)
+        words = [rng.choice(CATEGORY_VOCABULARY[category]) for _ in range(rng.randint(3, 8))]
+        words += [rng.choice(COMMON_WORDS) for _ in range(rng.randint(5, 20))]
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+        labels.append(category)
+    return texts, labels
+
+
+class TestLinearClassifier(unittest.TestCase):
+    """Training, prediction and persistence of LinearTextClassifier"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_linear_")
+        self.train_texts, self.train_labels = make_corpus(600, seed=1)
+        self.test_texts, self.test_labels = make_corpus(200, seed=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def accuracy(self, model):
+        predictions = model.predict(self.test_texts)
+        return np.mean([p == label for p, label in zip(predictions, self.test_labels)])
+
+    def test_features_are_normalized_and_stable(self):
+        """Feature vectors are L2-normalized and do not depend on the hash seed"""
+        indices, values = extract_features("KPK tahan tersangka korupsi", n_features=2 ** 12)
+        self.assertAlmostEqual(sum(v * v for v in values), 1.0, places=5)
+        self.assertEqual(indices, sorted(indices))
+        self.assertEqual(extract_features("kpk TAHAN tersangka korupsi", n_features=2 ** 12)[0], indices)
+        self.assertEqual(extract_features("", n_features=2 ** 12), ([], []))
+
+    def test_logistic_regression_accuracy(self):
+        """Logistic regression generalizes to held-out articles"""
+        model = LinearTextClassifier("logreg", n_features=2 ** 14).fit(self.train_texts, self.train_labels)
+        self.assertGreater(self.accuracy(model), 0.9)
+
+    def test_naive_bayes_accuracy(self):
+        """Naive Bayes generalizes to held-out articles"""
+        model = LinearTextClassifier("nb", n_features=2 ** 14).fit(self.train_texts, self.train_labels)
+        self.assertGreater(self.accuracy(model), 0.9)
+
+    def test_predict_one_matches_predict(self):
+        """Single-article and batch prediction agree"""
+        model = LinearTextClassifier("logreg", n_features=2 ** 14).fit(self.train_texts, self.train_labels)
+        self.assertEqual(model.predict(self.test_texts[:50]), [model.predict_one(t) for t in self.test_texts[:50]])
+        self.assertEqual(model.predict([]), [])
+
+    def test_save_and_memory_mapped_load(self):
+        """Loaded weights are memory-mapped and predict exactly like the original"""
+        model = LinearTextClassifier("nb", n_features=2 ** 14).fit(self.train_texts, self.train_labels)
+        model_dir = os.path.join(self.test_output_dir, "classifier")
+        model.save(model_dir)
+
+        loaded = LinearTextClassifier.load(model_dir)
+        self.assertIsInstance(loaded.weights, np.memmap)
+        self.assertEqual(loaded.version, model.version)
+        self.assertEqual(loaded.predict(self.test_texts), model.predict(self.test_texts))
+
+    def test_single_article_inference_is_fast(self):
+        """Per-article inference on a loaded model stays well below a millisecond"""
+        model = LinearTextClassifier("logreg").fit(self.train_texts, self.train_labels)
+        model_dir = os.path.join(self.test_output_dir, "classifier")
+        model.save(model_dir)
+        loaded = LinearTextClassifier.load(model_dir)
+
+        texts = self.test_texts * 5
+        for text in texts:
+            loaded.predict_one(text)  # warm the per-word feature cache
+        start = time.perf_counter()
+        for text in texts:
+            loaded.predict_one(text)
+        per_article = (time.perf_counter() - start) / len(texts)
+        print(f"\n   {per_article * 1e6:.0f} µs per article")
+        self.assertLess(per_article, 0.001)
+
+    def test_invalid_method(self):
+        """Unknown training methods are rejected"""
+        with self.assertRaises(ValueError):
+            LinearTextClassifier("svm")
+
+
+class TestLinearBackend(unittest.TestCase):
+    """NewsCategorizor with the trained linear backend"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_linear_")
+        self.data_manager = DataManager(self.test_output_dir)
+        texts, labels = make_corpus(200, seed=3)
+        for index, (text, label) in enumerate(zip(texts, labels)):
+            self.data_manager.save_article({
+                "title": "",
+                "url": f"https://example.com/linear-{index}",
+                "source_name": "example.com",
+                "publication_date": "2025-08-01 10:00:00",
+                "category": label,
+                "full_text": text,
+            })
+        self.model_dir = os.path.join(self.test_output_dir, "classifier")
+        self.report = train_from_csv(self.data_manager.csv_file, self.model_dir, method="nb", n_features=2 ** 14)
+
+    def tearDown(self):
+        self.data_manager.keyword_index.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_train_from_csv(self):
+        """Training from articles.csv writes a model and reports accuracy"""
+        self.assertEqual(self.report['articles'], 200)
+        self.assertEqual(self.report['classes'], sorted(CATEGORY_VOCABULARY))
+        self.assertGreater(self.report['validation_accuracy'], 0.9)
+        self.assertTrue(os.path.exists(os.path.join(self.model_dir, "weights.npy")))
+
+    def test_categorizer_uses_linear_backend(self):
+        """The linear backend replaces the keyword rules, for single and batch calls"""
+        categorizer = NewsCategorizor(backend="linear", model_path=self.model_dir)
+        text = MIXED_ARTICLE
+        self.assertEqual(categorizer.categorize_article(text), "Gambling")
+        articles = [{"title": "", "full_text": text}, {"title": "Kosong", "full_text": ""}]
+        self.assertEqual(categorizer.categorize_batch(articles), ["Gambling", "Other/Uncategorized"])
+        self.assertTrue(categorizer.model_version.startswith("linear:"))
+
+    def test_cache_is_keyed_by_backend(self):
+        """Results cached by the keyword backend are not reused by the linear one"""
+        cache_path = os.path.join(self.test_output_dir, "cache.db")
+        text = MIXED_ARTICLE
+        self.assertEqual(NewsCategorizor(cache_path=cache_path).categorize_article(text), "Tax Evasion")
+        linear = NewsCategorizor(cache_path=cache_path, backend="linear", model_path=self.model_dir)
+        self.assertEqual(linear.categorize_article(text), "Gambling")
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected"""
+        with self.assertRaises(ValueError):
+            NewsCategorizor(backend="bert")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,100 @@
+"""
+Test script for session profiling
+
+Validates that a profiled DataManager session writes a flamegraph-compatible
+folded stack profile and a tracemalloc report next to the process log.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+import sys
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager
+from modules.profiler import SessionProfiler
+
+
+def _busy_work():
+    """Burn some CPU so the sampler has something to record"""
+    total = 0
+    for i in range(20000):
+        total += i % 7
+    return total
+
+
+class TestSessionProfiler(unittest.TestCase):
+    """Tests for SessionProfiler and the DataManager profiling switch"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_profiler_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_profiler_writes_folded_stacks_and_memory_report(self):
+        """Profiler output is in folded stack format and lists allocation sites"""
+        profiler = SessionProfiler(self.test_output_dir, "20250801_000000")
+        profiler.start()
+        for _ in range(5):
+            _busy_work()
+        paths = profiler.stop()
+
+        self.assertTrue(os.path.exists(paths['cpu_profile']))
+        self.assertTrue(os.path.exists(paths['memory_profile']))
+
+        with open(paths['cpu_profile'], encoding='utf-8') as f:
+            lines = [line.rstrip('\n') for line in f if line.strip()]
+        self.assertTrue(lines, "expected at least one sampled stack")
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertTrue(count.isdigit())
+            self.assertTrue(stack)
+        self.assertTrue(any('_busy_work' in line for line in lines))
+
+        with open(paths['memory_profile'], encoding='utf-8') as f:
+            report = f.read()
+        self.assertIn("Peak traced memory", report)
+        self.assertIn("allocation sites", report)
+
+    def test_stop_without_start_is_noop(self):
+        """Stopping an idle profiler writes nothing"""
+        profiler = SessionProfiler(self.test_output_dir, "20250801_000001")
+        self.assertEqual(profiler.stop(), {})
+        self.assertFalse(os.path.exists(profiler.cpu_profile_file))
+
+    def test_data_manager_profiling_switch(self):
+        """Profile files are written next to process_log_<session>.txt"""
+        data_manager = DataManager(self.test_output_dir, profile=True)
+        data_manager.save_article({
+            'title': 'KPK Tahan Pejabat Terkait Kasus Korupsi',
+            'url': 'https://example.com/profiling-1',
+            'source_name': 'example.com',
+            'publication_date': '2025-08-01 10:00:00',
+            'full_text': 'Komisi Pemberantasan Korupsi menahan pejabat karena dugaan suap.'
+        })
+        paths = data_manager.stop_profiling()
+
+        session = data_manager.session_datetime
+        self.assertEqual(paths['cpu_profile'],
+                         os.path.join(self.test_output_dir, f"profile_{session}.folded"))
+        self.assertTrue(os.path.exists(paths['cpu_profile']))
+        self.assertTrue(os.path.exists(paths['memory_profile']))
+        self.assertTrue(os.path.exists(data_manager.session_log_file))
+
+    def test_profiling_disabled_by_default(self):
+        """No profiler is created unless requested"""
+        data_manager = DataManager(self.test_output_dir)
+        self.assertIsNone(data_manager.profiler)
+        self.assertEqual(data_manager.stop_profiling(), {})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,173 @@
+"""
+Test script for entity risk scoring
+
+Validates category severity, recency decay and source weighting of the
+incremental risk scores, and the leaderboard maintained by DataManager at
+ingest.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import math
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager
+from modules.risk_scoring import RiskScoreStore
+
+NOW = datetime(2025, 8, 1)
+
+
+def article(category, published="2025-08-01 00:00:00", source="news-a.com"):
+    return {"category": category, "publication_date": published, "source_name": source}
+
+
+class TestRiskScoreStore(unittest.TestCase):
+    """Severity, decay and source weighting"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_risk_")
+        self.store = RiskScoreStore(os.path.join(self.test_output_dir, "risk_scores.db"), half_life_days=30)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_category_severity(self):
+        """Severity follows the category; uncategorized articles add nothing"""
+        self.store.add_article("a1", article("Money Laundering"), [("Budi Santoso", "person")])
+        self.store.add_article("a2", article("Gambling"), [("Rina Wijaya", "person")])
+        self.store.add_article("a3", article("Other/Uncategorized"), [("Eko Pratama", "person")])
+
+        self.assertAlmostEqual(self.store.score("Budi Santoso", now=NOW), 1.0)
+        self.assertAlmostEqual(self.store.score("Rina Wijaya", now=NOW), 0.6)
+        self.assertEqual(self.store.score("Eko Pratama", now=NOW), 0.0)
+
+    def test_recency_decay(self):
+        """A contribution halves every half-life; ranking is stable over time"""
+        self.store.add_article("a1", article("Fraud", "2025-07-02 00:00:00"), [("Budi Santoso", "person")])
+        self.store.add_article("a2", article("Fraud", "2025-08-01 00:00:00"), [("Rina Wijaya", "person")])
+
+        self.assertAlmostEqual(self.store.score("Budi Santoso", now=NOW), 0.4)
+        self.assertAlmostEqual(self.store.score("Rina Wijaya", now=NOW), 0.8)
+        later = datetime(2025, 8, 31)
+        self.assertAlmostEqual(self.store.score("Rina Wijaya", now=later), 0.4)
+        self.assertEqual([row['entity'] for row in self.store.leaderboard(now=later)],
+                         ["Rina Wijaya", "Budi Santoso"])
+
+    def test_source_count(self):
+        """Coverage from several sources is weighted by 1 + ln(sources)"""
+        self.store.add_article("a1", article("Corruption", source="news-a.com"), [("Budi Santoso", "person")])
+        self.store.add_article("a2", article("Corruption", source="news-b.com"), [("Budi Santoso", "person")])
+        self.store.add_article("a3", article("Corruption", source="news-a.com"), [("Rina Wijaya", "person")])
+        self.store.add_article("a4", article("Corruption", source="news-a.com"), [("Rina Wijaya", "person")])
+
+        top = self.store.leaderboard(now=NOW)
+        self.assertEqual(top[0]['entity'], "Budi Santoso")
+        self.assertEqual((top[0]['article_count'], top[0]['source_count']), (2, 2))
+        self.assertAlmostEqual(top[0]['score'], 1.8 * (1 + math.log(2)), places=3)
+        self.assertAlmostEqual(top[1]['score'], 1.8, places=3)
+
+    def test_articles_counted_once_and_types_filtered(self):
+        """Re-adding an article changes nothing; agencies are not scored"""
+        entities = [("Budi Santoso", "person"), ("Bank Mandiri", "bank"), ("KPK", "agency")]
+        self.assertEqual(self.store.add_article("a1", article("Fraud"), entities), 2)
+        self.assertEqual(self.store.add_article("a1", article("Fraud"), entities), 0)
+        self.assertAlmostEqual(self.store.score("Budi Santoso", now=NOW), 0.8)
+        self.assertEqual(self.store.score("KPK", now=NOW), 0.0)
+        self.assertEqual([row['entity'] for row in self.store.leaderboard(entity_type="bank", now=NOW)],
+                         ["Bank Mandiri"])
+
+    def test_update_articles_replaces_contribution(self):
+        """A category change subtracts the old contribution and adds the new one"""
+        entities = {"a1": [("Budi Santoso", "person")], "a2": [("Budi Santoso", "person")]}
+        self.store.add_article("a1", article("Gambling", "2025-07-02 00:00:00", "news-a.com"), entities["a1"])
+        self.store.add_article("a2", article("Fraud", source="news-b.com"), entities["a2"])
+
+        updates = [("a1", article("Money Laundering", "2025-07-02 00:00:00", "news-a.com")),
+                   ("a2", article("Fraud", source="news-b.com"))]
+        self.assertEqual(self.store.update_articles(updates, entities.get), 1)
+        self.assertAlmostEqual(self.store.score("Budi Santoso", now=NOW), 1.3 * (1 + math.log(2)))
+
+        updates = [("a2", article("Other/Uncategorized", source="news-b.com"))]
+        self.assertEqual(self.store.update_articles(updates, entities.get), 1)
+        top = self.store.leaderboard(now=NOW)[0]
+        self.assertEqual((top['article_count'], top['source_count']), (1, 1))
+        self.assertEqual(top['last_date'], "2025-07-02 00:00:00")
+        self.assertAlmostEqual(top['score'], 0.5, places=3)
+
+        updates = [("a1", article("Other/Uncategorized", "2025-07-02 00:00:00", "news-a.com"))]
+        self.assertEqual(self.store.update_articles(updates, entities.get), 1)
+        self.assertEqual(self.store.leaderboard(now=NOW), [])
+
+
+class TestRiskScoresAtIngest(unittest.TestCase):
+    """DataManager updates risk scores when articles are saved"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_risk_")
+        self.data_manager = DataManager(self.test_output_dir)
+
+    def tearDown(self):
+        for store in (self.data_manager.risk_scores, self.data_manager.case_clusterer,
+                      self.data_manager.screening_alerts, self.data_manager.entity_index,
+                      self.data_manager.keyword_index):
+            store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_leaderboard_maintained_and_rebuilt(self):
+        """The leaderboard is available after saving and identical after a rebuild"""
+        texts = [
+            ("news-a.com", "Rahmat Hidayat Ditangkap", "KPK menangkap Rahmat Hidayat terkait korupsi dan suap proyek."),
+            ("news-b.com", "Rahmat Hidayat Tersangka", "Rahmat Hidayat ditetapkan tersangka korupsi suap proyek."),
+            ("news-a.com", "Judi Online Dibongkar", "Polisi menangkap Sinta Maharani, operator judi online dan situs taruhan."),
+        ]
+        for index, (source, title, text) in enumerate(texts):
+            self.data_manager.save_article({
+                "title": title,
+                "url": f"https://{source}/risk-{index}",
+                "source_name": source,
+                "publication_date": "2025-08-01 10:00:00",
+                "full_text": text,
+            })
+
+        leaderboard = self.data_manager.get_risk_leaderboard()
+        self.assertEqual(leaderboard['entity'].tolist(), ["Rahmat Hidayat", "Sinta Maharani"])
+        self.assertEqual(leaderboard['source_count'].tolist(), [2, 1])
+
+        self.assertEqual(self.data_manager.rebuild_risk_scores(), 3)
+        self.assertEqual(self.data_manager.get_risk_leaderboard()['score'].tolist(), leaderboard['score'].tolist())
+
+    def test_scores_follow_recategorization(self):
+        """Scores are updated when recategorization changes an article's category"""
+        self.data_manager.save_article({
+            "title": "Sinta Maharani Diperiksa",
+            "url": "https://news-a.com/sinta",
+            "source_name": "news-a.com",
+            "publication_date": "2025-08-01 10:00:00",
+            "full_text": "Polisi memeriksa Sinta Maharani terkait situs taruhan online.",
+        })
+        before = self.data_manager.risk_scores.score("Sinta Maharani")
+        self.assertGreater(before, 0)
+
+        self.assertEqual(self.data_manager.add_keywords("Money Laundering", ["situs taruhan"]), 1)
+        self.assertEqual(self.data_manager.load_articles()['category'].tolist(), ["Money Laundering"])
+        after = self.data_manager.risk_scores.score("Sinta Maharani")
+        self.assertAlmostEqual(after / before, 1.0 / 0.6, places=3)
+
+        self.data_manager.categorizer.remove_keywords("Money Laundering", ["situs taruhan"])
+        self.assertEqual(self.data_manager.recategorize_articles(), 1)
+        self.assertAlmostEqual(self.data_manager.risk_scores.score("Sinta Maharani"), before, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,150 @@
+"""
+Test script for the full-text search index
+
+Validates the query syntax (phrases, required words, prefixes), BM25
+ranking with snippets, the source filter, indexing at ingest and rebuilds,
+the rebuild of an incomplete index, and search latency on a larger
+corpus.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager
+from modules.search_index import SearchIndex, fts_query
+
+
+def article(title, text, source="news-a.com", url=None):
+    return {
+        "title": title,
+        "url": url or f"https://{source}/{title.lower().replace(' ', '-')}",
+        "source_name": source,
+        "publication_date": "2025-08-01 10:00:00",
+        "full_text": text,
+    }
+
+
+ARTICLES = [
+    article("Kredit Fiktif di Bank BRI", "Kejaksaan mengusut kredit fiktif senilai Rp 20 miliar di Bank BRI cabang Medan."),
+    article("Dana Fiktif Koperasi", "Koperasi mencairkan kredit macet dan dana fiktif, bukan dari BRI.", source="news-b.com"),
+    article("Korupsi Proyek Jalan", "KPK menetapkan tersangka korupsi proyek jalan dan suap pejabat daerah."),
+    article("Pencucian Uang Judi Online", "PPATK menelusuri pencucian uang dari situs judi online melalui rekening BRI."),
+]
+
+
+class TestQuerySyntax(unittest.TestCase):
+    """User queries become safe FTS5 expressions"""
+
+    def test_phrases_words_and_prefixes(self):
+        self.assertEqual(fts_query('"Kredit Fiktif" BRI'), '"kredit fiktif" "bri"')
+        self.assertEqual(fts_query("korup*"), '"korup"*')
+        self.assertEqual(fts_query('Rp 20-miliar (OR'), '"rp" "20" "miliar" "or"')
+        self.assertEqual(fts_query(' "" * '), '')
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Ranked search with snippets"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_search_")
+        self.index = SearchIndex(os.path.join(self.test_output_dir, "search.db"))
+        self.index.add_articles((a["url"], a) for a in ARTICLES)
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_phrase_and_required_words(self):
+        """A phrase must occur as such; every word is required"""
+        results = self.index.search('"kredit fiktif" BRI')
+        self.assertEqual([r["url"] for r in results], [ARTICLES[0]["url"]])
+        self.assertIn("**kredit fiktif**", results[0]["snippet"].lower())
+        self.assertEqual(len(self.index.search("fiktif BRI")), 2)
+        self.assertEqual(self.index.search("fiktif KPK"), [])
+
+    def test_title_matches_rank_first(self):
+        """Matches in the title outrank matches in the body"""
+        results = self.index.search("BRI")
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["url"], ARTICLES[0]["url"])
+        self.assertGreater(results[0]["score"], results[1]["score"])
+
+    def test_prefix_and_source_filter(self):
+        """Prefix words and the source filter"""
+        self.assertEqual([r["title"] for r in self.index.search("korup*")], ["Korupsi Proyek Jalan"])
+        self.assertEqual([r["source_name"] for r in self.index.search("fiktif", source="news-b.com")],
+                         ["news-b.com"])
+
+    def test_articles_indexed_once(self):
+        """Re-adding an article does not duplicate it"""
+        self.assertEqual(self.index.add_articles((a["url"], a) for a in ARTICLES), 0)
+        self.assertEqual(self.index.count(), len(ARTICLES))
+        self.index.clear()
+        self.assertEqual(self.index.search("BRI"), [])
+
+    def test_latency_on_larger_corpus(self):
+        """Searches stay in the millisecond range as the corpus grows"""
+        words = ["korupsi", "suap", "kredit", "bank", "judi", "pajak", "dana", "proyek", "pejabat", "rekening"]
+        self.index.add_articles(
+            (f"https://bulk.com/{i}", article(f"Berita {i}", " ".join(words[(i * k) % 10] for k in range(1, 60)),
+                                              url=f"https://bulk.com/{i}"))
+            for i in range(20000)
+        )
+        started = time.perf_counter()
+        for _ in range(20):
+            self.assertEqual(len(self.index.search('"kredit fiktif" BRI')), 1)
+            self.assertEqual(len(self.index.search("korupsi suap", limit=20)), 20)
+        self.assertLess((time.perf_counter() - started) / 40, 0.05)
+
+
+class TestSearchAtIngest(unittest.TestCase):
+    """DataManager indexes saved articles and searches them"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_search_")
+        self.data_manager = DataManager(self.test_output_dir)
+
+    def tearDown(self):
+        for store in (self.data_manager.search_index, self.data_manager.risk_scores,
+                      self.data_manager.case_clusterer, self.data_manager.screening_alerts,
+                      self.data_manager.entity_index, self.data_manager.keyword_index):
+            store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_search_after_save_and_rebuild(self):
+        """Saved articles are searchable; a rebuild gives the same results"""
+        self.data_manager.save_articles_batch([dict(a) for a in ARTICLES])
+        results = self.data_manager.search_articles('"kredit fiktif" BRI')
+        self.assertEqual(results['url'].tolist(), [ARTICLES[0]["url"]])
+        self.assertEqual(list(results.columns), ['url', 'title', 'source_name', 'publication_date', 'score', 'snippet'])
+
+        self.assertEqual(self.data_manager.rebuild_search_index(), len(ARTICLES))
+        self.assertEqual(len(self.data_manager.search_articles("BRI")), 3)
+        self.assertEqual(len(self.data_manager.search_articles("")), 0)
+
+    def test_index_rebuilt_for_existing_corpus(self):
+        """Articles stored before the index existed are indexed on the first search"""
+        self.data_manager.save_articles_batch([dict(a) for a in ARTICLES])
+        self.data_manager.search_index.clear()
+        self.assertEqual(len(self.data_manager.search_articles("BRI")), 3)
+        self.assertEqual(self.data_manager.search_index.count(), len(ARTICLES))
+
+        with mock.patch.object(self.data_manager, 'rebuild_search_index') as rebuild:
+            self.assertEqual(len(self.data_manager.search_articles("fiktif")), 2)
+        rebuild.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,148 @@
+"""
+Test script for session file compaction and log retention
+
+Validates that inactive session CSVs are compacted into deduplicated,
+gzip-compressed month segments described by the manifest, that running
+sessions are left alone, that compaction can be repeated, and that logs
+are archived and expired after the retention period.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import gzip
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.session_archive import SessionArchive
+from cli import main
+
+SCHEMA = ["title", "url", "source_name", "publication_date", "category", "full_text"]
+
+NOW = datetime(2025, 9, 15, 12, 0, 0).timestamp()
+HOUR = 3600
+
+
+def make_articles(count, start=0, month="07"):
+    return pd.DataFrame([
+        {
+            "title": f"Artikel {i}",
+            "url": f"https://news-{i % 3}.com/artikel-{i}",
+            "source_name": f"news-{i % 3}.com",
+            "publication_date": f"2025-{month}-{1 + i % 28:02d} 10:00:00",
+            "category": ["Fraud", "Corruption"][i % 2],
+            "full_text": f"Isi artikel {i}",
+        }
+        for i in range(start, start + count)
+    ], columns=SCHEMA)
+
+
+class TestSessionArchive(unittest.TestCase):
+    """SessionArchive.compact() and expire_logs()"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_archive_")
+        self.archive = SessionArchive(self.test_output_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def write(self, name, content, age_hours=48):
+        path = os.path.join(self.test_output_dir, name)
+        if isinstance(content, pd.DataFrame):
+            content.to_csv(path, index=False, encoding='utf-8')
+        else:
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(content)
+        os.utime(path, (NOW - age_hours * HOUR, NOW - age_hours * HOUR))
+        return path
+
+    def test_compact_into_month_segments(self):
+        """Sessions of a month become one deduplicated, compressed segment"""
+        self.write("articles_20250701_090000.csv", make_articles(5))
+        self.write("articles_20250715_090000.csv", make_articles(5, start=3))
+        self.write("articles_20250802_090000.csv", make_articles(4, start=20, month="08"))
+        self.write("articles_20250915_113000.csv", make_articles(2, start=40, month="09"), age_hours=0.5)
+        self.write("articles.csv", make_articles(3))
+
+        result = self.archive.compact(now=NOW)
+        self.assertEqual(result, {'sessions': 3, 'rows': 12, 'duplicates': 2, 'months': ['2025-07', '2025-08'],
+                                  'logs': 0})
+        remaining = sorted(os.listdir(self.test_output_dir))
+        self.assertEqual(remaining, ["archive", "articles.csv", "articles_20250915_113000.csv"])
+
+        with gzip.open(self.archive.segment_file("2025-07"), 'rt', encoding='utf-8') as file:
+            self.assertTrue(file.readline().startswith("title,url"))
+        july = self.archive.load(months=["2025-07"])
+        self.assertEqual(len(july), 8)
+        self.assertFalse(july['url'].duplicated().any())
+        self.assertEqual(july.loc[july['url'] == "https://news-0.com/artikel-3", 'session'].tolist(),
+                         ["20250701_090000"])
+
+        segments = self.archive.manifest()['segments']
+        self.assertEqual(sorted(segments), ['2025-07', '2025-08'])
+        self.assertEqual(segments['2025-07']['rows'], 8)
+        self.assertEqual(segments['2025-07']['sessions'], ["20250701_090000", "20250715_090000"])
+        self.assertEqual(segments['2025-08']['min_date'], "2025-08-21 10:00:00")
+        self.assertEqual(len(self.archive.load(columns=['url'])), 12)
+
+    def test_compaction_is_repeatable(self):
+        """Later sessions are merged into the existing segment; a rerun changes nothing"""
+        self.write("articles_20250701_090000.csv", make_articles(5))
+        self.archive.compact(now=NOW)
+        self.write("articles_20250720_090000.csv", make_articles(5, start=4))
+        result = self.archive.compact(now=NOW)
+        self.assertEqual((result['rows'], result['duplicates']), (4, 1))
+        self.assertEqual(self.archive.compact(now=NOW)['sessions'], 0)
+        self.assertEqual(self.archive.manifest()['segments']['2025-07']['rows'], 9)
+
+    def test_articles_without_url_kept(self):
+        """Rows without a URL are never dropped as duplicates"""
+        articles = make_articles(3)
+        articles.loc[[0, 1], 'url'] = ""
+        self.write("articles_20250701_090000.csv", articles)
+        result = self.archive.compact(now=NOW)
+        self.assertEqual((result['rows'], result['duplicates']), (3, 0))
+        self.assertEqual(sorted(self.archive.load()['title']), ["Artikel 0", "Artikel 1", "Artikel 2"])
+
+    def test_logs_archived_and_expired(self):
+        """Logs are compressed by month and deleted after the retention period"""
+        self.write("process_log_20250701_090000.txt", "[2025-07-01 09:00:00] old session\n")
+        self.write("process_log_20250701_090000.txt.1", "[2025-07-01 09:00:00] rotated\n")
+        self.write("process_log_20250910_090000.jsonl", '{"message": "recent"}\n')
+        self.write("profile_20250910_090000.folded", "main;scrape 10\n")
+        self.write("process_log_20250915_113000.txt", "[2025-09-15 11:30:00] running\n", age_hours=0.2)
+
+        self.assertEqual(self.archive.compact(now=NOW)['logs'], 4)
+        logs = self.archive.manifest()['logs']
+        self.assertEqual(logs['2025-09'], ["process_log_20250910_090000.jsonl.gz", "profile_20250910_090000.folded.gz"])
+        with gzip.open(os.path.join(self.archive.logs_dir, "2025-09", "process_log_20250910_090000.jsonl.gz"),
+                       'rt', encoding='utf-8') as file:
+            self.assertIn("recent", file.read())
+
+        self.write("process_log_20250702_090000.txt", "[2025-07-02 09:00:00] not archived yet\n", age_hours=0.1)
+        self.assertEqual(self.archive.expire_logs(retention_days=30, now=NOW), 3)
+        self.assertEqual(sorted(self.archive.manifest()['logs']), ['2025-09'])
+        self.assertFalse(os.path.exists(os.path.join(self.archive.logs_dir, "2025-07")))
+        self.assertTrue(os.path.exists(os.path.join(self.test_output_dir, "process_log_20250915_113000.txt")))
+
+    def test_compact_command(self):
+        """`cli.py compact` archives inactive sessions"""
+        self.write("articles_20250701_090000.csv", make_articles(3), age_hours=(time.time() - NOW) / HOUR + 48)
+        self.assertEqual(main(["compact", "--output-dir", self.test_output_dir]), 0)
+        self.assertEqual(self.archive.manifest()['segments']['2025-07']['rows'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,133 @@
+"""
+Test script for the streaming session log
+
+Validates that log lines reach the session log file while the session is
+still running, that logging does not wait on slow disk writes, size-based
+rotation, JSON lines, and the bounded in-memory tail kept by DataManager.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager, LOG_TAIL
+from modules.session_log import SessionLog
+
+
+class TestSessionLog(unittest.TestCase):
+    """SessionLog appends, rotates and formats lines in the background"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_log_")
+        self.path = os.path.join(self.test_output_dir, "process_log_test.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def read_lines(self, path=None):
+        with open(path or self.path, encoding='utf-8') as file:
+            return file.read().splitlines()
+
+    def test_lines_appended_as_logged(self):
+        """Lines are in the file after a flush, without closing the log"""
+        log = SessionLog(self.path)
+        log.write("first")
+        log.flush()
+        self.assertRegex(self.read_lines()[0], r"^\[\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\] first$")
+        log.write("second")
+        log.close()
+        self.assertEqual(len(self.read_lines()), 2)
+        log.write("after close")
+        log.flush()
+        self.assertEqual(len(self.read_lines()), 2)
+
+    def test_writes_do_not_wait_for_disk(self):
+        """A slow file does not slow down the logging thread"""
+        log = SessionLog(self.path)
+        emit = log._handler.emit
+
+        def slow_emit(record):
+            time.sleep(0.01)
+            emit(record)
+
+        with mock.patch.object(log._handler, "emit", side_effect=slow_emit):
+            started = time.perf_counter()
+            for i in range(50):
+                log.write(f"line {i}")
+            self.assertLess(time.perf_counter() - started, 0.25)
+            log.close()
+        self.assertEqual(len(self.read_lines()), 50)
+        self.assertEqual(log.dropped, 0)
+
+    def test_size_based_rotation(self):
+        """Full files are rotated to .1, .2, ... and old ones dropped"""
+        log = SessionLog(self.path, max_bytes=1000, backup_count=2)
+        for i in range(100):
+            log.write(f"line {i:03d} " + "x" * 40)
+        log.close()
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertTrue(os.path.exists(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        for path in (self.path, self.path + ".1"):
+            self.assertLessEqual(os.path.getsize(path), 1000)
+        self.assertTrue(self.read_lines()[-1].endswith("line 099 " + "x" * 40))
+
+    def test_json_lines(self):
+        """JSON lines carry time, session, message and extra fields"""
+        log = SessionLog(self.path, session="20250801_120000", json_lines=True)
+        log.write("Batch saved", saved=3)
+        log.close()
+        entry = json.loads(self.read_lines()[0])
+        self.assertEqual(entry["session"], "20250801_120000")
+        self.assertEqual(entry["message"], "Batch saved")
+        self.assertEqual(entry["saved"], 3)
+        self.assertIn("T", entry["time"])
+
+
+class TestDataManagerSessionLog(unittest.TestCase):
+    """DataManager streams its log and keeps only a bounded tail in memory"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_log_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_streamed_log_and_bounded_tail(self):
+        data_manager = DataManager(self.test_output_dir)
+        for i in range(LOG_TAIL * 2):
+            data_manager._log(f"step {i}")
+        self.assertEqual(len(data_manager.log_messages), LOG_TAIL)
+        self.assertTrue(data_manager.save_session_log())
+        with open(data_manager.session_log_file, encoding='utf-8') as file:
+            content = file.read()
+        self.assertIn("Session Started", content)
+        self.assertIn(f"step {LOG_TAIL * 2 - 1}", content)
+        data_manager.close_session_log()
+
+    def test_json_format_and_disabled_log(self):
+        data_manager = DataManager(self.test_output_dir, log_format="json")
+        self.assertTrue(data_manager.session_log_file.endswith(".jsonl"))
+        data_manager.close_session_log()
+        with open(data_manager.session_log_file, encoding='utf-8') as file:
+            self.assertIn("message", json.loads(file.readline()))
+
+        quiet = DataManager(os.path.join(self.test_output_dir, "quiet"), session_log=False)
+        self.assertFalse(quiet.save_session_log())
+        self.assertFalse(os.path.exists(quiet.session_log_file))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
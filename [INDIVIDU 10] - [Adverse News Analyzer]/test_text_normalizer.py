@@ -0,0 +1,188 @@
+"""
+Test script for Indonesian text normalization
+
+Validates affix stripping, the memoized stem cache, whole-word keyword
+matching (exact keywords, compounds), the scraper's article filter and
+the categorizer "stems" matching mode.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.categorizer import NewsCategorizor
+from modules.keyword_index import KeywordIndex
+from modules.scraper import NewsScraper
+from modules.text_normalizer import StemmedKeywords, stem, stem_cache_info, stem_tokens, tokenize
+
+
+class TestStemmer(unittest.TestCase):
+    """Affix stripping"""
+
+    def test_affixed_forms_share_a_stem(self):
+        """Inflected forms of one root reduce to the same stem"""
+        groups = {
+            "tipu": ["tipu", "menipu", "penipu", "penipuan", "ditipu"],
+            "suap": ["suap", "menyuap", "penyuapan", "disuap"],
+            "korupsi": ["korupsi", "dikorupsi", "mengorupsi"],
+            "cuci": ["mencuci", "pencucian", "dicuci"],
+            "tangkap": ["ditangkap", "penangkapan", "tertangkap"],
+            "bobol": ["bobol", "pembobol", "pembobolan", "dibobol"],
+            "gelap": ["penggelapan", "menggelapkan"],
+            "judi": ["judi", "berjudi", "perjudian"],
+            "pajak": ["pajak", "perpajakan", "pajaknya"],
+        }
+        for root, words in groups.items():
+            for word in words:
+                self.assertEqual(stem(word), root, word)
+
+    def test_words_that_only_look_affixed(self):
+        """Loanwords, short words and seed roots are kept"""
+        for word in ["investasi", "gratifikasi", "transaksi", "bukan", "berita", "sekolah", "bank", "uang", "kpk"]:
+            self.assertEqual(stem(word), word)
+        self.assertEqual(stem("pelaku"), "laku")
+        self.assertEqual(stem("rp100"), "rp100")
+
+    def test_tokenize_on_word_boundaries(self):
+        """Tokens are lower-cased runs of word characters"""
+        self.assertEqual(tokenize("KPK: Tersangka (TPPU) ditahan!"), ["kpk", "tersangka", "tppu", "ditahan"])
+        self.assertEqual(stem_tokens("Pelaku menipu nasabah"), ["laku", "tipu", "nasabah"])
+
+    def test_stem_cache_hits_on_repeated_vocabulary(self):
+        """Normalizing repetitive news text is served from the stem cache"""
+        text = "Penyidik menetapkan tersangka penipuan investasi dan pencucian uang " * 50
+        stem_tokens(text)
+        before = stem_cache_info()
+        stem_tokens(text)
+        after = stem_cache_info()
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(after.hits - before.hits, len(tokenize(text)))
+
+
+class TestStemmedKeywords(unittest.TestCase):
+    """Whole-word keyword matching"""
+
+    def test_variants_collapse_and_match(self):
+        """One root keyword covers its affixed forms; phrases match by stems"""
+        keywords = StemmedKeywords(["tipu", "menipu", "penipuan", "pencucian uang"])
+        self.assertEqual(len(keywords), 2)
+        self.assertTrue(keywords.contains("Pelaku diduga menipu nasabah"))
+        self.assertTrue(keywords.contains("Ia mencuci uang hasil korupsi"))
+        self.assertFalse(keywords.contains("Cuci tangan sebelum makan, uang kembali"))
+
+    def test_no_match_inside_unrelated_words(self):
+        """Keywords never match inside other words"""
+        keywords = StemmedKeywords(["bank"])
+        self.assertTrue(keywords.contains("Kredit macet di perbankan daerah"))
+        self.assertFalse(keywords.contains("Perusahaan itu bankrut"))
+
+    def test_exact_keywords(self):
+        """Keywords with an ambiguous stem match only as written"""
+        keywords = StemmedKeywords(["ditahan", "penipuan"], exact=["ditahan"])
+        self.assertEqual(len(keywords), 2)
+        self.assertTrue(keywords.contains("Pelaku ditahan polisi"))
+        self.assertFalse(keywords.contains("Menteri Pertahanan meninjau alutsista"))
+        self.assertTrue(keywords.contains("Korban ditipu lewat telepon"))
+
+    def test_compound_words(self):
+        """Single-word keywords match behind a compounding prefix"""
+        keywords = StemmedKeywords(["korupsi", "pencucian uang"])
+        self.assertTrue(keywords.contains("Gerakan antikorupsi digelar di kampus"))
+        self.assertFalse(keywords.contains("Laporan keuangan dicuci bersih"))
+
+
+class TestScraperFilter(unittest.TestCase):
+    """NewsScraper._contains_keywords() on the configured crime keywords"""
+
+    def setUp(self):
+        with mock.patch("modules.scraper.DataManager"):
+            self.scraper = NewsScraper()
+
+    def test_accepted_articles(self):
+        for text in ("Dua pejabat ditahan KPK", "Polisi menetapkan tersangka baru",
+                     "Pelaku menipu nasabah bank", "Gerakan antikorupsi di daerah"):
+            self.assertTrue(self.scraper._contains_keywords(text), text)
+
+    def test_ambiguous_roots_rejected(self):
+        """Words sharing the root of "ditahan" or "tersangka" are not crime news"""
+        for text in ("Menteri Pertahanan meninjau alutsista", "Program ketahanan pangan",
+                     "Rupiah bertahan di level 16.000", "Hasilnya tidak disangka"):
+            self.assertFalse(self.scraper._contains_keywords(text), text)
+
+
+class TestStemMatchingCategorizer(unittest.TestCase):
+    """NewsCategorizor(matching="stems")"""
+
+    def setUp(self):
+        self.categorizer = NewsCategorizor(matching="stems")
+
+    def test_compact_keyword_list(self):
+        """A single root keyword categorizes every affixed form"""
+        self.categorizer.category_keywords = {"Fraud": ["tipu"], "Gambling": ["judi"]}
+        for text in ["Warga ditipu arisan", "Polisi menangkap penipu", "Kasus penipuan investasi"]:
+            self.assertEqual(self.categorizer.categorize_article(text), "Fraud")
+        self.assertEqual(self.categorizer.categorize_article("Bandar perjudian ditangkap"), "Gambling")
+
+    def test_whole_word_scores(self):
+        """Scores count whole-word stem matches with the title bonus"""
+        self.categorizer.category_keywords = {"Money Laundering": ["bank"], "Fraud": ["penipuan"]}
+        scores = self.categorizer.get_category_scores("Perusahaan bankrut, perbankan menipu.", "Penipuan")
+        # "penipuan" twice in the doubled title + "menipu" in the body + title bonus; "bank" once
+        self.assertEqual(scores, {"Money Laundering": 1, "Fraud": 5})
+
+    def test_batch_matches_single(self):
+        """Batch categorization gives the same result as one by one"""
+        articles = [
+            {"title": "Bupati Disuap", "full_text": "KPK menetapkan bupati tersangka penyuapan proyek."},
+            {"title": "Judi Online", "full_text": "Polisi membongkar perjudian daring dan situs taruhan."},
+            {"title": "Pajak", "full_text": "Wajib pajak diduga menggelapkan pajak perusahaan."},
+            {"title": "Cuaca", "full_text": "Hujan deras sepanjang hari."},
+        ]
+        expected = [self.categorizer.categorize_article(a["full_text"], a["title"]) for a in articles]
+        self.categorizer.clear_cache()
+        self.assertEqual(self.categorizer.categorize_batch(articles), expected)
+        self.assertEqual(expected, ["Corruption", "Gambling", "Tax Evasion", "Other/Uncategorized"])
+
+    def test_matching_mode_changes_cache_key(self):
+        """Results of the two matching modes are memoized separately"""
+        substring = NewsCategorizor()
+        self.assertNotEqual(substring.keyword_version, self.categorizer.keyword_version)
+        with self.assertRaises(ValueError):
+            NewsCategorizor(matching="fuzzy")
+
+
+class TestStemmedCandidates(unittest.TestCase):
+    """Keyword index lookup by stem"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_stems_")
+        self.index = KeywordIndex(os.path.join(self.test_output_dir, "keyword_index.db"))
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def test_candidates_by_stem(self):
+        """Articles with any affixed form of a keyword are candidates"""
+        self.index.add_articles([
+            ("a", "Polisi menangkap penipu arisan"),
+            ("b", "Kasus penipuan investasi bodong"),
+            ("c", "Perusahaan itu bankrut"),
+        ])
+        self.assertEqual(self.index.candidate_articles(["tipu"], stemmed=True), {"a", "b"})
+        self.assertEqual(self.index.candidate_articles(["bank"], stemmed=True), set())
+        self.assertEqual(self.index.candidate_articles(["bank"]), {"c"})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
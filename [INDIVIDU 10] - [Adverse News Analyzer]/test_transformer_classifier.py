@@ -0,0 +1,146 @@
+"""
+Test script for the transformer classifier backend
+
+Validates the dynamic batching and window aggregation helpers, that the
+transformer backend is lazy: selecting it neither imports torch nor loads a
+model, and that its version follows the model files and options. The
+end-to-end test runs only when torch and transformers are installed and
+AML_TRANSFORMER_TEST_MODEL names a fine-tuned model.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.categorizer import NewsCategorizor
+from modules.transformer_classifier import TransformerTextClassifier, average_by_article, plan_batches
+
+HAS_TRANSFORMERS = all(importlib.util.find_spec(name) for name in ("torch", "transformers"))
+TEST_MODEL = os.environ.get("AML_TRANSFORMER_TEST_MODEL")
+
+
+class TestDynamicBatching(unittest.TestCase):
+    """Length-sorted batching under a padded-token budget"""
+
+    def test_batches_respect_token_budget(self):
+        """No batch exceeds the padded-token budget and every sequence is used once"""
+        lengths = [512, 12, 300, 40, 512, 7, 128, 64, 256, 512, 33]
+        batches = plan_batches(lengths, max_batch_tokens=1024)
+        self.assertEqual(sorted(i for batch in batches for i in batch), list(range(len(lengths))))
+        for batch in batches:
+            self.assertLessEqual(len(batch) * max(lengths[i] for i in batch), 1024)
+
+    def test_short_sequences_share_batches(self):
+        """Similar short sequences are packed together, long ones alone"""
+        batches = plan_batches([10] * 20 + [500, 500], max_batch_tokens=600, max_batch_size=64)
+        self.assertEqual([len(batch) for batch in batches], [20, 1, 1])
+
+    def test_batch_size_limit_and_empty_input(self):
+        """max_batch_size caps batches and no input gives no batches"""
+        self.assertEqual([len(b) for b in plan_batches([1] * 10, max_batch_size=4)], [4, 4, 2])
+        self.assertEqual(plan_batches([]), [])
+
+    def test_window_probabilities_are_averaged(self):
+        """Chunked articles get the mean probability of their windows"""
+        probabilities = np.array([[0.9, 0.1], [0.3, 0.7], [0.2, 0.8]])
+        averaged = average_by_article(probabilities, [0, 0, 1], 2)
+        np.testing.assert_allclose(averaged, [[0.6, 0.4], [0.2, 0.8]])
+
+
+class TestTransformerBackend(unittest.TestCase):
+    """Lazy loading of the transformer backend"""
+
+    def test_backend_is_lazy(self):
+        """Selecting the backend and computing cache keys does not load the model"""
+        categorizer = NewsCategorizor(
+            backend="transformer",
+            model_path="models/aml-indobert",
+            backend_options={"num_threads": 2, "quantize": True}
+        )
+        self.assertRegex(categorizer.model_version, r"^transformer:aml-indobert-int8-[0-9a-f]{12}$")
+        self.assertFalse(categorizer.classifier.loaded)
+        self.assertEqual(categorizer.categorize_article(""), "Other/Uncategorized")
+        self.assertFalse(categorizer.classifier.loaded)
+
+    @unittest.skipIf(HAS_TRANSFORMERS, "torch and transformers are installed")
+    def test_missing_dependencies_are_reported(self):
+        """Without torch/transformers the first prediction explains what to install"""
+        categorizer = NewsCategorizor(backend="transformer", model_path="models/aml-indobert")
+        with self.assertRaises(ImportError):
+            categorizer.classifier.predict(["kasus korupsi"])
+
+    @unittest.skipUnless(HAS_TRANSFORMERS and TEST_MODEL, "needs torch, transformers and AML_TRANSFORMER_TEST_MODEL")
+    def test_long_articles_are_chunked(self):
+        """Articles longer than the model maximum are classified from several windows"""
+        categorizer = NewsCategorizor(
+            backend="transformer",
+            model_path=TEST_MODEL,
+            backend_options={"num_threads": 2, "max_length": 64, "stride": 8}
+        )
+        long_text = "Komisi Pemberantasan Korupsi menahan tersangka suap. " * 200
+        articles = [{"title": "KPK", "full_text": long_text}, {"title": "Judi", "full_text": "situs judi online"}]
+        results = categorizer.categorize_batch(articles)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0], categorizer.classifier.predict_one(f"KPK\n{long_text}"))
+
+
+class TestModelVersion(unittest.TestCase):
+    """Version keying the memoized results of the transformer backend"""
+
+    def setUp(self):
+        self.model_dir = tempfile.mkdtemp(prefix="test_output_model_")
+        for name, content in (("config.json", "{}"), ("model.safetensors", "weights"), ("README.md", "notes")):
+            self.write(name, content)
+
+    def tearDown(self):
+        shutil.rmtree(self.model_dir, ignore_errors=True)
+
+    def write(self, name, content, mtime=1754000000):
+        path = os.path.join(self.model_dir, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.utime(path, (mtime, mtime))
+
+    def test_version_follows_model_files(self):
+        """Retraining in place changes the version; unrelated files do not"""
+        version = TransformerTextClassifier(self.model_dir).version
+        self.assertEqual(TransformerTextClassifier(self.model_dir).version, version)
+        self.write("README.md", "more notes", mtime=1754000100)
+        self.assertEqual(TransformerTextClassifier(self.model_dir).version, version)
+        self.write("model.safetensors", "retrained", mtime=1754000100)
+        self.assertNotEqual(TransformerTextClassifier(self.model_dir).version, version)
+
+    def test_version_follows_options(self):
+        """Options that change predictions change the version"""
+        versions = {
+            TransformerTextClassifier(self.model_dir, **options).version
+            for options in ({}, {"max_length": 128}, {"stride": 32}, {"max_windows": 2},
+                            {"label_map": {"LABEL_0": "Fraud"}}, {"quantize": True})
+        }
+        self.assertEqual(len(versions), 6)
+        self.assertEqual(TransformerTextClassifier(self.model_dir, num_threads=2).version,
+                         TransformerTextClassifier(self.model_dir).version)
+
+    def test_quantize_ignored_for_onnx(self):
+        """int8 quantization only applies to PyTorch models"""
+        with self.assertLogs("modules.transformer_classifier", level="WARNING"):
+            classifier = TransformerTextClassifier(self.model_dir, quantize=True, onnx=True)
+        self.assertFalse(classifier.quantize)
+        self.assertNotIn("-int8", classifier.version)
+        self.assertEqual(classifier.version, TransformerTextClassifier(self.model_dir, onnx=True).version)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
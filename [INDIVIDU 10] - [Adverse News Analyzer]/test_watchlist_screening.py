@@ -0,0 +1,164 @@
+"""
+Test script for watchlist screening
+
+Validates name normalization of Indonesian spelling variants, the q-gram
+candidate lookup against a large watchlist, the screening of single-word
+names, and the screening alerts stored by DataManager at ingest.
+
+Author: AI Assistant
+Date: August 1, 2025
+Version: 1.0
+"""
+
+import unittest
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+# Add modules to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'modules'))
+
+from modules.data_manager import DataManager
+from modules.watchlist import Watchlist, capitalized_words, normalize_name
+
+
+def make_watchlist_names(size, seed=11):
+    """Synthetic but realistic-looking Indonesian names"""
+    rng = random.Random(seed)
+    first = ["Budi", "Agus", "Siti", "Dewi", "Andi", "Rudi", "Sri", "Ahmad", "Rina", "Eko", "Hendra", "Yusuf"]
+    last = ["Santoso", "Wijaya", "Saputra", "Pratama", "Hidayat", "Nugroho", "Kusuma", "Siregar", "Lubis", "Halim"]
+    syllables = ["ka", "ri", "mu", "to", "no", "sa", "wi", "ja", "ya", "ra", "di", "ni", "be", "go", "pe"]
+    names = set()
+    while len(names) < size:
+        middle = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).title()
+        names.add(f"{rng.choice(first)} {middle} {rng.choice(last)}")
+    return sorted(names)
+
+
+class TestWatchlist(unittest.TestCase):
+    """Normalization, candidate lookup and verification"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.watchlist = Watchlist(make_watchlist_names(20000) + [
+            "Suharto", "Muhammad Nazaruddin", "Djoko Tjandra", "Budi Santoso", "Gayus"
+        ])
+
+    def test_normalization_of_spelling_variants(self):
+        """Old spelling, doubled letters, diacritics and honorifics are normalized"""
+        self.assertEqual(normalize_name("Soeharto"), normalize_name("Suharto"))
+        self.assertEqual(normalize_name("Djoko Tjandra"), normalize_name("Joko Candra"))
+        self.assertEqual(normalize_name("Muhammad Nazaruddin"), normalize_name("Muhamad Nazarudin"))
+        self.assertEqual(normalize_name("H. Ahmad Sahroni, S.E."), normalize_name("Ahmad Sahroni"))
+        self.assertEqual(normalize_name("José"), "jose")
+
+    def test_spelling_variants_match(self):
+        """Reported spellings hit the listed name"""
+        for mention, listed in [("Soeharto", "Suharto"), ("Joko Tjandra", "Djoko Tjandra"),
+                                ("Muhamad Nazarudin", "Muhammad Nazaruddin"), ("Budi Santosa", "Budi Santoso")]:
+            names = [entry["name"] for entry, _ in self.watchlist.match(mention)]
+            self.assertIn(listed, names, mention)
+
+    def test_unrelated_names_do_not_match(self):
+        """Different people are not reported"""
+        self.assertEqual(self.watchlist.match("Ali Fikri"), [])
+        self.assertEqual(self.watchlist.match("Rudi Hartono"), [])
+
+    def test_candidate_lookup_is_selective(self):
+        """Only a tiny fraction of the watchlist is verified per mention"""
+        candidates = self.watchlist.candidates(normalize_name("Muhamad Nazarudin"))
+        self.assertLess(len(candidates), 10)
+
+    def test_screen_uses_sub_spans(self):
+        """A longer person mention hits the listed shorter name"""
+        hits = self.watchlist.screen(["Budi Santoso Wijaya", "KPK"])
+        self.assertIn("Budi Santoso", [hit["watchlist_name"] for hit in hits])
+
+    def test_single_word_names(self):
+        """Capitalized words hit single-word names only"""
+        words = capitalized_words("Polisi memeriksa Gayus terkait kasus pajak. Budi hadir di Jakarta.")
+        self.assertEqual(words, ["Polisi", "Gayus", "Budi", "Jakarta"])
+        hits = self.watchlist.screen([], words=words)
+        self.assertEqual([hit["watchlist_name"] for hit in hits], ["Gayus"])
+        self.assertEqual(self.watchlist.screen(["Budi"]), [])
+
+    def test_screening_throughput(self):
+        """Screening an article's mentions takes milliseconds with a 20k name watchlist"""
+        mentions = ["Soeharto", "Joko Tjandra", "Ali Fikri", "Rina Kusuma", "Bank Rakyat Indonesia", "KPK"]
+        words = capitalized_words(" ".join(make_watchlist_names(30, seed=3)) + " Jakarta Polisi Kejaksaan Agung")
+        start = time.perf_counter()
+        for _ in range(20):
+            self.watchlist.screen(mentions, words=words)
+        per_article = (time.perf_counter() - start) / 20
+        print(f"\n   {per_article * 1000:.1f} ms per article")
+        self.assertLess(per_article, 0.1)
+
+
+class TestScreeningAtIngest(unittest.TestCase):
+    """Alerts are stored by DataManager when articles are saved"""
+
+    def setUp(self):
+        self.test_output_dir = tempfile.mkdtemp(prefix="test_output_watchlist_")
+        with open(os.path.join(self.test_output_dir, "watchlist.csv"), "w", encoding="utf-8") as f:
+            f.write("name,list\nDjoko Tjandra,internal\nMuhammad Nazaruddin,internal\nGayus,internal\n")
+        self.data_manager = DataManager(self.test_output_dir)
+
+    def tearDown(self):
+        for store in (self.data_manager.screening_alerts, self.data_manager.entity_index,
+                      self.data_manager.keyword_index):
+            store.close()
+        shutil.rmtree(self.test_output_dir, ignore_errors=True)
+
+    def save(self, index, title, text):
+        self.data_manager.save_article({
+            "title": title,
+            "url": f"https://example.com/watchlist-{index}",
+            "source_name": "example.com",
+            "publication_date": "2025-08-01 10:00:00",
+            "full_text": text,
+        })
+
+    def test_alerts_stored_at_ingest(self):
+        """A hit is stored next to the article, a clean article has no alerts"""
+        self.save(0, "Buronan Kembali", "Kejagung memeriksa Joko Candra terkait suap kepada pejabat.")
+        self.save(1, "Cuaca Cerah", "Cuaca di Jakarta cerah sepanjang hari.")
+
+        alerts = self.data_manager.get_screening_alerts()
+        self.assertEqual(alerts['watchlist_name'].tolist(), ["Djoko Tjandra"])
+        self.assertEqual(alerts['matched_text'].tolist(), ["Joko Candra"])
+        self.assertEqual(alerts['title'].tolist(), ["Buronan Kembali"])
+
+        with mock.patch.object(self.data_manager.store, "load") as load:
+            self.assertEqual(self.data_manager.get_screening_alerts()['url'].tolist(),
+                             ["https://example.com/watchlist-0"])
+        load.assert_not_called()
+
+    def test_single_word_name_in_text(self):
+        """A single-word listed name is found in the article text"""
+        self.save(0, "Pemeriksaan Pajak", "Polisi memeriksa Gayus terkait kasus pajak.")
+        alerts = self.data_manager.get_screening_alerts()
+        self.assertEqual(alerts['watchlist_name'].tolist(), ["Gayus"])
+
+    def test_rescreen_after_watchlist_change(self):
+        """Re-screening picks up names added to the watchlist later"""
+        self.save(0, "Sidang Korupsi", "Hakim memvonis Angelina Sondakh dalam kasus suap.")
+        self.assertEqual(len(self.data_manager.get_screening_alerts()), 0)
+
+        with open(self.data_manager.watchlist_file, "a", encoding="utf-8") as f:
+            f.write("Angelina Sondakh,internal\n")
+        os.utime(self.data_manager.watchlist_file, (time.time() + 5, time.time() + 5))
+        self.assertEqual(self.data_manager.rescreen_articles(), 1)
+
+    def test_no_watchlist_no_alerts(self):
+        """Without a watchlist file, screening is skipped"""
+        os.remove(self.data_manager.watchlist_file)
+        self.save(0, "Buronan", "Kejagung memeriksa Joko Candra.")
+        self.assertEqual(len(self.data_manager.get_screening_alerts()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)